@@ -2,15 +2,17 @@ import logging
 import sys
 from datetime import timedelta
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, ORJSONResponse
 from starlette.middleware.sessions import SessionMiddleware
 
 from data_ingestion.constants import __version__
 from data_ingestion.db.primary import get_db_context
+from data_ingestion.db.trino import TrinoQueryTimeoutError, close_trino_executor
 from data_ingestion.internal.auth import azure_scheme, local_auth_bypass
 from data_ingestion.middlewares.staticfiles import StaticFilesMiddleware
+from data_ingestion.middlewares.storage_metrics import StorageMetricsMiddleware
 from data_ingestion.routers import (
     approval_requests,
     core,
@@ -26,6 +28,8 @@ from data_ingestion.routers import (
     utils,
 )
 from data_ingestion.settings import DeploymentEnvironment, initialize_sentry, settings
+from data_ingestion.storage import close_storage
+from data_ingestion.utils.nocodb import close_nocodb_client
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -70,6 +74,7 @@ app.add_middleware(
     max_age=int(timedelta(days=7).total_seconds()),
     same_site="lax",
 )
+app.add_middleware(StorageMetricsMiddleware)
 
 
 @app.on_event("startup")
@@ -86,6 +91,28 @@ async def load_config():
         await _ensure_local_dev_user()
 
 
+@app.on_event("shutdown")
+async def close_storage_client():
+    await close_storage()
+
+
+@app.on_event("shutdown")
+async def close_nocodb_http_client():
+    await close_nocodb_client()
+
+
+@app.on_event("shutdown")
+async def close_trino_thread_pool():
+    close_trino_executor()
+
+
+@app.exception_handler(TrinoQueryTimeoutError)
+async def trino_query_timeout(_: Request, exc: TrinoQueryTimeoutError):
+    return ORJSONResponse(
+        {"detail": str(exc)}, status_code=status.HTTP_504_GATEWAY_TIMEOUT
+    )
+
+
 async def _ensure_local_dev_user():
     """Create the local dev user with Admin role if it doesn't already have it."""
     from uuid import uuid4
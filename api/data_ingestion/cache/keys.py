@@ -5,3 +5,48 @@ SCHEMAS_KEY = f"{KEY_PREFIX}:schemas"
 
 def get_schema_key(name: str) -> str:
     return f"{SCHEMAS_KEY}:{name}"
+
+
+DQ_SUMMARY_KEY = f"{KEY_PREFIX}:dq-summary"
+
+
+def get_dq_summary_key(dq_report_path: str, etag: str) -> str:
+    etag = etag.strip('"')
+    return f"{DQ_SUMMARY_KEY}:{dq_report_path}:{etag}"
+
+
+FUZZY_MATCH_CONFIG_KEY = f"{KEY_PREFIX}:fuzzy-match-config"
+
+FUZZY_CORRECTIONS_KEY = f"{KEY_PREFIX}:fuzzy-corrections"
+
+
+def get_fuzzy_corrections_key(country: str, schema_column: str) -> str:
+    return f"{FUZZY_CORRECTIONS_KEY}:{country}:{schema_column}"
+
+
+SILVER_TABLE_VERSION_KEY = f"{KEY_PREFIX}:silver-table-version"
+
+
+def get_silver_table_version_key(table_name: str) -> str:
+    return f"{SILVER_TABLE_VERSION_KEY}:{table_name}"
+
+
+MASTER_SCHOOL_IDS_KEY = f"{KEY_PREFIX}:master-school-ids"
+
+
+def get_master_school_ids_key(table_name: str, version: int) -> str:
+    return f"{MASTER_SCHOOL_IDS_KEY}:{table_name}:{version}"
+
+
+SILVER_TABLE_ROW_COUNT_KEY = f"{KEY_PREFIX}:silver-table-row-count"
+
+
+def get_silver_table_row_count_key(table_name: str, version: int) -> str:
+    return f"{SILVER_TABLE_ROW_COUNT_KEY}:{table_name}:{version}"
+
+
+SILVER_TABLE_UNTRIMMED_IDS_KEY = f"{KEY_PREFIX}:silver-table-untrimmed-ids"
+
+
+def get_silver_table_untrimmed_ids_key(table_name: str, version: int) -> str:
+    return f"{SILVER_TABLE_UNTRIMMED_IDS_KEY}:{table_name}:{version}"
@@ -34,9 +34,13 @@ async def get_cache_list(key: str) -> list[str] | None:
         return string.decode().split(" ")
 
 
-async def set_cache_string(key: str, value: str | bytes) -> None:
+async def set_cache_string(
+    key: str, value: str | bytes, ttl_seconds: int | None = None
+) -> None:
     async with get_redis_context() as r:
-        await r.set(key, value, ex=settings.REDIS_CACHE_DEFAULT_TTL_SECONDS)
+        await r.set(
+            key, value, ex=ttl_seconds or settings.REDIS_CACHE_DEFAULT_TTL_SECONDS
+        )
 
 
 async def get_cache_string(key: str) -> str | None:
@@ -45,3 +49,13 @@ async def get_cache_string(key: str) -> str | None:
         if string is None:
             return None
         return string.decode()
+
+
+async def get_cache_bytes(key: str) -> bytes | None:
+    async with get_redis_context() as r:
+        return await r.get(key)
+
+
+async def delete_cache(*keys: str) -> None:
+    async with get_redis_context() as r:
+        await r.delete(*keys)
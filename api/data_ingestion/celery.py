@@ -25,10 +25,18 @@ celery.conf.update(
             "task": "data_ingestion.tasks.update_schemas",
             "schedule": timedelta(minutes=10),
         },
+        "update-fuzzy-match-config": {
+            "task": "data_ingestion.tasks.update_fuzzy_match_config",
+            "schedule": timedelta(minutes=10),
+        },
         "file-upload-dq-checks-timeout": {
             "task": "data_ingestion.tasks.file_upload_dq_checks_timeout",
             "schedule": timedelta(minutes=10),
         },
+        "delete-expired-upload-sessions": {
+            "task": "data_ingestion.tasks.delete_expired_upload_sessions",
+            "schedule": timedelta(hours=1),
+        },
     },
     result_expires=timedelta(minutes=10),
 )
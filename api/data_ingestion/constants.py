@@ -12,8 +12,17 @@ class Constants(BaseSettings):
     APPROVAL_REQUESTS_PATH_PREFIX: str = "raw/approval_requests"
     APPROVAL_REQUESTS_RESULT_UPLOAD_PATH: str = "staging"
     UPLOAD_FILE_SIZE_LIMIT_MB: int | float = 100
+    # Fuzzy validation only counts the values of a few columns, so it takes
+    # larger files than are parsed in full elsewhere.
+    FUZZY_VALIDATION_FILE_SIZE_LIMIT_MB: int | float = 500
+    UPLOAD_BLOCK_SIZE_MB: int | float = 4
+    UPLOAD_MAX_CONCURRENCY: int = 4
     UPLOAD_PATH_PREFIX: str = "raw/uploads"
     UPLOAD_METADATA_PATH_PREFIX: str = "raw/upload_metadata"
+    UPLOAD_SESSION_PATH_PREFIX: str = "upload_sessions"
+    UPLOAD_SESSION_TTL_HOURS: int | float = 24
+    # Under the session prefix, so expired records are cleaned up with sessions.
+    RESUMABLE_UPLOAD_PATH_PREFIX: str = "upload_sessions/resumable"
     HEALTH_UPLOAD_PATH_PREFIX: str = "updated_master_schema/health-master"
     HEALTH_UPLOAD_METADATA_PATH_PREFIX: str = "raw/upload_metadata/health-master"
     API_INGESTION_SCHEMA_UPLOAD_PATH: str = "schemas/qos/school-connectivity"
@@ -57,12 +66,50 @@ class Constants(BaseSettings):
     FILENAME_TIMESTAMP_FORMAT: str = "%Y%m%d-%H%M%S"
     DATA_PRIVACY_DOCUMENT_PATH: str = "staticfiles/2023-11_School_data_request_FNL.pdf"
     DELETE_PREVIEW_ID_CAP: int = 5000
+    DQ_SUMMARY_CACHE_MAX_ENTRIES: int = 64
+    # Refreshed every 10 minutes by Celery beat; Redis keeps the last good
+    # config well past that, workers re-read it from Redis every minute.
+    FUZZY_MATCH_CONFIG_CACHE_TTL_SECONDS: int = 6 * 60 * 60
+    FUZZY_MATCH_CONFIG_LOCAL_TTL_SECONDS: int = 60
+    # Entries are dropped whenever a correction is recorded for the column.
+    FUZZY_CORRECTIONS_CACHE_TTL_SECONDS: int = 24 * 60 * 60
+    # Threads used to score unmatched values; -1 uses every core.
+    FUZZY_MATCH_WORKERS: int = -1
+    # How long a silver table's Delta version is trusted before it is read
+    # again; master school IDs are cached per version.
+    SILVER_TABLE_VERSION_CACHE_TTL_SECONDS: int = 60
+    MASTER_SCHOOL_IDS_CACHE_TTL_SECONDS: int = 24 * 60 * 60
+    # Impact previews of larger silver tables are matched inside Trino,
+    # sending the uploaded IDs in batches of this many literals.
+    IMPACT_PREVIEW_SERVER_SIDE_MIN_ROWS: int = 500_000
+    IMPACT_PREVIEW_SCHOOL_ID_BATCH_SIZE: int = 5_000
+    # NocoDB caps the page size at 1000 rows by default (DB_QUERY_LIMIT_MAX).
+    NOCODB_PAGE_SIZE: int = 1000
+    NOCODB_MAX_CONCURRENCY: int = 4
+    NOCODB_TIMEOUT_SECONDS: int | float = 30
+    NOCODB_MAX_RETRIES: int = 3
+    NOCODB_RETRY_BACKOFF_SECONDS: int | float = 0.5
+    # Threads running Trino queries for the API; queries past the timeout are
+    # abandoned by the request and killed by Trino after the max run time.
+    TRINO_MAX_WORKERS: int = 8
+    TRINO_QUERY_TIMEOUT_SECONDS: int | float = 120
+    TRINO_QUERY_MAX_RUN_TIME_SECONDS: int = 300
 
     @computed_field
     @property
     def UPLOAD_FILE_SIZE_LIMIT(self) -> int | float:
         return megabytes_to_bytes(self.UPLOAD_FILE_SIZE_LIMIT_MB)
 
+    @computed_field
+    @property
+    def FUZZY_VALIDATION_FILE_SIZE_LIMIT(self) -> int | float:
+        return megabytes_to_bytes(self.FUZZY_VALIDATION_FILE_SIZE_LIMIT_MB)
+
+    @computed_field
+    @property
+    def UPLOAD_BLOCK_SIZE(self) -> int:
+        return int(megabytes_to_bytes(self.UPLOAD_BLOCK_SIZE_MB))
+
 
 @lru_cache
 def get_constants():
@@ -1,12 +1,24 @@
-from contextlib import AbstractContextManager, contextmanager
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import (
+    AbstractAsyncContextManager,
+    AbstractContextManager,
+    asynccontextmanager,
+    contextmanager,
+)
+from typing import Any, TypeVar
 
 from loguru import logger
-from sqlalchemy import create_engine
+from sqlalchemy import Executable, Result, create_engine
 from sqlalchemy.exc import DatabaseError
 from sqlalchemy.orm import Session, sessionmaker
 
+from data_ingestion.constants import constants
 from data_ingestion.settings import settings
 
+T = TypeVar("T")
+
 engine = create_engine(
     settings.TRINO_URL,
     echo=not settings.IN_PRODUCTION,
@@ -20,6 +32,130 @@ session_maker = sessionmaker(
     expire_on_commit=False,
 )
 
+# Used by AsyncTrinoSession only: queries abandoned by a timed out request are
+# killed by Trino itself. Celery tasks and other sync sessions keep the
+# cluster's own limit.
+async_engine = create_engine(
+    settings.TRINO_URL,
+    echo=not settings.IN_PRODUCTION,
+    future=True,
+    connect_args={
+        "session_properties": {
+            "query_max_run_time": f"{constants.TRINO_QUERY_MAX_RUN_TIME_SECONDS}s"
+        }
+    },
+)
+
+async_session_maker = sessionmaker(
+    bind=async_engine,
+    autoflush=True,
+    autocommit=False,
+    expire_on_commit=False,
+)
+
+_executor: ThreadPoolExecutor | None = None
+
+
+class TrinoQueryTimeoutError(TimeoutError):
+    pass
+
+
+def get_trino_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=constants.TRINO_MAX_WORKERS, thread_name_prefix="trino"
+        )
+    return _executor
+
+
+def close_trino_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def _execute(session: Session, statement: Executable, params: dict | None):
+    return session.execute(statement, params).freeze()
+
+
+class AsyncTrinoSession:
+    """
+    Runs the work of a Trino ``Session`` on a bounded thread pool, so queries
+    do not block the event loop, each awaited with a timeout.
+
+    Like ``AsyncSession``, ``execute`` returns a buffered result: its rows are
+    fetched on the pool too. Calls on a session run one at a time. A query
+    that times out keeps its session until it ends (Trino stops it after
+    ``TRINO_QUERY_MAX_RUN_TIME_SECONDS``); later calls get a new one.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] = async_session_maker):
+        self.session_factory = session_factory
+        self._session: Session | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def sync_session(self) -> Session:
+        if self._session is None:
+            self._session = self.session_factory()
+        return self._session
+
+    async def run_sync(
+        self,
+        fn: Callable[..., T],
+        *args: Any,
+        timeout: float | None = None,
+    ) -> T:
+        """Await ``fn(session, *args)`` on the Trino thread pool."""
+        if timeout is None:
+            timeout = constants.TRINO_QUERY_TIMEOUT_SECONDS
+
+        async with self._lock:
+            session = self.sync_session
+            job = get_trino_executor().submit(fn, session, *args)
+            try:
+                return await asyncio.wait_for(asyncio.wrap_future(job), timeout)
+            except TimeoutError as err:
+                self._abandon(job, session)
+                raise TrinoQueryTimeoutError(
+                    f"Trino query did not finish within {timeout} seconds"
+                ) from err
+            except asyncio.CancelledError:
+                self._abandon(job, session)
+                raise
+
+    def _abandon(self, job: Future, session: Session) -> None:
+        # Jobs still queued are dropped; a running one cannot be interrupted.
+        if not job.cancel():
+            self._session = None
+            job.add_done_callback(lambda _: session.close())
+
+    async def execute(
+        self,
+        statement: Executable,
+        params: dict | None = None,
+        *,
+        timeout: float | None = None,
+    ) -> Result:
+        frozen = await self.run_sync(_execute, statement, params, timeout=timeout)
+        return frozen()
+
+    async def scalar(
+        self,
+        statement: Executable,
+        params: dict | None = None,
+        *,
+        timeout: float | None = None,
+    ) -> Any:
+        return (await self.execute(statement, params, timeout=timeout)).scalar()
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
 
 def get_db():
     session = session_maker()
@@ -32,6 +168,17 @@ def get_db():
         session.close()
 
 
+async def get_async_db():
+    session = AsyncTrinoSession()
+    try:
+        yield session
+    except DatabaseError as err:
+        logger.error(str(err))
+        raise err
+    finally:
+        session.close()
+
+
 @contextmanager
 def get_db_context() -> AbstractContextManager[Session]:
     session = session_maker()
@@ -42,3 +189,15 @@ def get_db_context() -> AbstractContextManager[Session]:
         raise err
     finally:
         session.close()
+
+
+@asynccontextmanager
+async def get_async_db_context() -> AbstractAsyncContextManager[AsyncTrinoSession]:
+    session = AsyncTrinoSession()
+    try:
+        yield session
+    except DatabaseError as err:
+        logger.error(str(err))
+        raise err
+    finally:
+        session.close()
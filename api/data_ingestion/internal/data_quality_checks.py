@@ -1,28 +1,29 @@
 import json
 
+import orjson
 from fastapi import (
     HTTPException,
     status,
 )
 from loguru import logger
 
-from data_ingestion.internal.storage import storage_client
-
-
-def get_data_quality_summary(dq_report_path: str):
-    blob = storage_client.get_blob_client(dq_report_path)
+from data_ingestion.cache.keys import get_dq_summary_key
+from data_ingestion.cache.local import LocalCache
+from data_ingestion.cache.serde import get_cache_bytes, set_cache_string
+from data_ingestion.constants import constants
+from data_ingestion.storage import (
+    BlobNotFoundError,
+    get_storage,
+)
 
-    if not blob.exists():
-        logger.error("DQ report summary still does not exist")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Not Found",
-        )
+# Maps each summary path to the ETag and payload last served for it; every read
+# revalidates the ETag, so the LRU bound only caps memory.
+_dq_summary_cache: LocalCache[tuple[str | None, bytes]] = LocalCache(
+    constants.DQ_SUMMARY_CACHE_MAX_ENTRIES
+)
 
-    blob_data = blob.download_blob().readall()
-    dq_report_summary = blob_data.decode("utf-8")
-    dq_report_summary_dict: dict = json.loads(dq_report_summary)
 
+def sort_data_quality_summary(dq_report_summary_dict: dict) -> dict:
     for group in dq_report_summary_dict.keys():
         if group in ("summary", "valueMaps"):
             continue
@@ -39,3 +40,51 @@ def get_data_quality_summary(dq_report_path: str):
         )
 
     return dq_report_summary_dict
+
+
+async def get_data_quality_summary_json(
+    dq_report_path: str, not_found_detail: str = "Not Found"
+) -> bytes:
+    """
+    Return the sorted DQ summary at ``dq_report_path`` as serialized JSON.
+
+    The blob's ETag is read with a properties request, which has no body. It
+    is enough when this worker has that version cached, and keys the Redis
+    lookup otherwise: the blob is only downloaded, parsed and sorted on a miss
+    in both caches.
+    """
+    storage = get_storage()
+    cached = _dq_summary_cache.get(dq_report_path)
+
+    try:
+        properties = await storage.properties(dq_report_path)
+        if cached is not None and cached[0] == properties.etag:
+            return cached[1]
+
+        etag = properties.etag
+        key = get_dq_summary_key(dq_report_path, etag)
+        if (payload := await get_cache_bytes(key)) is None:
+            stream = await storage.open(dq_report_path)
+            dq_report_summary_dict: dict = json.loads(await stream.readall())
+            payload = orjson.dumps(sort_data_quality_summary(dq_report_summary_dict))
+            # Key the payload by the version actually read, in case the blob
+            # was rewritten after the properties request.
+            etag = stream.properties.etag
+            await set_cache_string(get_dq_summary_key(dq_report_path, etag), payload)
+    except BlobNotFoundError as err:
+        logger.error("DQ report summary still does not exist")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=not_found_detail,
+        ) from err
+
+    _dq_summary_cache.set(dq_report_path, (etag, payload))
+    return payload
+
+
+async def get_data_quality_summary(
+    dq_report_path: str, not_found_detail: str = "Not Found"
+) -> dict:
+    return orjson.loads(
+        await get_data_quality_summary_json(dq_report_path, not_found_detail)
+    )
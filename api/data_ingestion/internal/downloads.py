@@ -0,0 +1,287 @@
+import re
+from email.utils import format_datetime
+
+from fastapi import HTTPException, Request, status
+from fastapi.responses import RedirectResponse, Response, StreamingResponse
+from loguru import logger
+
+from azure.core.exceptions import HttpResponseError
+from data_ingestion.settings import ArtifactDownloadMode, settings
+from data_ingestion.storage import (
+    BlobDownload,
+    BlobNotFoundError,
+    BlobNotModifiedError,
+    BlobPreconditionFailedError,
+    BlobProperties,
+    InvalidRangeError,
+    get_storage,
+)
+
+_RANGE_PATTERN = re.compile(r"^bytes=(\d+)-(\d*)$")
+
+
+def parse_range_header(value: str | None) -> tuple[int, int | None] | None:
+    """
+    Parse a single ``bytes=start-end`` / ``bytes=start-`` range.
+
+    Returns ``(start, end)`` with an inclusive, possibly open ``end``, or
+    ``None`` if the header is absent or is not a range we pass through to
+    ADLS (suffix and multipart ranges). RFC 9110 allows a server to ignore
+    such ranges and answer with the full representation.
+    """
+    if not value:
+        return None
+
+    match = _RANGE_PATTERN.match(value.strip())
+    if match is None:
+        return None
+
+    start = int(match.group(1))
+    end = int(match.group(2)) if match.group(2) else None
+    if end is not None and end < start:
+        return None
+
+    return start, end
+
+
+def parse_etag_header(value: str | None) -> str | None:
+    """
+    Return the single entity tag in an ``If-None-Match``/``If-Range`` header.
+
+    Lists and ``*`` are not forwarded; the full representation is served.
+    """
+    if not value:
+        return None
+
+    value = value.strip().removeprefix("W/")
+    if value == "*" or "," in value:
+        return None
+
+    return value
+
+
+def _entity_headers(properties: BlobProperties, length: int) -> dict[str, str]:
+    headers = {"Accept-Ranges": "bytes", "Content-Length": str(length)}
+    if properties.etag:
+        headers["ETag"] = properties.etag
+    if properties.last_modified:
+        headers["Last-Modified"] = format_datetime(
+            properties.last_modified, usegmt=True
+        )
+    return headers
+
+
+def _not_found(path: str, detail: str) -> HTTPException:
+    logger.error(f"File not found at path: {path}")
+    return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
+
+
+async def open_blob(
+    path: str, *, not_found_detail: str = "File not found"
+) -> BlobDownload:
+    """
+    Start reading a blob in a single storage round trip.
+
+    There is no separate existence or properties check: a missing blob is
+    reported by the read itself and raised as a 404, and the content type,
+    ETag and size come from ``BlobDownload.properties``.
+    """
+    try:
+        return await get_storage().open(path)
+    except BlobNotFoundError as err:
+        raise _not_found(path, not_found_detail) from err
+    except HttpResponseError as err:
+        raise HTTPException(
+            detail=err.message, status_code=err.response.status_code
+        ) from err
+
+
+async def read_blob(path: str, *, not_found_detail: str = "File not found") -> bytes:
+    """Read a whole blob in a single storage round trip; see :func:`open_blob`."""
+    return await (await open_blob(path, not_found_detail=not_found_detail)).readall()
+
+
+async def _blob_head_response(
+    path: str,
+    if_none_match: str | None,
+    media_type: str | None,
+    headers: dict[str, str],
+    not_found_detail: str,
+) -> Response:
+    # Starlette iterates a streamed body even for HEAD, so the blob is not
+    # opened at all: its properties carry every header.
+    try:
+        properties = await get_storage().properties(path)
+    except BlobNotFoundError as err:
+        raise _not_found(path, not_found_detail) from err
+    except HttpResponseError as err:
+        raise HTTPException(
+            detail=err.message, status_code=err.response.status_code
+        ) from err
+
+    if if_none_match is not None and if_none_match == properties.etag:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": if_none_match},
+        )
+
+    headers.update(_entity_headers(properties, properties.size))
+    return Response(
+        media_type=media_type or properties.content_type or "application/octet-stream",
+        headers=headers,
+    )
+
+
+async def stream_blob(
+    request: Request,
+    path: str,
+    *,
+    media_type: str | None = None,
+    headers: dict[str, str] | None = None,
+    not_found_detail: str = "File not found",
+) -> Response:
+    """
+    Stream a blob to the client, honouring ``Range`` and ``If-None-Match``.
+
+    The conditional and range headers are forwarded to storage on the read
+    itself, so a cache hit costs one bodiless round trip and a ranged request
+    only transfers the requested bytes. ``HEAD`` only reads the blob's
+    properties.
+
+    :param request: The incoming request.
+    :param path: Blob path inside the configured container.
+    :param media_type: Response content type. Defaults to the blob's content
+        type, then ``application/octet-stream``.
+    :param headers: Extra response headers, e.g. ``Content-Disposition``.
+    :param not_found_detail: Detail of the 404 raised if the blob is missing.
+    """
+    storage = get_storage()
+    headers = dict(headers or {})
+
+    byte_range = parse_range_header(request.headers.get("range"))
+    if_none_match = parse_etag_header(request.headers.get("if-none-match"))
+    if_range = parse_etag_header(request.headers.get("if-range"))
+
+    if request.method == "HEAD":
+        return await _blob_head_response(
+            path, if_none_match, media_type, headers, not_found_detail
+        )
+
+    kwargs = {}
+    if byte_range is not None:
+        start, end = byte_range
+        kwargs["offset"] = start
+        kwargs["length"] = None if end is None else end - start + 1
+        if if_range is not None:
+            kwargs["if_match"] = if_range
+
+    try:
+        try:
+            stream = await storage.open(path, if_none_match=if_none_match, **kwargs)
+        except BlobPreconditionFailedError:
+            # If-Range no longer matches: send the whole, current blob.
+            byte_range = None
+            stream = await storage.open(path)
+    except BlobNotFoundError as err:
+        raise _not_found(path, not_found_detail) from err
+    except BlobNotModifiedError:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": if_none_match},
+        )
+    except InvalidRangeError as err:
+        size = (await storage.properties(path)).size
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        ) from err
+    except HttpResponseError as err:
+        raise HTTPException(
+            detail=err.message, status_code=err.response.status_code
+        ) from err
+
+    properties = stream.properties
+    headers.update(_entity_headers(properties, stream.length))
+
+    status_code = status.HTTP_200_OK
+    if byte_range is not None:
+        end = stream.offset + stream.length - 1
+        headers["Content-Range"] = f"bytes {stream.offset}-{end}/{properties.size}"
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+
+    return StreamingResponse(
+        stream.chunks(),
+        status_code=status_code,
+        media_type=media_type or properties.content_type or "application/octet-stream",
+        headers=headers,
+    )
+
+
+async def redirect_to_blob(
+    path: str,
+    *,
+    media_type: str | None = None,
+    headers: dict[str, str] | None = None,
+    not_found_detail: str = "File not found",
+) -> RedirectResponse | None:
+    """
+    Redirect the client to a short-lived read-only SAS URL for the blob.
+
+    Only the blob properties are fetched, so a missing blob still yields the
+    usual 404. Returns ``None`` if the storage backend cannot hand out URLs.
+    """
+    storage = get_storage()
+    try:
+        properties = await storage.properties(path)
+    except BlobNotFoundError as err:
+        raise _not_found(path, not_found_detail) from err
+    except HttpResponseError as err:
+        raise HTTPException(
+            detail=err.message, status_code=err.response.status_code
+        ) from err
+
+    url = await storage.get_read_url(
+        path,
+        content_type=media_type or properties.content_type,
+        content_disposition=(headers or {}).get("Content-Disposition"),
+    )
+    if url is None:
+        logger.warning("Storage backend cannot sign read URLs, proxying download")
+        return None
+
+    return RedirectResponse(url, status_code=status.HTTP_307_TEMPORARY_REDIRECT)
+
+
+async def blob_download_response(
+    request: Request,
+    path: str,
+    *,
+    media_type: str | None = None,
+    headers: dict[str, str] | None = None,
+    not_found_detail: str = "File not found",
+) -> Response:
+    """
+    Serve a blob download according to ``ARTIFACT_DOWNLOAD_MODE``.
+
+    In ``redirect`` mode the client is sent to ADLS with a 307 and the API
+    stays off the data path; in ``proxy`` mode the blob is streamed through
+    the API with :func:`stream_blob`. Callers check permissions first.
+    """
+    if settings.ARTIFACT_DOWNLOAD_MODE == ArtifactDownloadMode.REDIRECT:
+        response = await redirect_to_blob(
+            path,
+            media_type=media_type,
+            headers=headers,
+            not_found_detail=not_found_detail,
+        )
+        if response is not None:
+            return response
+
+    return await stream_blob(
+        request,
+        path,
+        media_type=media_type,
+        headers=headers,
+        not_found_detail=not_found_detail,
+    )
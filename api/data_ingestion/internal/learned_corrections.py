@@ -0,0 +1,146 @@
+"""
+Fuzzy-match corrections confirmed by users, remembered across uploads.
+
+Every upload sent with ``fuzzy_corrections`` records the replacements the
+user confirmed, per country and schema column. Later validations of the same
+column suggest them straight away instead of scoring the value again. The
+corrections of a column are read through a Redis cache that is dropped
+whenever one of them is recorded.
+"""
+
+import asyncio
+from collections.abc import Collection
+
+import orjson
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from data_ingestion.cache.keys import get_fuzzy_corrections_key
+from data_ingestion.cache.serde import delete_cache, get_cache_bytes, set_cache_string
+from data_ingestion.constants import constants
+from data_ingestion.models import FuzzyCorrection
+
+# Placeholder the UI shows for empty cells; they are always "Unknown".
+NULL_VALUE_FOUND = "null/nan/empty"
+
+LearnedCorrections = dict[str, dict[str, str]]
+
+
+def get_value_key(value) -> str:
+    return str(value).strip().lower()
+
+
+def collect_confirmed_corrections(
+    corrections: list[dict], column_to_schema_mapping: dict[str, str]
+) -> dict[tuple[str, str], str]:
+    """
+    Return ``{(schema column, value key): replacement}`` for the corrections
+    sent with an upload that change a value of a mapped column.
+    """
+    confirmed = {}
+    for correction in corrections:
+        schema_column = column_to_schema_mapping.get(correction.get("column_name"))
+        value_found = correction.get("value_found")
+        replace_with = correction.get("replace_with")
+        if not (schema_column and replace_with) or value_found is None:
+            continue
+
+        value_key = get_value_key(value_found)
+        replace_with = str(replace_with)
+        if value_key in ("", NULL_VALUE_FOUND) or value_key == replace_with.lower():
+            continue
+        confirmed[(schema_column, value_key)] = replace_with
+    return confirmed
+
+
+async def record_fuzzy_corrections(
+    db: AsyncSession, *, country: str, corrections: dict[tuple[str, str], str]
+) -> None:
+    """Count a confirmation of each correction, adding those not seen before."""
+    if not corrections:
+        return
+
+    statement = insert(FuzzyCorrection).values(
+        [
+            {
+                "country": country,
+                "schema_column": schema_column,
+                "value_key": value_key,
+                "replace_with": replace_with,
+            }
+            for (schema_column, value_key), replace_with in corrections.items()
+        ]
+    )
+    statement = statement.on_conflict_do_update(
+        constraint="uq_fuzzy_corrections_country_column_value_replacement",
+        set_={
+            "confirmed_count": FuzzyCorrection.confirmed_count + 1,
+            "last_confirmed": func.now(),
+        },
+    )
+    await db.execute(statement)
+    await db.commit()
+
+    await delete_cache(
+        *{
+            get_fuzzy_corrections_key(country, schema_column)
+            for schema_column, _ in corrections
+        }
+    )
+
+
+async def get_learned_corrections(
+    db: AsyncSession, *, country: str, schema_columns: Collection[str]
+) -> LearnedCorrections:
+    """
+    Return ``{schema column: {value key: replacement}}`` for ``country``.
+
+    Where users confirmed several replacements for a value, the one confirmed
+    most often wins, then the one confirmed last.
+    """
+    keys = {
+        schema_column: get_fuzzy_corrections_key(country, schema_column)
+        for schema_column in schema_columns
+    }
+    payloads = await asyncio.gather(*(get_cache_bytes(key) for key in keys.values()))
+
+    learned: LearnedCorrections = {}
+    for schema_column, payload in zip(keys, payloads, strict=True):
+        if payload is not None:
+            learned[schema_column] = orjson.loads(payload)
+
+    missing = [schema_column for schema_column in keys if schema_column not in learned]
+    if not missing:
+        return learned
+
+    rows = await db.execute(
+        select(
+            FuzzyCorrection.schema_column,
+            FuzzyCorrection.value_key,
+            FuzzyCorrection.replace_with,
+        )
+        .where(
+            FuzzyCorrection.country == country,
+            FuzzyCorrection.schema_column.in_(missing),
+        )
+        .order_by(
+            FuzzyCorrection.confirmed_count.desc(),
+            FuzzyCorrection.last_confirmed.desc(),
+        )
+    )
+    fetched: LearnedCorrections = {schema_column: {} for schema_column in missing}
+    for schema_column, value_key, replace_with in rows:
+        fetched[schema_column].setdefault(value_key, replace_with)
+
+    await asyncio.gather(
+        *(
+            set_cache_string(
+                keys[schema_column],
+                orjson.dumps(corrections),
+                constants.FUZZY_CORRECTIONS_CACHE_TTL_SECONDS,
+            )
+            for schema_column, corrections in fetched.items()
+        )
+    )
+    return learned | fetched
@@ -0,0 +1,227 @@
+"""
+School IDs of a country's silver table, cached in Redis per Delta version.
+
+Impact previews compare every uploaded school ID against the master dataset.
+Reading the whole ID column through Trino on each preview is slow for large
+countries, so the normalized IDs are cached as a compressed sorted array
+under the table's current Delta version: a commit to the silver table moves
+it to a new key and the old one simply expires. The version itself is read
+from the table's ``$history`` and cached for a short while, so warm previews
+are served from Redis alone.
+
+Pulling the ID column out of Trino is wasteful for the largest tables, so
+above ``IMPACT_PREVIEW_SERVER_SIDE_MIN_ROWS`` rows (unless the IDs are cached
+already) the uploaded IDs are sent to Trino instead, in batches, and only the
+ones found in the table come back: transfer is then proportional to the
+upload, not to the master dataset. They are matched against the raw column,
+so Trino can skip Delta files by their ID statistics; only a table version
+found to hold IDs with surrounding whitespace is matched on trimmed IDs.
+"""
+
+import zlib
+from collections.abc import Awaitable, Callable, Collection
+
+import orjson
+import pandas as pd
+from loguru import logger
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from data_ingestion.cache.keys import (
+    get_master_school_ids_key,
+    get_silver_table_row_count_key,
+    get_silver_table_untrimmed_ids_key,
+    get_silver_table_version_key,
+)
+from data_ingestion.cache.serde import (
+    get_cache_bytes,
+    get_cache_string,
+    set_cache_string,
+)
+from data_ingestion.constants import constants
+from data_ingestion.db.trino import AsyncTrinoSession
+from data_ingestion.utils.upload_impact import normalize_school_ids
+
+
+def get_history_table(table_name: str) -> str:
+    """``catalog.schema.table`` -> the Delta Lake ``$history`` metadata table."""
+    catalog, schema, table = table_name.split(".")
+    return f'{catalog}.{schema}."{table}$history"'
+
+
+def is_table_not_found(err: Exception) -> bool:
+    return "TABLE_NOT_FOUND" in str(err)
+
+
+def encode_school_ids(school_ids: set[str]) -> bytes:
+    return zlib.compress(orjson.dumps(sorted(school_ids)))
+
+
+def decode_school_ids(payload: bytes) -> set[str]:
+    return set(orjson.loads(zlib.decompress(payload)))
+
+
+async def _read_cache(get: Callable[[str], Awaitable], key: str):
+    # The cache only saves Trino work: when Redis fails, Trino answers.
+    try:
+        return await get(key)
+    except Exception as err:
+        logger.warning(f"Failed to read {key} from Redis: {err}")
+        return None
+
+
+async def _write_cache(key: str, value: str | bytes, ttl_seconds: int) -> None:
+    try:
+        await set_cache_string(key, value, ttl_seconds)
+    except Exception as err:
+        logger.warning(f"Failed to write {key} to Redis: {err}")
+
+
+def _query_table_version(db: Session, table_name: str) -> int | None:
+    try:
+        version = db.execute(
+            text(
+                f"SELECT max(version) FROM {get_history_table(table_name)}"  # nosec B608
+            )
+        ).scalar()
+    except Exception as err:
+        if is_table_not_found(err):
+            return None
+        raise
+    return None if version is None else int(version)
+
+
+def _query_school_ids(db: Session, table_name: str) -> set[str]:
+    try:
+        rows = db.execute(
+            text(
+                f"SELECT school_id_govt FROM {table_name} "  # nosec B608
+                "WHERE school_id_govt IS NOT NULL"
+            )
+        ).scalars()
+    except Exception as err:
+        if is_table_not_found(err):
+            return set()
+        raise
+    return set(normalize_school_ids(pd.Series(list(rows), dtype=object)).to_pylist())
+
+
+def _query_row_count(db: Session, table_name: str) -> int:
+    # Delta tables carry row counts in their transaction log; fall back to
+    # counting when the statistics were not collected.
+    stats = db.execute(text(f"SHOW STATS FOR {table_name}")).mappings()  # nosec B608
+    for row in stats:
+        if row["column_name"] is None and row["row_count"] is not None:
+            return int(row["row_count"])
+    return db.execute(text(f"SELECT count(*) FROM {table_name}")).scalar()  # nosec B608
+
+
+def _query_has_untrimmed_school_ids(db: Session, table_name: str) -> bool:
+    row = db.execute(
+        text(
+            f"SELECT 1 FROM {table_name} "  # nosec B608
+            "WHERE school_id_govt <> trim(school_id_govt) LIMIT 1"
+        )
+    ).scalar()
+    return row is not None
+
+
+def _query_matching_school_ids(
+    db: Session, table_name: str, school_ids: list[str], trim: bool
+) -> set[str]:
+    # A bare column keeps the predicate pushed down to the Delta files;
+    # trimming it is only needed when the table holds untrimmed IDs.
+    column = "trim(school_id_govt)" if trim else "school_id_govt"
+    statement = text(
+        f"SELECT DISTINCT {column} FROM {table_name} "  # nosec B608
+        f"WHERE {column} IN :ids"
+    ).bindparams(bindparam("ids", expanding=True))
+    return set(db.execute(statement, {"ids": school_ids}).scalars())
+
+
+async def get_silver_table_version(
+    db: AsyncTrinoSession, table_name: str
+) -> int | None:
+    """Current Delta version of ``table_name``, or ``None`` if it does not exist."""
+    key = get_silver_table_version_key(table_name)
+    if (cached := await _read_cache(get_cache_string, key)) is not None:
+        return int(cached)
+
+    version = await db.run_sync(_query_table_version, table_name)
+    if version is not None:
+        await _write_cache(
+            key, str(version), constants.SILVER_TABLE_VERSION_CACHE_TTL_SECONDS
+        )
+    return version
+
+
+async def get_silver_table_row_count(
+    db: AsyncTrinoSession, table_name: str, version: int
+) -> int:
+    key = get_silver_table_row_count_key(table_name, version)
+    if (cached := await _read_cache(get_cache_string, key)) is not None:
+        return int(cached)
+
+    row_count = await db.run_sync(_query_row_count, table_name)
+    await _write_cache(
+        key, str(row_count), constants.MASTER_SCHOOL_IDS_CACHE_TTL_SECONDS
+    )
+    return row_count
+
+
+async def has_untrimmed_school_ids(
+    db: AsyncTrinoSession, table_name: str, version: int
+) -> bool:
+    """Whether any ID in ``table_name`` has surrounding whitespace."""
+    key = get_silver_table_untrimmed_ids_key(table_name, version)
+    if (cached := await _read_cache(get_cache_string, key)) is not None:
+        return cached == "1"
+
+    untrimmed = await db.run_sync(_query_has_untrimmed_school_ids, table_name)
+    await _write_cache(
+        key, "1" if untrimmed else "0", constants.MASTER_SCHOOL_IDS_CACHE_TTL_SECONDS
+    )
+    return untrimmed
+
+
+async def get_matching_master_school_ids(
+    db: AsyncTrinoSession, table_name: str, school_ids: Collection[str]
+) -> set[str]:
+    """
+    Return the normalized ``school_ids`` that are in ``table_name``.
+
+    Matched against the cached IDs of the table's current version, fetching
+    them on a miss, unless the table is too large to pull its IDs into the
+    API: then the matching is done in Trino.
+    """
+    version = await get_silver_table_version(db, table_name)
+    if version is None or not school_ids:
+        return set()
+
+    key = get_master_school_ids_key(table_name, version)
+    if (payload := await _read_cache(get_cache_bytes, key)) is not None:
+        return decode_school_ids(payload).intersection(school_ids)
+
+    row_count = await get_silver_table_row_count(db, table_name, version)
+    if row_count >= constants.IMPACT_PREVIEW_SERVER_SIDE_MIN_ROWS:
+        trim = await has_untrimmed_school_ids(db, table_name, version)
+        # Each batch is its own query, awaited with its own timeout.
+        school_ids = sorted(set(school_ids))
+        batch_size = constants.IMPACT_PREVIEW_SCHOOL_ID_BATCH_SIZE
+        matching = set()
+        for start in range(0, len(school_ids), batch_size):
+            matching |= await db.run_sync(
+                _query_matching_school_ids,
+                table_name,
+                school_ids[start : start + batch_size],
+                trim,
+            )
+        return matching
+
+    master_school_ids = await db.run_sync(_query_school_ids, table_name)
+    await _write_cache(
+        key,
+        encode_school_ids(master_school_ids),
+        constants.MASTER_SCHOOL_IDS_CACHE_TTL_SECONDS,
+    )
+    return master_school_ids.intersection(school_ids)
@@ -0,0 +1,120 @@
+import secrets
+from datetime import UTC, datetime, timedelta
+
+from fastapi import HTTPException, status
+
+from data_ingestion.constants import constants
+from data_ingestion.models import FileUpload
+from data_ingestion.schemas.upload import ResumableUpload
+from data_ingestion.storage import BlobNotFoundError, get_storage
+
+
+def get_resumable_upload_path(token: str) -> str:
+    return f"{constants.RESUMABLE_UPLOAD_PATH_PREFIX}/{token}.json"
+
+
+def get_block_id(offset: int, chunk_size: int) -> str:
+    # ADLS needs every block ID of a blob to be the same length.
+    return f"{offset // chunk_size:08d}"
+
+
+def get_block_ids(upload: ResumableUpload) -> list[str]:
+    return [
+        get_block_id(offset, upload.chunk_size)
+        for offset in range(0, upload.size, upload.chunk_size)
+    ]
+
+
+def get_chunk_length(upload: ResumableUpload, offset: int) -> int:
+    return min(upload.chunk_size, upload.size - offset)
+
+
+async def save_resumable_upload(upload: ResumableUpload) -> None:
+    await get_storage().put(
+        get_resumable_upload_path(upload.token),
+        upload.model_dump_json().encode(),
+        content_type="application/json",
+    )
+
+
+async def create_resumable_upload(
+    file_upload: FileUpload, *, country: str, size: int
+) -> ResumableUpload:
+    """
+    Start a chunked upload of a new, prepared ``FileUpload``.
+
+    The row is not inserted yet; its ID and creation time are fixed already so
+    that chunks can be staged as blocks of its final blob, which stays
+    invisible until the upload is finalized.
+    """
+    upload = ResumableUpload(
+        token=secrets.token_urlsafe(32),
+        upload_id=file_upload.id,
+        created=file_upload.created,
+        expires_at=file_upload.created
+        + timedelta(hours=constants.UPLOAD_SESSION_TTL_HOURS),
+        uploader_id=str(file_upload.uploader_id),
+        uploader_email=file_upload.uploader_email,
+        country=country,
+        country_code=file_upload.country,
+        dataset=file_upload.dataset,
+        source=file_upload.source,
+        original_filename=file_upload.original_filename,
+        upload_path=file_upload.upload_path,
+        size=size,
+        chunk_size=constants.UPLOAD_BLOCK_SIZE,
+    )
+    await save_resumable_upload(upload)
+    return upload
+
+
+async def get_resumable_upload(token: str, uploader_email: str) -> ResumableUpload:
+    """Return the caller's live upload, or raise a 404 for any other token."""
+    not_found = HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Resumable upload not found or expired.",
+    )
+    if not token or "/" in token:
+        raise not_found
+
+    try:
+        record = await get_storage().get(get_resumable_upload_path(token))
+    except BlobNotFoundError as err:
+        raise not_found from err
+
+    upload = ResumableUpload.model_validate_json(record)
+    if (
+        upload.uploader_email.lower() != uploader_email.lower()
+        or upload.expires_at <= datetime.now(UTC)
+    ):
+        raise not_found
+    return upload
+
+
+async def get_resumable_offset(upload: ResumableUpload) -> int:
+    """
+    Return how many bytes from the start of the file have been received.
+
+    Chunks may arrive in any order; the offset stops at the first chunk that
+    is missing or was not staged in full.
+    """
+    staged = await get_storage().staged_blocks(upload.upload_path)
+    offset = 0
+    while offset < upload.size:
+        length = get_chunk_length(upload, offset)
+        if staged.get(get_block_id(offset, upload.chunk_size)) != length:
+            break
+        offset += length
+    return offset
+
+
+async def stage_resumable_chunk(
+    upload: ResumableUpload, offset: int, data: bytes
+) -> None:
+    await get_storage().stage_block(
+        upload.upload_path, get_block_id(offset, upload.chunk_size), data
+    )
+
+
+async def delete_resumable_upload(token: str) -> None:
+    await get_storage().delete(get_resumable_upload_path(token))
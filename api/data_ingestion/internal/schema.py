@@ -7,12 +7,13 @@ from sqlalchemy.orm import Session
 
 from data_ingestion.cache.keys import SCHEMAS_KEY, get_schema_key
 from data_ingestion.cache.serde import get_cache_list, set_cache_list, set_cache_string
+from data_ingestion.db.trino import AsyncTrinoSession
 from data_ingestion.schemas.schema_column import SchemaColumn
 from data_ingestion.utils.schema import sort_schema_columns_key
 
 
 async def get_schemas(
-    db: Session,
+    db: AsyncTrinoSession,
     background_tasks: BackgroundTasks = None,
     *,
     bypass_cache: bool = False,
@@ -22,7 +23,7 @@ async def get_schemas(
     ):
         return schemas
 
-    res = db.execute(
+    res = await db.execute(
         select("*")
         .select_from(text("information_schema.tables"))
         .where(column("table_schema") == literal("schemas"))
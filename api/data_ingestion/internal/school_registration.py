@@ -1,17 +1,17 @@
+import asyncio
 import csv
 import io
-import json
 import logging
 from datetime import UTC, datetime
 
 import requests
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from data_ingestion.internal.storage import storage_client
+from data_ingestion.internal.uploads import prepare_file_upload, write_upload_blobs
 from data_ingestion.models import FileUpload
 from data_ingestion.settings import settings
 from data_ingestion.utils.data_quality import get_metadata_path
-from data_ingestion.utils.nocodb import update_nocodb_record_by_field
+from data_ingestion.utils.nocodb import patch_nocodb_record_by_field
 
 logger = logging.getLogger(__name__)
 
@@ -69,26 +69,22 @@ async def create_school_registration_file_upload(
         column_license={},
     )
 
-    db.add(file_upload)
+    # ID, timestamp and paths are set up front, so a single insert suffices.
+    db.add(prepare_file_upload(file_upload))
     await db.commit()
-    await db.refresh(file_upload)
-
-    file_upload.metadata_json_path = get_metadata_path(file_upload.upload_path)
-    db.add(file_upload)
-    await db.commit()
-    await db.refresh(file_upload)
 
     return file_upload
 
 
-def write_registration_csv_to_adls(
+async def write_registration_csv_to_adls(
     payload: dict,
     file_upload,
     registration_metadata: dict,
     mode: str = "create",
 ) -> None:
     """
-    Formats the school registration payload as a single-row CSV and uploads it to ADLS.
+    Formats the school registration payload as a single-row CSV and uploads it to ADLS,
+    together with its metadata sidecar. If either write fails, neither blob is kept.
     """
     row = {
         "school_id_giga": payload.get("giga_id_school", ""),
@@ -110,12 +106,6 @@ def write_registration_csv_to_adls(
     writer.writerow(row)
     csv_bytes = output.getvalue().encode("utf-8")
 
-    blob_client = storage_client.get_blob_client(file_upload.upload_path)
-    blob_client.upload_blob(
-        csv_bytes,
-        overwrite=True,
-    )
-
     metadata_payload = {
         "country": file_upload.country,
         "uploader_email": file_upload.uploader_email,
@@ -124,14 +114,9 @@ def write_registration_csv_to_adls(
         "mode": mode,
         **registration_metadata,
     }
-    metadata_path = file_upload.metadata_json_path or get_metadata_path(
-        file_upload.upload_path
-    )
-    metadata_blob_client = storage_client.get_blob_client(metadata_path)
-    metadata_blob_client.upload_blob(
-        json.dumps(metadata_payload, indent=2).encode(),
-        overwrite=True,
-    )
+    if file_upload.metadata_json_path is None:
+        file_upload.metadata_json_path = get_metadata_path(file_upload.upload_path)
+    await write_upload_blobs(file_upload, csv_bytes, metadata_payload)
 
 
 def call_meter_soft_delete(school_id_giga: str) -> None:
@@ -161,11 +146,13 @@ def call_meter_soft_delete(school_id_giga: str) -> None:
     return response.json()
 
 
-def handle_rejected_gigameter_registrations(rejected_change_ids: list[str]) -> None:
+async def handle_rejected_gigameter_registrations(
+    rejected_change_ids: list[str],
+) -> None:
     """Mark rejected GigaMeter registrations in NocoDB and soft-delete them in GigaMeter."""
     for change_id in rejected_change_ids:
         school_id_giga = change_id.split("|")[0]
-        update_nocodb_record_by_field(
+        await patch_nocodb_record_by_field(
             table_name="SchoolRegistrations",
             field_name="giga_id_school",
             field_value=school_id_giga,
@@ -176,7 +163,9 @@ def handle_rejected_gigameter_registrations(rejected_change_ids: list[str]) -> N
             },
         )
         try:
-            call_meter_soft_delete(school_id_giga=school_id_giga)
+            await asyncio.to_thread(
+                call_meter_soft_delete, school_id_giga=school_id_giga
+            )
         except Exception:
             logger.exception(
                 "Error calling GigaMeter soft-delete for %s", school_id_giga
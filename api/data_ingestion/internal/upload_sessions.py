@@ -0,0 +1,249 @@
+import asyncio
+import io
+import os
+import secrets
+import tempfile
+from collections.abc import Collection
+from datetime import UTC, datetime, timedelta
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from fastapi import HTTPException, UploadFile, status
+from loguru import logger
+from starlette.datastructures import Headers
+
+from data_ingestion.constants import constants
+from data_ingestion.internal.uploads import hash_upload
+from data_ingestion.schemas.upload import ResumableUpload, UploadSession
+from data_ingestion.storage import BlobNotFoundError, StorageBackend, get_storage
+from data_ingestion.utils.spreadsheet import count_arrow_values, parse_spreadsheet
+
+SESSION_RECORD = "session.json"
+PARSED_FILE = "parsed.parquet"
+RAW_FILE = "raw"
+
+
+def get_upload_session_path(token: str, name: str = "") -> str:
+    return f"{constants.UPLOAD_SESSION_PATH_PREFIX}/{token}/{name}"
+
+
+def _to_parquet(df: pd.DataFrame) -> bytes:
+    buffer = io.BytesIO()
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), buffer)
+    return buffer.getvalue()
+
+
+def _read_parquet(content: bytes, columns: list[str]) -> pd.DataFrame:
+    table = pq.read_table(io.BytesIO(content), columns=columns)
+    return table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
+
+
+async def create_upload_session(
+    file: UploadFile,
+    *,
+    content_type: str,
+    uploader_email: str,
+    country: str,
+    dataset: str,
+) -> UploadSession:
+    """
+    Stage an uploaded spreadsheet once for the rest of the upload flow.
+
+    The file is stored as is next to a Parquet copy of its parse (every
+    column as text), so fuzzy validation and impact preview read only the
+    columns they need and the final upload reuses the staged bytes instead of
+    the client sending the file again. The session record is written last: a
+    session exists only once all of its blobs do.
+    """
+    file_extension = os.path.splitext(file.filename)[1].lower()
+    await file.seek(0)
+    try:
+        df = await asyncio.to_thread(parse_spreadsheet, file.file, file_extension)
+        parsed = await asyncio.to_thread(_to_parquet, df)
+        content_hash = await hash_upload(file.file)
+    except Exception as err:
+        logger.error(f"Failed to parse file for upload session: {err}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid {file_extension} format.",
+        ) from err
+
+    created = datetime.now(UTC)
+    session = UploadSession(
+        token=secrets.token_urlsafe(32),
+        uploader_email=uploader_email,
+        country=country,
+        dataset=dataset,
+        original_filename=file.filename,
+        content_type=content_type,
+        size=file.size,
+        columns=list(df.columns),
+        rows=len(df.index),
+        content_hash=content_hash,
+        created=created,
+        expires_at=created + timedelta(hours=constants.UPLOAD_SESSION_TTL_HOURS),
+    )
+
+    storage = get_storage()
+    await file.seek(0)
+    try:
+        results = await asyncio.gather(
+            storage.put(
+                get_upload_session_path(session.token, RAW_FILE),
+                file,
+                content_type=content_type,
+            ),
+            storage.put(get_upload_session_path(session.token, PARSED_FILE), parsed),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        await storage.put(
+            get_upload_session_path(session.token, SESSION_RECORD),
+            session.model_dump_json().encode(),
+            content_type="application/json",
+        )
+    except BaseException:
+        await delete_upload_session(session.token)
+        raise
+
+    return session
+
+
+async def get_upload_session(token: str, uploader_email: str) -> UploadSession:
+    """Return the caller's live session, or raise a 404 for any other token."""
+    not_found = HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Upload session not found or expired.",
+    )
+    if not token or "/" in token:
+        raise not_found
+
+    try:
+        record = await get_storage().get(get_upload_session_path(token, SESSION_RECORD))
+    except BlobNotFoundError as err:
+        raise not_found from err
+
+    session = UploadSession.model_validate_json(record)
+    if (
+        session.uploader_email.lower() != uploader_email.lower()
+        or session.expires_at <= datetime.now(UTC)
+    ):
+        raise not_found
+    return session
+
+
+def check_upload_session_target(
+    session: UploadSession, country: str, dataset: str
+) -> None:
+    """Refuse a session staged for another country or dataset than the form's."""
+    if session.country != country or session.dataset != dataset:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=(
+                f"Upload session was started for {session.dataset} data of "
+                f"{session.country}, not {dataset} data of {country}."
+            ),
+        )
+
+
+async def read_upload_session_columns(
+    session: UploadSession, columns: Collection[str]
+) -> pd.DataFrame:
+    """Read the given columns (those present in the file) from the cached parse."""
+    selected = [name for name in session.columns if name in columns]
+    parsed = await get_storage().get(
+        get_upload_session_path(session.token, PARSED_FILE)
+    )
+    return await asyncio.to_thread(_read_parquet, parsed, selected)
+
+
+def _count_parquet_values(content: bytes, columns: list[str]) -> dict[str, pd.Series]:
+    parquet = pq.ParquetFile(io.BytesIO(content))
+    return count_arrow_values(parquet.iter_batches(columns=columns), columns)
+
+
+async def count_upload_session_values(
+    session: UploadSession, columns: Collection[str]
+) -> dict[str, pd.Series]:
+    """Count the values of the given columns of the cached parse, batch by batch."""
+    selected = [name for name in session.columns if name in columns]
+    if not selected:
+        return {}
+    parsed = await get_storage().get(
+        get_upload_session_path(session.token, PARSED_FILE)
+    )
+    return await asyncio.to_thread(_count_parquet_values, parsed, selected)
+
+
+async def open_upload_session_file(session: UploadSession) -> UploadFile:
+    """
+    Return the staged file as an ``UploadFile``, as if it had been sent again.
+
+    The blob is spooled to a temporary file, in memory up to one upload block.
+    """
+    download = await get_storage().open(
+        get_upload_session_path(session.token, RAW_FILE)
+    )
+    spooled = tempfile.SpooledTemporaryFile(max_size=constants.UPLOAD_BLOCK_SIZE)
+    async for chunk in download.chunks():
+        await asyncio.to_thread(spooled.write, chunk)
+    spooled.seek(0)
+
+    return UploadFile(
+        spooled,
+        size=session.size,
+        filename=session.original_filename,
+        headers=Headers({"content-type": session.content_type}),
+    )
+
+
+async def delete_upload_session(token: str) -> None:
+    """Delete every blob of a session; failures are logged, not raised."""
+    storage = get_storage()
+    paths = [
+        get_upload_session_path(token, name)
+        for name in (SESSION_RECORD, PARSED_FILE, RAW_FILE)
+    ]
+    results = await asyncio.gather(
+        *(storage.delete(path) for path in paths), return_exceptions=True
+    )
+    for path, result in zip(paths, results, strict=True):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to delete upload session blob {path}: {result}")
+
+
+async def _delete_unfinished_upload_blocks(
+    storage: StorageBackend, record_path: str
+) -> None:
+    # An expired resumable upload can no longer be finalized; its staged
+    # blocks go with it, unless its blob was committed after all.
+    try:
+        upload = ResumableUpload.model_validate_json(await storage.get(record_path))
+    except BlobNotFoundError:
+        return
+    if not await storage.exists(upload.upload_path):
+        await storage.delete(upload.upload_path)
+
+
+async def delete_expired_upload_sessions(storage: StorageBackend) -> int:
+    """
+    Delete staged blobs older than the session lifetime.
+
+    Blobs are judged by their own modification time, so blobs of sessions
+    that were never completed are removed too, as are the blocks staged for
+    expired resumable uploads. Returns the number of blobs deleted.
+    """
+    cutoff = datetime.now(UTC) - timedelta(hours=constants.UPLOAD_SESSION_TTL_HOURS)
+    expired = [
+        blob.name
+        async for blob in storage.list(f"{constants.UPLOAD_SESSION_PATH_PREFIX}/")
+        if blob.last_modified is not None and blob.last_modified < cutoff
+    ]
+    for path in expired:
+        if path.startswith(f"{constants.RESUMABLE_UPLOAD_PATH_PREFIX}/"):
+            await _delete_unfinished_upload_blocks(storage, path)
+        await storage.delete(path)
+    return len(expired)
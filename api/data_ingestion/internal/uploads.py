@@ -0,0 +1,182 @@
+import asyncio
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import BinaryIO
+
+from loguru import logger
+from sqlalchemy import delete, exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from data_ingestion.constants import constants
+from data_ingestion.models import DQRun, FileUpload
+from data_ingestion.models.base import BaseModel, cuid_generator
+from data_ingestion.models.file_upload import DQStatusEnum
+from data_ingestion.storage import get_storage
+from data_ingestion.storage.base import UploadData
+from data_ingestion.utils.data_quality import get_metadata_path
+
+
+@dataclass
+class StagedBlocks:
+    """Blocks already staged at the upload path, to be committed in this order."""
+
+    block_ids: list[str]
+
+
+def _hash_stream(stream: BinaryIO) -> str:
+    digest = hashlib.sha256()
+    stream.seek(0)
+    while chunk := stream.read(constants.UPLOAD_BLOCK_SIZE):
+        digest.update(chunk)
+    stream.seek(0)
+    return digest.hexdigest()
+
+
+async def hash_upload(stream: BinaryIO) -> str:
+    """Return the SHA-256 hex digest of a spooled upload, read off the event loop."""
+    return await asyncio.to_thread(_hash_stream, stream)
+
+
+async def find_duplicate_upload(
+    db: AsyncSession,
+    *,
+    country: str,
+    dataset: str,
+    content_hash: str,
+    column_to_schema_mapping: dict,
+    dq_mode: str,
+) -> FileUpload | None:
+    """
+    Return the latest upload of the same file for the same country and
+    dataset, mapped the same way and checked in the same DQ mode, whose DQ
+    run has not failed. Its results stand for a re-upload of the file.
+    """
+    candidates = await db.scalars(
+        select(FileUpload)
+        .where(
+            FileUpload.country == country,
+            FileUpload.dataset == dataset,
+            FileUpload.content_hash == content_hash,
+            FileUpload.dq_status.not_in([DQStatusEnum.ERROR, DQStatusEnum.TIMEOUT]),
+            exists().where(DQRun.upload_id == FileUpload.id, DQRun.dq_mode == dq_mode),
+        )
+        .order_by(FileUpload.created.desc())
+    )
+    return next(
+        (
+            candidate
+            for candidate in candidates
+            if candidate.column_to_schema_mapping == column_to_schema_mapping
+        ),
+        None,
+    )
+
+
+def prepare_file_upload(file_upload: FileUpload) -> FileUpload:
+    """
+    Assign the ID, creation time and sidecar path of a new upload up front.
+
+    Both storage paths derive from the ID and creation time, so with these set
+    the row can be inserted in a single statement and the blobs written
+    without reading anything back from the database.
+    """
+    if file_upload.id is None:
+        file_upload.id = cuid_generator()
+    if file_upload.created is None:
+        file_upload.created = datetime.now(UTC)
+    file_upload.metadata_json_path = get_metadata_path(file_upload.upload_path)
+    return file_upload
+
+
+async def write_upload_blobs(
+    file_upload: FileUpload,
+    data: UploadData | StagedBlocks,
+    sidecar: dict,
+    *,
+    content_type: str | None = None,
+    metadata: dict[str, str] | None = None,
+) -> None:
+    """
+    Write the raw upload (or commit its staged blocks) and its
+    ``.metadata.json`` sidecar concurrently.
+
+    If either write fails, both blobs are deleted before the error is raised,
+    so a failed upload never leaves one without the other.
+    """
+    storage = get_storage()
+    paths = (file_upload.upload_path, file_upload.metadata_json_path)
+
+    try:
+        if isinstance(data, StagedBlocks):
+            write_raw = storage.commit_blocks(
+                file_upload.upload_path,
+                data.block_ids,
+                content_type=content_type,
+                metadata=metadata,
+            )
+        else:
+            write_raw = storage.put(
+                file_upload.upload_path,
+                data,
+                content_type=content_type,
+                metadata=metadata,
+            )
+
+        results = await asyncio.gather(
+            write_raw,
+            storage.put(
+                file_upload.metadata_json_path,
+                json.dumps(sidecar, indent=2).encode(),
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+    except BaseException:
+        cleanup = await asyncio.gather(
+            *(storage.delete(path) for path in paths), return_exceptions=True
+        )
+        for path, result in zip(paths, cleanup, strict=True):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to clean up {path} after upload error: {result}")
+        raise
+
+
+async def create_file_upload(
+    db: AsyncSession,
+    file_upload: FileUpload,
+    *related: BaseModel,
+    data: UploadData | StagedBlocks,
+    sidecar: dict,
+    content_type: str | None = None,
+    metadata: dict[str, str] | None = None,
+) -> FileUpload:
+    """
+    Insert a new upload (and any rows that reference it) in one transaction,
+    then write its blobs with :func:`write_upload_blobs`.
+
+    The row is committed before the blobs are written, so whatever picks the
+    blobs up can already find it. If the blob writes fail, the row (and the
+    related rows, by cascade) is deleted again.
+    """
+    prepare_file_upload(file_upload)
+    db.add_all([file_upload, *related])
+    await db.commit()
+
+    try:
+        await write_upload_blobs(
+            file_upload,
+            data,
+            sidecar,
+            content_type=content_type,
+            metadata=metadata,
+        )
+    except BaseException:
+        await db.execute(delete(FileUpload).where(FileUpload.id == file_upload.id))
+        await db.commit()
+        raise
+
+    return file_upload
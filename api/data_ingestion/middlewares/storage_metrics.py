@@ -0,0 +1,40 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from data_ingestion.storage.metrics import observe_storage_calls, track_storage_calls
+
+STORAGE_CALLS_HEADER = "X-Storage-Calls"
+
+
+class StorageMetricsMiddleware:
+    """
+    Count the storage round trips made while handling each request.
+
+    The count made up to the start of the response is sent in the
+    ``X-Storage-Calls`` header; the final count, including reads made while
+    streaming the body, is aggregated per route for ``/api/metrics/storage``.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_storage_calls() as counter:
+
+            async def send_with_count(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers[STORAGE_CALLS_HEADER] = str(counter.calls)
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_count)
+            finally:
+                if (endpoint := scope.get("endpoint")) is not None:
+                    observe_storage_calls(
+                        f"{scope['method']} {endpoint.__name__}", counter.calls
+                    )
@@ -0,0 +1,33 @@
+"""add file upload content hash
+
+Revision ID: d8e9f0a1b2c3
+Revises: f2a3b4c5d6e7
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d8e9f0a1b2c3"
+down_revision: str | None = "f2a3b4c5d6e7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "file_uploads", sa.Column("content_hash", sa.VARCHAR(64), nullable=True)
+    )
+    op.create_index(
+        "ix_file_uploads_country_dataset_content_hash",
+        "file_uploads",
+        ["country", "dataset", "content_hash"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_file_uploads_country_dataset_content_hash", "file_uploads")
+    op.drop_column("file_uploads", "content_hash")
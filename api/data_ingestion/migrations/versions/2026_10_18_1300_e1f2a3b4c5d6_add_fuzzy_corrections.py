@@ -0,0 +1,57 @@
+"""add fuzzy corrections
+
+Revision ID: e1f2a3b4c5d6
+Revises: d8e9f0a1b2c3
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e1f2a3b4c5d6"
+down_revision: str | None = "d8e9f0a1b2c3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "fuzzy_corrections",
+        sa.Column("country", sa.VARCHAR(length=3), nullable=False),
+        sa.Column("schema_column", sa.String(), nullable=False),
+        sa.Column("value_key", sa.String(), nullable=False),
+        sa.Column("replace_with", sa.String(), nullable=False),
+        sa.Column("confirmed_count", sa.Integer(), nullable=False),
+        sa.Column(
+            "created",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "last_confirmed",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("id", sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "country",
+            "schema_column",
+            "value_key",
+            "replace_with",
+            name="uq_fuzzy_corrections_country_column_value_replacement",
+        ),
+    )
+    op.create_index(
+        op.f("ix_fuzzy_corrections_id"), "fuzzy_corrections", ["id"], unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_fuzzy_corrections_id"), table_name="fuzzy_corrections")
+    op.drop_table("fuzzy_corrections")
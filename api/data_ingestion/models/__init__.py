@@ -3,6 +3,7 @@ from .base import BaseModel
 from .deletion_requests import DeletionRequest
 from .dq_run import DQRun
 from .file_upload import FileUpload
+from .fuzzy_corrections import FuzzyCorrection
 from .ingest_api_qos import ApiConfiguration, SchoolConnectivity, SchoolList
 from .users import Role, User, UserRoleAssociation
 
@@ -18,4 +19,5 @@ __all__ = [
     "Role",
     "UserRoleAssociation",
     "DQRun",
+    "FuzzyCorrection",
 ]
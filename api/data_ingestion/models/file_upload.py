@@ -4,7 +4,7 @@ from pathlib import Path
 
 # File upload model for data ingestion
 from pydantic import UUID4, EmailStr
-from sqlalchemy import JSON, VARCHAR, DateTime, String, func
+from sqlalchemy import JSON, VARCHAR, DateTime, Index, String, func
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -23,6 +23,14 @@ class DQStatusEnum(Enum):
 
 class FileUpload(BaseModel):
     __tablename__ = "file_uploads"
+    __table_args__ = (
+        Index(
+            "ix_file_uploads_country_dataset_content_hash",
+            "country",
+            "dataset",
+            "content_hash",
+        ),
+    )
 
     created: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -54,6 +62,9 @@ class FileUpload(BaseModel):
     column_license: Mapped[dict] = mapped_column(
         JSON, nullable=False, server_default='"{}"'
     )
+    # SHA-256 of the raw file as uploaded; unset when fuzzy corrections
+    # changed it, so only untouched files are matched as re-uploads.
+    content_hash: Mapped[str] = mapped_column(VARCHAR(64), nullable=True, default=None)
 
     @hybrid_property
     def filename(self) -> str:
@@ -0,0 +1,34 @@
+from datetime import datetime
+
+from sqlalchemy import VARCHAR, DateTime, Integer, String, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseModel
+
+
+class FuzzyCorrection(BaseModel):
+    """A replacement users confirmed for a value of a fuzzy-matched column."""
+
+    __tablename__ = "fuzzy_corrections"
+    __table_args__ = (
+        UniqueConstraint(
+            "country",
+            "schema_column",
+            "value_key",
+            "replace_with",
+            name="uq_fuzzy_corrections_country_column_value_replacement",
+        ),
+    )
+
+    country: Mapped[str] = mapped_column(VARCHAR(3), nullable=False)
+    schema_column: Mapped[str] = mapped_column(String(), nullable=False)
+    # The value as found, stripped and lowercased, as values are compared.
+    value_key: Mapped[str] = mapped_column(String(), nullable=False)
+    replace_with: Mapped[str] = mapped_column(String(), nullable=False)
+    confirmed_count: Mapped[int] = mapped_column(Integer(), nullable=False, default=1)
+    created: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    last_confirmed: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
@@ -7,15 +7,17 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Security, status
 from fastapi_azure_auth.user import User
 from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session
 
 from data_ingestion.db.primary import get_db as get_primary_db
-from data_ingestion.db.trino import get_db
+from data_ingestion.db.trino import (
+    AsyncTrinoSession,
+    TrinoQueryTimeoutError,
+    get_async_db as get_db,
+)
 from data_ingestion.internal.auth import azure_scheme
 from data_ingestion.internal.school_registration import (
     handle_rejected_gigameter_registrations,
 )
-from data_ingestion.internal.storage import storage_client
 from data_ingestion.models import (
     ApprovalRequest,
     User as DatabaseUser,
@@ -31,6 +33,7 @@ from data_ingestion.schemas.approval_requests import (
     UploadListing,
 )
 from data_ingestion.schemas.core import PagedResponseSchema
+from data_ingestion.storage import get_storage
 
 router = APIRouter(
     prefix="/api/approval-requests",
@@ -155,7 +158,7 @@ async def _stage_approval_request(
     return None
 
 
-def _write_approval_result(
+async def _write_approval_result(
     *,
     country_code: str,
     dataset_name: str,
@@ -183,9 +186,7 @@ def _write_approval_result(
         },
         indent=2,
     ).encode()
-    storage_client.get_blob_client(approval_path).upload_blob(
-        approval_payload, overwrite=True
-    )
+    await get_storage().put(approval_path, approval_payload)
     return approval_path
 
 
@@ -215,7 +216,7 @@ async def reject_pending_upload_row(
 
     rejected_change_ids = [f"{school_id_giga}|{file_upload.id}|{_CHANGE_INSERT}"]
     _update_status_after_review(file_upload, None, [], rejected_change_ids)
-    approval_path = _write_approval_result(
+    approval_path = await _write_approval_result(
         country_code=country_code,
         dataset_name=dataset_name,
         upload_id=file_upload.id,
@@ -233,11 +234,11 @@ async def reject_pending_upload_row(
 
 
 @router.get("", response_model=PagedResponseSchema[CountryPendingListing])
-async def list_countries_with_pending_changes(
+async def list_countries_with_pending_changes(  # noqa: C901
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=10, ge=1, le=50),
     primary_db: AsyncSession = Depends(get_primary_db),
-    db: Session = Depends(get_db),
+    db: AsyncTrinoSession = Depends(get_db),
 ):
     """
     List countries that have uploads with PENDING rows in their staging tables.
@@ -260,18 +261,22 @@ async def list_countries_with_pending_changes(
         staging = _staging_table(ar.dataset, ar.country)
         try:
             result = (
-                db.execute(
-                    text(
-                        f"SELECT change_type, COUNT(*) AS cnt"  # nosec B608
-                        f" FROM {staging}"
-                        f" WHERE status = '{_STATUS_PENDING}'"
-                        f" AND change_type != '{_CHANGE_UNCHANGED}'"
-                        " GROUP BY change_type"
+                (
+                    await db.execute(
+                        text(
+                            f"SELECT change_type, COUNT(*) AS cnt"  # nosec B608
+                            f" FROM {staging}"
+                            f" WHERE status = '{_STATUS_PENDING}'"
+                            f" AND change_type != '{_CHANGE_UNCHANGED}'"
+                            " GROUP BY change_type"
+                        )
                     )
                 )
                 .mappings()
                 .all()
             )
+        except TrinoQueryTimeoutError:
+            raise
         except Exception:
             continue
 
@@ -279,13 +284,13 @@ async def list_countries_with_pending_changes(
             continue
 
         upload_cnt = (
-            db.execute(
+            await db.scalar(
                 text(
                     f"SELECT COUNT(DISTINCT upload_id) FROM {staging}"  # nosec B608
                     f" WHERE status = '{_STATUS_PENDING}'"
                     f" AND change_type != '{_CHANGE_UNCHANGED}'"
                 )
-            ).scalar()
+            )
             or 0
         )
 
@@ -340,7 +345,7 @@ async def list_uploads_for_country(
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=10, ge=1, le=50),
     primary_db: AsyncSession = Depends(get_primary_db),
-    db: Session = Depends(get_db),
+    db: AsyncTrinoSession = Depends(get_db),
 ):
     """
     List all pending uploads for a given country across all enabled datasets.
@@ -364,17 +369,21 @@ async def list_uploads_for_country(
         staging = _staging_table(approval_request.dataset, country_code)
         try:
             rows = (
-                db.execute(
-                    text(
-                        f"SELECT upload_id, change_type, COUNT(*) AS cnt"  # nosec B608
-                        f" FROM {staging}"
-                        f" WHERE status = '{_STATUS_PENDING}'"
-                        " GROUP BY upload_id, change_type"
+                (
+                    await db.execute(
+                        text(
+                            f"SELECT upload_id, change_type, COUNT(*) AS cnt"  # nosec B608
+                            f" FROM {staging}"
+                            f" WHERE status = '{_STATUS_PENDING}'"
+                            " GROUP BY upload_id, change_type"
+                        )
                     )
                 )
                 .mappings()
                 .all()
             )
+        except TrinoQueryTimeoutError:
+            raise
         except Exception:
             continue
 
@@ -465,7 +474,7 @@ async def get_upload_rows(
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=10, ge=1, le=100),
     primary_db: AsyncSession = Depends(get_primary_db),
-    db: Session = Depends(get_db),
+    db: AsyncTrinoSession = Depends(get_db),
 ):
     """
     Paginated rows for a specific upload ready for review.
@@ -491,24 +500,26 @@ async def get_upload_rows(
     staging = _staging_table(dataset, country_code)
     silver = _silver_table(dataset, country_code)
 
-    total_count = db.execute(
+    total_count = await db.scalar(
         text(
             f"SELECT COUNT(*) FROM {staging}"  # nosec B608
             f" WHERE upload_id = '{upload_id}'"
             f" AND status = '{_STATUS_PENDING}'"
             f" AND change_type != '{_CHANGE_UNCHANGED}'"
         )
-    ).scalar()
+    )
 
     pending_rows = (
-        db.execute(
-            text(
-                f"SELECT * FROM {staging}"  # nosec B608
-                f" WHERE upload_id = '{upload_id}'"
-                f" AND status = '{_STATUS_PENDING}'"
-                f" AND change_type != '{_CHANGE_UNCHANGED}'"
-                " ORDER BY change_type, school_id_giga"
-                f" OFFSET {(page - 1) * page_size} ROWS FETCH NEXT {page_size} ROWS ONLY"
+        (
+            await db.execute(
+                text(
+                    f"SELECT * FROM {staging}"  # nosec B608
+                    f" WHERE upload_id = '{upload_id}'"
+                    f" AND status = '{_STATUS_PENDING}'"
+                    f" AND change_type != '{_CHANGE_UNCHANGED}'"
+                    " ORDER BY change_type, school_id_giga"
+                    f" OFFSET {(page - 1) * page_size} ROWS FETCH NEXT {page_size} ROWS ONLY"
+                )
             )
         )
         .mappings()
@@ -542,15 +553,19 @@ async def get_upload_rows(
     if update_ids:
         try:
             silver_rows = (
-                db.execute(
-                    text(
-                        f"SELECT * FROM {silver} WHERE school_id_giga IN {_in_clause(update_ids)}"  # nosec B608
+                (
+                    await db.execute(
+                        text(
+                            f"SELECT * FROM {silver} WHERE school_id_giga IN {_in_clause(update_ids)}"  # nosec B608
+                        )
                     )
                 )
                 .mappings()
                 .all()
             )
             silver_lookup = {r["school_id_giga"]: dict(r) for r in silver_rows}
+        except TrinoQueryTimeoutError:
+            raise
         except Exception:
             pass
 
@@ -567,11 +582,11 @@ async def get_upload_rows(
     }
 
 
-def _resolve_change_ids(
+async def _resolve_change_ids(
     rows_input: list[str],
     staging: str,
     upload_id: str,
-    db: Session,
+    db: AsyncTrinoSession,
 ) -> list[str]:
     _all = ["__all__"]
     if rows_input == _all:
@@ -579,11 +594,13 @@ def _resolve_change_ids(
     if not rows_input:
         return []
     rows = (
-        db.execute(
-            text(
-                f"SELECT school_id_giga, change_type FROM {staging} "  # nosec B608
-                f"WHERE upload_id = '{upload_id}' "
-                f"AND school_id_giga IN {_in_clause(rows_input)}"
+        (
+            await db.execute(
+                text(
+                    f"SELECT school_id_giga, change_type FROM {staging} "  # nosec B608
+                    f"WHERE upload_id = '{upload_id}' "
+                    f"AND school_id_giga IN {_in_clause(rows_input)}"
+                )
             )
         )
         .mappings()
@@ -604,7 +621,7 @@ async def submit_upload_review(
     body: SubmitApprovalRequest,
     user: User = Depends(azure_scheme),
     primary_db: AsyncSession = Depends(get_primary_db),
-    db: Session = Depends(get_db),
+    db: AsyncTrinoSession = Depends(get_db),
 ):
     """
     Mark individual rows within an upload as APPROVED or REJECTED.
@@ -657,15 +674,15 @@ async def submit_upload_review(
 
     # Build change_ids for approved and rejected rows.
     # change_id format: school_id_giga|upload_id|change_type (matches Dagster staging step)
-    approved_change_ids = _resolve_change_ids(
+    approved_change_ids = await _resolve_change_ids(
         body.approved_rows, staging, upload_id, db
     )
-    rejected_change_ids = _resolve_change_ids(
+    rejected_change_ids = await _resolve_change_ids(
         body.rejected_rows, staging, upload_id, db
     )
 
     if rejected_change_ids and file_upload and file_upload.source == "gigameter":
-        handle_rejected_gigameter_registrations(rejected_change_ids)
+        await handle_rejected_gigameter_registrations(rejected_change_ids)
 
     _update_status_after_review(
         file_upload, deletion_request, approved_change_ids, rejected_change_ids
@@ -674,7 +691,7 @@ async def submit_upload_review(
         approval_request, approved_change_ids, database_user, primary_db, email
     )
 
-    _write_approval_result(
+    await _write_approval_result(
         country_code=country_code,
         dataset_name=dataset_name,
         upload_id=upload_id,
@@ -1,13 +1,17 @@
-from fastapi import APIRouter, Depends, Response, status
+from fastapi import APIRouter, Depends, Response, Security, status
 from loguru import logger
 from redis.asyncio import Redis
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session
 
 from data_ingestion.cache import get_redis_connection
 from data_ingestion.db.primary import get_db as get_db_primary
-from data_ingestion.db.trino import get_db as get_db_trino
+from data_ingestion.db.trino import (
+    AsyncTrinoSession,
+    get_async_db as get_db_trino,
+)
+from data_ingestion.permissions.permissions import IsPrivileged
+from data_ingestion.storage.metrics import get_storage_call_stats
 
 router = APIRouter(tags=["core"], include_in_schema=False)
 
@@ -21,7 +25,7 @@ async def api_health_check():
 async def liveness_check(
     response: Response,
     primary: AsyncSession = Depends(get_db_primary),
-    trino: Session = Depends(get_db_trino),
+    trino: AsyncTrinoSession = Depends(get_db_trino),
     redis: Redis = Depends(get_redis_connection),
 ):
     async def test_primary():
@@ -31,17 +35,17 @@ async def liveness_check(
             logger.error(e)
             return False
 
-    def test_trino():
+    async def test_trino():
         try:
-            return bool(trino.execute(text("SELECT 1")).first())
+            return bool((await trino.execute(text("SELECT 1"))).first())
         except Exception as e:
             logger.error(e)
             return False
 
     body = {
         "api": "ok",
-        "db": "ok" if test_primary() else "unhealthy",
-        "trino": "ok" if test_trino() else "unhealthy",
+        "db": "ok" if await test_primary() else "unhealthy",
+        "trino": "ok" if await test_trino() else "unhealthy",
         "redis": "ok" if await redis.ping() else "unhealthy",
     }
 
@@ -51,3 +55,9 @@ async def liveness_check(
         else status.HTTP_503_SERVICE_UNAVAILABLE
     )
     return body
+
+
+@router.get("/api/metrics/storage", dependencies=[Security(IsPrivileged())])
+async def storage_metrics():
+    """Storage round trips per request, by route, since this worker started."""
+    return get_storage_call_stats()
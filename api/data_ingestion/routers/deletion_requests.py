@@ -17,15 +17,16 @@ from fastapi import (
 from fastapi_azure_auth.user import User
 from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session
 
 from azure.core.exceptions import HttpResponseError
-from azure.storage.blob import ContentSettings
 from data_ingestion.constants import constants
 from data_ingestion.db.primary import get_db
-from data_ingestion.db.trino import get_db as get_trino_db
+from data_ingestion.db.trino import (
+    AsyncTrinoSession,
+    TrinoQueryTimeoutError,
+    get_async_db as get_trino_db,
+)
 from data_ingestion.internal.auth import azure_scheme
-from data_ingestion.internal.storage import storage_client
 from data_ingestion.models import (
     DeletionRequest,
     User as DatabaseUser,
@@ -39,6 +40,7 @@ from data_ingestion.schemas.deletion_requests import (
     PreviewDeleteRowsRequest,
     PreviewDeleteRowsResponse,
 )
+from data_ingestion.storage import get_storage
 
 router = APIRouter(
     prefix="/api/delete",
@@ -56,14 +58,14 @@ def _in_clause(ids: list[str]) -> str:
 @router.post("/preview", response_model=PreviewDeleteRowsResponse)
 async def preview_delete_rows(
     body: PreviewDeleteRowsRequest,
-    trino_db: Session = Depends(get_trino_db),
+    trino_db: AsyncTrinoSession = Depends(get_trino_db),
 ):
     country_iso3 = coco.convert(body.country, to="ISO3")
     silver = f"delta_lake.school_geolocation_silver.{country_iso3.lower()}"
 
     try:
         if body.delete_type == "all":
-            result = trino_db.execute(
+            result = await trino_db.execute(
                 text(f"SELECT COUNT(*) FROM {silver}")  # nosec B608
             )
             count = result.scalar() or 0
@@ -73,13 +75,15 @@ async def preview_delete_rows(
             return {"school_count": None, "check_skipped": True}
 
         id_col = body.id_type  # Literal — safe in SQL
-        result = trino_db.execute(
+        result = await trino_db.execute(
             text(
                 f"SELECT COUNT(*) FROM {silver}"  # nosec B608
                 f" WHERE {id_col} IN {_in_clause(body.ids)}"
             )
         )
         count = result.scalar() or 0
+    except TrinoQueryTimeoutError:
+        raise
     except Exception as err:
         raise HTTPException(status_code=500, detail=str(err)) from err
 
@@ -142,14 +146,14 @@ async def create_deletion_request(
         "ids": ids_to_store,
     }
 
-    delete_client = storage_client.get_blob_client(delete_location)
+    storage = get_storage()
 
     try:
-        delete_client.upload_blob(
-            json.dumps(delete_payload),
-            overwrite=True,
+        await storage.put(
+            delete_location,
+            json.dumps(delete_payload).encode(),
+            content_type="application/json",
             metadata={"requester_email": requested_by_email},
-            content_settings=ContentSettings(content_type="application/json"),
         )
     except HttpResponseError as err:
         raise HTTPException(
@@ -161,15 +165,9 @@ async def create_deletion_request(
         ext = os.path.splitext(file.filename or original_filename)[1] or ".csv"
         raw_filename = f"{record_id}_{country_iso3}_delete_{timestamp}{ext}"
         raw_file_path = f"raw/uploads/deletions/{country_iso3}/{raw_filename}"
-        raw_client = storage_client.get_blob_client(raw_file_path)
-        file_bytes = await file.read()
         try:
-            raw_client.upload_blob(
-                file_bytes,
-                overwrite=True,
-                content_settings=ContentSettings(
-                    content_type=file.content_type or "text/csv"
-                ),
+            await storage.put(
+                raw_file_path, file, content_type=file.content_type or "text/csv"
             )
         except HttpResponseError as err:
             raise HTTPException(
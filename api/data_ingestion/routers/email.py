@@ -12,8 +12,8 @@ from data_ingestion.db.primary import get_db
 from data_ingestion.internal import email
 from data_ingestion.internal.auth import azure_scheme, email_header
 from data_ingestion.internal.data_quality_checks import get_data_quality_summary
+from data_ingestion.internal.downloads import open_blob
 from data_ingestion.internal.email import send_email_base
-from data_ingestion.internal.storage import storage_client
 from data_ingestion.models import FileUpload
 from data_ingestion.permissions.permissions import IsPrivileged
 from data_ingestion.schemas.email import (
@@ -26,6 +26,7 @@ from data_ingestion.schemas.email import (
     UploadSuccessRenderRequest,
 )
 from data_ingestion.settings import settings
+from data_ingestion.storage import get_storage
 
 
 def _entity_for_dataset(dataset: str) -> dict[str, str]:
@@ -43,12 +44,9 @@ def _entity_for_dataset(dataset: str) -> dict[str, str]:
     }
 
 
-def _load_upload_metadata(metadata_json_path: str) -> dict | None:
+async def _load_upload_metadata(metadata_json_path: str) -> dict | None:
     try:
-        blob = storage_client.get_blob_client(metadata_json_path)
-        if not blob.exists():
-            return None
-        raw = blob.download_blob().readall()
+        raw = await get_storage().get(metadata_json_path)
         upload_meta = json.loads(raw)
         if isinstance(upload_meta, dict):
             return {str(k): v for k, v in upload_meta.items()}
@@ -57,9 +55,9 @@ def _load_upload_metadata(metadata_json_path: str) -> dict | None:
     return None
 
 
-def _load_value_maps(dq_report_path: str) -> dict | None:
+async def _load_value_maps(dq_report_path: str) -> dict | None:
     try:
-        dq_summary = get_data_quality_summary(dq_report_path)
+        dq_summary = await get_data_quality_summary(dq_report_path)
         value_maps = dq_summary.get("valueMaps")
         if isinstance(value_maps, dict):
             return value_maps
@@ -68,18 +66,18 @@ def _load_value_maps(dq_report_path: str) -> dict | None:
     return None
 
 
-def _enrich_pdf_payload_from_file_upload(
+async def _enrich_pdf_payload_from_file_upload(
     payload: dict,
     file_upload: FileUpload,
 ) -> None:
     if not payload.get("uploadedFileName") and file_upload.original_filename:
         payload["uploadedFileName"] = file_upload.original_filename
     if not payload.get("uploadMetadata") and file_upload.metadata_json_path:
-        upload_meta = _load_upload_metadata(file_upload.metadata_json_path)
+        upload_meta = await _load_upload_metadata(file_upload.metadata_json_path)
         if upload_meta is not None:
             payload["uploadMetadata"] = upload_meta
     if not payload.get("valueMaps") and file_upload.dq_report_path:
-        value_maps = _load_value_maps(file_upload.dq_report_path)
+        value_maps = await _load_value_maps(file_upload.dq_report_path)
         if value_maps is not None:
             payload["valueMaps"] = value_maps
 
@@ -170,7 +168,7 @@ async def generate_dq_report_pdf(
         select(FileUpload).where(FileUpload.id == body.props.uploadId)
     )
     if file_upload is not None:
-        _enrich_pdf_payload_from_file_upload(payload, file_upload)
+        await _enrich_pdf_payload_from_file_upload(payload, file_upload)
 
     if not payload.get("entity"):
         payload["entity"] = _entity_for_dataset(body.props.dataset)
@@ -239,14 +237,9 @@ async def download_dq_report_pdf_from_adls(
         f"{stored_country_code}/{filename}"
     )
 
-    blob = storage_client.get_blob_client(path)
-    if not blob.exists():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"DQ report PDF not found at path: {path}",
-        )
-
-    stream = blob.download_blob()
+    stream = await open_blob(
+        path, not_found_detail=f"DQ report PDF not found at path: {path}"
+    )
     headers = {
         "Content-Disposition": f'attachment; filename="{filename}"',
         "Content-Type": "application/pdf",
@@ -22,7 +22,6 @@ from azure.core.exceptions import HttpResponseError
 from data_ingestion.constants import constants
 from data_ingestion.db.primary import get_db
 from data_ingestion.internal.auth import azure_scheme
-from data_ingestion.internal.storage import storage_client
 from data_ingestion.models import SchoolConnectivity, SchoolList
 from data_ingestion.permissions.permissions import IsPrivileged
 from data_ingestion.schemas.core import PagedResponseSchema
@@ -33,6 +32,7 @@ from data_ingestion.schemas.qos import (
     SchoolListSchema,
     UpdateSchoolListErrorMessageRequest,
 )
+from data_ingestion.storage import get_storage
 
 router = APIRouter(
     prefix="/api/qos",
@@ -221,9 +221,9 @@ async def create_api_ingestion(
                 f"{constants.API_INGESTION_SCHEMA_UPLOAD_PATH}/{filename}{ext}"
             )
 
-            client = storage_client.get_blob_client(upload_path)
             try:
-                client.upload_blob(await file.read())
+                await file.seek(0)
+                await get_storage().put(upload_path, file)
                 response.status_code = status.HTTP_201_CREATED
             except HttpResponseError as err:
                 raise HTTPException(
@@ -13,11 +13,13 @@ from fastapi import (
     Security,
     status,
 )
-from sqlalchemy.orm import Session
 
 from data_ingestion.cache.keys import get_schema_key
 from data_ingestion.cache.serde import get_cache_string
-from data_ingestion.db.trino import get_db
+from data_ingestion.db.trino import (
+    AsyncTrinoSession,
+    get_async_db as get_db,
+)
 from data_ingestion.internal.auth import azure_scheme
 from data_ingestion.internal.schema import (
     get_schema as _get_schema,
@@ -35,7 +37,7 @@ router = APIRouter(
 @router.get("", response_model=list[str])
 async def list_schemas(
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    db: AsyncTrinoSession = Depends(get_db),
     cache_control: Annotated[str, Header()] = None,
 ):
     bypass_cache = cache_control == "no-cache"
@@ -46,7 +48,7 @@ async def list_schemas(
 async def get_schema(
     name: str,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    db: AsyncTrinoSession = Depends(get_db),
     cache_control: Annotated[str, Header()] = None,
     is_update: bool = False,
     is_qos: bool = False,
@@ -82,7 +84,9 @@ async def get_schema(
     ):
         return orjson.loads(schema)
 
-    return _get_schema(name, db, background_tasks)
+    return await db.run_sync(
+        lambda session: _get_schema(name, session, background_tasks)
+    )
 
 
 @router.get("/{name}/download", response_class=Response)
@@ -90,7 +94,7 @@ async def download_schema(
     response: Response,
     name: str,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    db: AsyncTrinoSession = Depends(get_db),
 ):
     schemas = await get_schemas(db, background_tasks)
     if name not in schemas:
@@ -99,7 +103,10 @@ async def download_schema(
     if (schema := await get_cache_string(get_schema_key(name))) is not None:
         schema = orjson.loads(schema)
     else:
-        schema = [s.model_dump() for s in await _get_schema(name, db, background_tasks)]
+        schema = await db.run_sync(
+            lambda session: _get_schema(name, session, background_tasks)
+        )
+        schema = [s.model_dump() for s in schema]
 
     df = pd.DataFrame.from_records(schema)
 
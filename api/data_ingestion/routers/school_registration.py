@@ -112,7 +112,7 @@ async def trigger_registration_pipeline(
 
     try:
         registration_metadata = build_registration_metadata(payload)
-        write_registration_csv_to_adls(
+        await write_registration_csv_to_adls(
             payload.model_dump(),
             file_upload,
             registration_metadata,
@@ -315,7 +315,7 @@ async def retrigger_registration_pipeline(
         logger.info(
             f"Writing NocoDB registration CSV to ADLS for {school_data.giga_id_school}"
         )
-        write_registration_csv_to_adls(
+        await write_registration_csv_to_adls(
             school_data.model_dump(),
             new_file_upload,
             registration_metadata,
@@ -2,9 +2,11 @@ import asyncio
 import io
 import json
 import os
+import tempfile
+from collections.abc import AsyncIterator
 from datetime import UTC, date, datetime, time
 from pathlib import Path
-from typing import Annotated, Literal, Optional
+from typing import Annotated, BinaryIO, Literal, Optional
 
 import country_converter as coco
 import magic
@@ -15,29 +17,72 @@ from fastapi import (
     Depends,
     HTTPException,
     Query,
+    Request,
     Response,
     Security,
+    UploadFile,
     status,
 )
 from fastapi_azure_auth.user import User
 from loguru import logger
 from pydantic import Field
-from sqlalchemy import delete, func, or_, select, text
+from sqlalchemy import func, or_, select, text
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session
 from starlette.responses import StreamingResponse
 
 from azure.core.exceptions import HttpResponseError
-from azure.storage.blob import ContentSettings
 from data_ingestion.constants import constants
 from data_ingestion.db.primary import get_db
-from data_ingestion.db.trino import get_db as get_trino_db
+from data_ingestion.db.trino import (
+    AsyncTrinoSession,
+    TrinoQueryTimeoutError,
+    get_async_db as get_trino_db,
+)
 from data_ingestion.internal.auth import azure_scheme
 from data_ingestion.internal.data_quality_checks import (
     get_data_quality_summary,
+    get_data_quality_summary_json,
+)
+from data_ingestion.internal.downloads import (
+    blob_download_response,
+    read_blob,
+    stream_blob,
+)
+from data_ingestion.internal.learned_corrections import (
+    LearnedCorrections,
+    collect_confirmed_corrections,
+    get_learned_corrections,
+    record_fuzzy_corrections,
+)
+from data_ingestion.internal.master_school_ids import get_matching_master_school_ids
+from data_ingestion.internal.resumable_uploads import (
+    create_resumable_upload,
+    delete_resumable_upload,
+    get_block_ids,
+    get_chunk_length,
+    get_resumable_offset,
+    get_resumable_upload,
+    save_resumable_upload,
+    stage_resumable_chunk,
 )
 from data_ingestion.internal.roles import get_user_roles
-from data_ingestion.internal.storage import storage_client
+from data_ingestion.internal.upload_sessions import (
+    check_upload_session_target,
+    count_upload_session_values,
+    create_upload_session,
+    delete_upload_session,
+    get_upload_session,
+    open_upload_session_file,
+    read_upload_session_columns,
+)
+from data_ingestion.internal.uploads import (
+    StagedBlocks,
+    create_file_upload,
+    find_duplicate_upload,
+    hash_upload,
+    prepare_file_upload,
+)
 from data_ingestion.models import (
     DQRun,
     FileUpload,
@@ -51,21 +96,41 @@ from data_ingestion.schemas.upload import (
     DataQualityCheckLabel,
     FileUpload as FileUploadSchema,
     FileUploadRequest,
+    ResumableUpload,
+    ResumableUploadFinalizeRequest,
+    ResumableUploadRequest,
+    ResumableUploadStatus,
     UnstructuredFileUploadRequest,
     UploadImpactPreviewRequest,
     UploadImpactPreviewResponse,
+    UploadSession,
+    UploadSessionRequest,
     ValidateFuzzyRequest,
 )
-from data_ingestion.utils.data_quality import get_metadata_path
-from data_ingestion.utils.fuzzy_matching import run_fuzzy_matching
+from data_ingestion.storage import BlobNotFoundError, get_storage
+from data_ingestion.utils.fuzzy_corrections import (
+    CorrectedCsvStream,
+    check_csv_quotes,
+    write_corrected_xlsx,
+)
+from data_ingestion.utils.fuzzy_matching import (
+    FuzzyMatcher,
+    get_fuzzy_matchers,
+    run_fuzzy_matching_on_value_counts,
+)
 from data_ingestion.utils.nocodb import (
-    get_nocodb_table_id_from_name,
-    get_nocodb_table_rows,
+    fetch_nocodb_table_id_from_name,
+    fetch_nocodb_table_rows,
+)
+from data_ingestion.utils.spreadsheet import (
+    count_spreadsheet_values,
+    dedupe_column_names,
+    parse_spreadsheet,
 )
 from data_ingestion.utils.upload_impact import (
     build_upload_impact_preview,
     get_school_id_file_column,
-    normalize_school_id,
+    normalize_school_ids,
 )
 
 DQ_CHECK_LABELS_TABLE_NAME = "SchoolGeolocationMasterDQChecks"
@@ -135,8 +200,8 @@ def _normalize_dq_check_label(row: dict) -> DataQualityCheckLabel | None:
 
 @router.get("/data_quality_check_labels", response_model=list[DataQualityCheckLabel])
 async def list_data_quality_check_labels():
-    table_id = get_nocodb_table_id_from_name(DQ_CHECK_LABELS_TABLE_NAME)
-    rows = get_nocodb_table_rows(table_id)
+    table_id = await fetch_nocodb_table_id_from_name(DQ_CHECK_LABELS_TABLE_NAME)
+    rows = await fetch_nocodb_table_rows(table_id)
     labels = [
         label for row in rows if (label := _normalize_dq_check_label(row)) is not None
     ]
@@ -203,19 +268,13 @@ async def list_basic_checks(
                 f"sample-data-check/{source}.json"
             )
 
-    blob = storage_client.get_blob_client(path)
-    if not blob.exists():
-        logger.error("DQ report summary still does not exist")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Data Quality report not found in storage at path: {path}",
-        )
-
-    blob_data = blob.download_blob().readall()
-    dq_report_summary = blob_data.decode("utf-8")
-    dq_report_summary_dict: dict = json.loads(dq_report_summary)
-
-    return dq_report_summary_dict
+    return Response(
+        content=await get_data_quality_summary_json(
+            path,
+            not_found_detail=f"Data Quality report not found in storage at path: {path}",
+        ),
+        media_type="application/json",
+    )
 
 
 @router.get("/basic_check/{dataset}/download")
@@ -269,17 +328,7 @@ async def download_basic_check(
                 f"sample-data-check/{source}.json"
             )
 
-    blob = storage_client.get_blob_client(path)
-    if not blob.exists():
-        logger.error("DQ report summary still does not exist")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Not Found",
-        )
-
-    blob_data = blob.download_blob().readall()
-    dq_report_summary = blob_data.decode("utf-8")
-    dq_report_summary_dict: dict = json.loads(dq_report_summary)
+    dq_report_summary_dict = await get_data_quality_summary(path)
 
     dq_result_df = pd.DataFrame(
         {
@@ -444,10 +493,12 @@ async def get_upload(
     dq_mode = "master"
     if file_upload.metadata_json_path:
         try:
-            blob_client = storage_client.get_blob_client(file_upload.metadata_json_path)
-            if blob_client.exists():
-                metadata_json = json.loads(blob_client.download_blob().readall())
-                dq_mode = metadata_json.get("dq_mode", "master")
+            metadata_json = json.loads(
+                await get_storage().get(file_upload.metadata_json_path)
+            )
+            dq_mode = metadata_json.get("dq_mode", "master")
+        except BlobNotFoundError:
+            pass
         except Exception as e:
             logger.error(f"Failed to fetch dq_mode from metadata: {e}")
     file_upload.dq_mode = dq_mode
@@ -455,50 +506,26 @@ async def get_upload(
     return file_upload
 
 
-def _parse_spreadsheet(
-    content: bytes, file_ext: str, dtype_overrides: dict
-) -> pd.DataFrame:
-    buf = io.BytesIO(content)
-    if file_ext == ".csv":
-        return pd.read_csv(buf, dtype=dtype_overrides)
-    if file_ext == ".xlsx":
-        return pd.read_excel(buf, dtype=dtype_overrides, engine="openpyxl")
-    return pd.read_excel(buf, dtype=dtype_overrides, engine="xlrd")
-
-
 def _silver_table(dataset: str, country_code: str) -> str:
     schema = dataset.lower().replace("school ", "")
     return f"delta_lake.school_{schema}_silver.{country_code.lower()}"
 
 
-def _get_master_school_ids(dataset: str, country_code: str, db: Session) -> set[str]:
+async def _get_matching_master_school_ids(
+    dataset: str, country_code: str, school_ids: list[str], db: AsyncTrinoSession
+) -> set[str]:
     table_name = _silver_table(dataset, country_code)
     try:
-        rows = (
-            db.execute(
-                text(
-                    f"SELECT school_id_govt FROM {table_name} "  # nosec B608
-                    "WHERE school_id_govt IS NOT NULL"
-                )
-            )
-            .mappings()
-            .all()
-        )
+        return await get_matching_master_school_ids(db, table_name, school_ids)
+    except TrinoQueryTimeoutError:
+        raise
     except Exception as err:
-        if "TABLE_NOT_FOUND" in str(err):
-            return set()
         logger.error(f"Failed to fetch master school IDs from {table_name}: {err}")
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
             detail="Unable to fetch master school IDs from Trino.",
         ) from err
 
-    return {
-        normalized
-        for row in rows
-        if (normalized := normalize_school_id(row["school_id_govt"])) is not None
-    }
-
 
 def _get_impact_preview_school_id_column(form: UploadImpactPreviewRequest) -> str:
     try:
@@ -518,17 +545,6 @@ def _get_impact_preview_school_id_column(form: UploadImpactPreviewRequest) -> st
         ) from err
 
 
-def _serialize_spreadsheet(df: pd.DataFrame, file_ext: str) -> bytes:
-    buf = io.BytesIO()
-    if file_ext == ".csv":
-        df.to_csv(buf, index=False)
-    else:
-        df.to_excel(buf, index=False)
-    result = buf.getvalue()
-    buf.close()
-    return result
-
-
 def _build_column_replacements(corrections_mapping: list) -> dict[str, dict]:
     column_replacements: dict[str, dict] = {}
     for correction in corrections_mapping:
@@ -541,57 +557,152 @@ def _build_column_replacements(corrections_mapping: list) -> dict[str, dict]:
 
 
 def apply_fuzzy_corrections(
-    fuzzy_corrections_json: str, file_extension: str, upload_content: bytes
+    column_replacements: dict[str, dict], upload_content: bytes
 ) -> bytes:
-    try:
-        corrections_mapping = orjson.loads(fuzzy_corrections_json)
-        file_ext = file_extension.lower()
-        if file_ext not in constants.SUPPORTED_SPREADSHEET_EXTENSIONS:
-            return upload_content
+    """Apply corrections to a legacy ``.xls`` upload, rewritten as a whole."""
+    df = pd.read_excel(
+        io.BytesIO(upload_content),
+        engine="xlrd",
+        dtype=dict.fromkeys(column_replacements, str),
+    )
+    if not any(col in df.columns for col in column_replacements):
+        return upload_content
 
-        column_replacements = _build_column_replacements(corrections_mapping)
-        if not column_replacements:
-            return upload_content
+    for col, replacements in column_replacements.items():
+        if col in df.columns:
+            df[col] = df[col].replace(replacements)
 
-        dtype_overrides = {col: str for col in column_replacements}
-        df = _parse_spreadsheet(upload_content, file_ext, dtype_overrides)
+    buf = io.BytesIO()
+    df.to_excel(buf, index=False)
+    return buf.getvalue()
 
-        if not any(col in df.columns for col in column_replacements):
-            return upload_content
 
-        for col, replacements in column_replacements.items():
-            if col in df.columns:
-                df[col] = df[col].replace(replacements)
+async def _apply_fuzzy_corrections(
+    file: UploadFile, file_extension: str, fuzzy_corrections_json: str
+) -> UploadFile | CorrectedCsvStream | BinaryIO:
+    """
+    Return the stream to upload for ``file`` with its fuzzy corrections applied.
 
-        return _serialize_spreadsheet(df, file_ext)
+    CSV is rewritten lazily while it is uploaded, copying every untouched
+    byte; XLSX is streamed between a read-only and a write-only workbook into
+    a temporary file. Corrections that cannot be applied are logged and the
+    original file is uploaded, as before.
+    """
+    file_ext = file_extension.lower()
+    try:
+        column_replacements = _build_column_replacements(
+            orjson.loads(fuzzy_corrections_json)
+        )
+        if not column_replacements:
+            return file
+
+        if file_ext == ".csv":
+            await asyncio.to_thread(check_csv_quotes, file.file)
+            return CorrectedCsvStream(
+                file.file, column_replacements, dedupe_column_names
+            )
+
+        if file_ext == ".xlsx":
+            corrected = tempfile.TemporaryFile()
+            try:
+                await asyncio.to_thread(
+                    write_corrected_xlsx,
+                    file.file,
+                    column_replacements,
+                    dedupe_column_names,
+                    corrected,
+                )
+            except BaseException:
+                corrected.close()
+                raise
+            corrected.seek(0)
+            return corrected
+
+        if file_ext == ".xls":
+            content = await asyncio.to_thread(
+                apply_fuzzy_corrections, column_replacements, await file.read()
+            )
+            return io.BytesIO(content)
     except Exception as e:
         logger.error(f"Failed to apply fuzzy corrections: {e}")
-    return upload_content
+        await file.seek(0)
+    return file
 
 
-@router.post("", response_model=FileUploadSchema)
-async def upload_file(
-    response: Response,
-    dataset: str,
-    dq_mode: Optional[DQModeEnum] = Query(None),
-    form: FileUploadRequest = Depends(),
-    db: AsyncSession = Depends(get_db),
-    user: User = Depends(azure_scheme),
-    is_privileged: bool = Depends(IsPrivileged.raises(False)),
-):
-    form.dq_mode = getattr(dq_mode, "value", None) or form.dq_mode or "master"
+async def _record_fuzzy_corrections(
+    db: AsyncSession,
+    country_code: str,
+    fuzzy_corrections_json: str,
+    column_to_schema_mapping: dict[str, str],
+) -> None:
+    """Remember the corrections confirmed with an upload; failures are logged."""
+    try:
+        corrections = collect_confirmed_corrections(
+            orjson.loads(fuzzy_corrections_json), column_to_schema_mapping
+        )
+        await record_fuzzy_corrections(
+            db, country=country_code, corrections=corrections
+        )
+    except Exception as e:
+        logger.error(f"Failed to record fuzzy corrections: {e}")
+        # Leave the session usable for the rest of the request.
+        await db.rollback()
 
-    file = form.file
 
-    if not is_privileged:
-        country_dataset = f"{form.country}-School {dataset.capitalize()}"
-        roles = await get_user_roles(user, db)
-        if country_dataset not in roles:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="User does not have permissions on this dataset",
-            )
+async def _get_learned_corrections(
+    db: AsyncSession,
+    country: str | None,
+    column_to_schema_mapping: dict[str, str],
+    fuzzy_matchers: dict[str, FuzzyMatcher],
+) -> LearnedCorrections:
+    schema_columns = {
+        schema_column
+        for schema_column in column_to_schema_mapping.values()
+        if schema_column in fuzzy_matchers
+    }
+    if not (country and schema_columns):
+        return {}
+
+    country_code = coco.convert(country, to="ISO3")
+    if country_code == "not found":
+        return {}
+    return await get_learned_corrections(
+        db, country=country_code, schema_columns=schema_columns
+    )
+
+
+async def _check_dataset_role(
+    country: str, dataset: str, db: AsyncSession, user: User, is_privileged: bool
+) -> None:
+    if is_privileged:
+        return
+    country_dataset = f"{country}-School {dataset.capitalize()}"
+    roles = await get_user_roles(user, db)
+    if country_dataset not in roles:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User does not have permissions on this dataset",
+        )
+
+
+def _check_upload_content_type(content: bytes, file_extension: str) -> str:
+    """Sniff the type of a file from its first bytes and check its extension."""
+    file_type = magic.from_buffer(bytes(content[:4096]), mime=True)
+    if file_type not in constants.VALID_UPLOAD_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid file type.",
+        )
+    if file_extension not in constants.VALID_UPLOAD_TYPES[file_type]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File extension does not match file type.",
+        )
+    return file_type
 
+
+async def _check_upload_file(file: UploadFile) -> tuple[str, str]:
+    """Check the size and sniffed type of an upload; return its type and extension."""
     if file.size > constants.UPLOAD_FILE_SIZE_LIMIT:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -600,22 +711,143 @@ async def upload_file(
 
     file_content = await file.read(4096)
     await file.seek(0)
-    file_type = magic.from_buffer(file_content, mime=True)
     file_extension = os.path.splitext(file.filename)[1]
+    return _check_upload_content_type(file_content, file_extension), file_extension
 
-    if file_type not in constants.VALID_UPLOAD_TYPES:
+
+async def _get_form_upload(
+    file: UploadFile | None, upload_session: str | None, user: User
+) -> UploadFile | UploadSession:
+    """Return the caller's session named in the form, else the file sent with it."""
+    if upload_session:
+        return await get_upload_session(upload_session, user.claims.get("emails")[0])
+    if file is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid file type.",
+            detail="Either file or upload_session is required.",
         )
+    return file
 
-    if file_extension not in constants.VALID_UPLOAD_TYPES[file_type]:
+
+@router.post(
+    "/sessions",
+    response_model=UploadSession,
+    status_code=status.HTTP_201_CREATED,
+)
+async def start_upload_session(
+    dataset: str,
+    form: UploadSessionRequest = Depends(),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(azure_scheme),
+    is_privileged: bool = Depends(IsPrivileged.raises(False)),
+):
+    """
+    Upload a spreadsheet once and get a token for the rest of the upload flow.
+
+    ``/validate-fuzzy``, ``/impact-preview`` and ``POST /upload`` accept the
+    token as ``upload_session`` in place of the file; they read the staged
+    file and its cached parse instead of the client sending it again. The
+    session ends with the upload, or expires.
+    """
+    await _check_dataset_role(form.country, dataset, db, user, is_privileged)
+
+    file_type, file_extension = await _check_upload_file(form.file)
+    if file_extension.lower() not in constants.SUPPORTED_SPREADSHEET_EXTENSIONS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="File extension does not match file type.",
+            detail=f"Upload sessions only support {', '.join(constants.SUPPORTED_SPREADSHEET_EXTENSIONS)} files.",
+        )
+
+    try:
+        return await create_upload_session(
+            form.file,
+            content_type=file_type,
+            uploader_email=user.claims.get("emails")[0],
+            country=form.country,
+            dataset=dataset,
         )
+    except HttpResponseError as err:
+        raise HTTPException(
+            detail=err.message, status_code=err.response.status_code
+        ) from err
+
+
+@router.delete("/sessions/{token}", status_code=status.HTTP_204_NO_CONTENT)
+async def discard_upload_session(
+    token: str,
+    user: User = Depends(azure_scheme),
+):
+    session = await get_upload_session(token, user.claims.get("emails")[0])
+    await delete_upload_session(session.token)
+
+
+@router.post("", response_model=FileUploadSchema)
+async def upload_file(  # noqa: C901
+    response: Response,
+    dataset: str,
+    dq_mode: Optional[DQModeEnum] = Query(None),
+    form: FileUploadRequest = Depends(),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(azure_scheme),
+    is_privileged: bool = Depends(IsPrivileged.raises(False)),
+):
+    """
+    Upload a file for DQ checks, sent as ``file`` or staged in an
+    ``upload_session``.
+
+    If the same file was already uploaded for the country and dataset, with
+    the same mapping and DQ mode, that upload is returned with a 200 and
+    ``Content-Location`` instead of starting another DQ run, unless
+    ``allow_duplicate`` is set.
+    """
+    form.dq_mode = getattr(dq_mode, "value", None) or form.dq_mode or "master"
+
+    await _check_dataset_role(form.country, dataset, db, user, is_privileged)
+
+    upload = await _get_form_upload(form.file, form.upload_session, user)
+    if isinstance(upload, UploadSession):
+        check_upload_session_target(upload, form.country, dataset)
+        # Checked when the session was created; only the bytes are re-read.
+        file_type = upload.content_type
+        file_extension = os.path.splitext(upload.original_filename)[1]
+        original_filename = upload.original_filename
+    else:
+        file_type, file_extension = await _check_upload_file(upload)
+        original_filename = upload.filename
 
     country_code = coco.convert(form.country, to="ISO3")
+    column_to_schema_mapping = orjson.loads(form.column_to_schema_mapping)
+
+    # Only files stored as sent are matched, not ones rewritten by corrections.
+    content_hash = None
+    if not form.fuzzy_corrections:
+        if isinstance(upload, UploadSession):
+            content_hash = upload.content_hash
+        else:
+            content_hash = await hash_upload(upload.file)
+
+    if content_hash is not None and not form.allow_duplicate:
+        duplicate = await find_duplicate_upload(
+            db,
+            country=country_code,
+            dataset=dataset,
+            content_hash=content_hash,
+            column_to_schema_mapping=column_to_schema_mapping,
+            dq_mode=form.dq_mode,
+        )
+        if duplicate is not None:
+            if isinstance(upload, UploadSession):
+                await delete_upload_session(upload.token)
+            response.status_code = status.HTTP_200_OK
+            response.headers["Content-Location"] = f"{router.prefix}/{duplicate.id}"
+            duplicate.dq_mode = form.dq_mode
+            return duplicate
+
+    if isinstance(upload, UploadSession):
+        file = await open_upload_session_file(upload)
+    else:
+        file = upload
+
     email = user.claims.get("emails")[0]
     database_user = await db.scalar(
         select(DatabaseUser).where(DatabaseUser.email == email)
@@ -623,87 +855,295 @@ async def upload_file(
 
     upload_metadata = orjson.loads(form.metadata)
 
-    file_upload = FileUpload(
-        uploader_id=database_user.id,
-        uploader_email=database_user.email,
-        country=country_code,
-        dataset=dataset,
-        source=form.source,
-        mode=upload_metadata.get("mode") or None,
-        original_filename=file.filename,
-        column_to_schema_mapping=orjson.loads(form.column_to_schema_mapping),
-        column_license=orjson.loads(form.column_license),
-        data_owner=upload_metadata.get("data_owner"),
+    file_upload = prepare_file_upload(
+        FileUpload(
+            uploader_id=database_user.id,
+            uploader_email=database_user.email,
+            country=country_code,
+            dataset=dataset,
+            source=form.source,
+            mode=upload_metadata.get("mode") or None,
+            original_filename=original_filename,
+            column_to_schema_mapping=column_to_schema_mapping,
+            column_license=orjson.loads(form.column_license),
+            data_owner=upload_metadata.get("data_owner"),
+            content_hash=content_hash,
+        )
     )
 
-    db.add(file_upload)
-    await db.commit()
-    await db.refresh(file_upload)
-
-    # compute ADLS path before commit
-    metadata_file_path = get_metadata_path(file_upload.upload_path)
-    file_upload.metadata_json_path = metadata_file_path
-
-    db.add(file_upload)
-    await db.commit()
-
     # Create initial DQRun record
     dq_run = DQRun(
         upload_id=file_upload.id,
         dq_mode=form.dq_mode,
         status="IN_PROGRESS",
     )
-    db.add(dq_run)
-    await db.commit()
-    client = storage_client.get_blob_client(file_upload.upload_path)
+
+    metadata = {
+        **{str(k): str(v) for k, v in upload_metadata.items()},
+        "country": form.country,
+        "uploader_email": email,
+        "dq_mode": form.dq_mode,
+    }
+
+    if form.source is not None:
+        metadata["source"] = form.source
+
+    await file.seek(0)
+    upload_stream = file
+
+    # Apply fuzzy corrections if provided
+    if form.fuzzy_corrections:
+        upload_stream = await _apply_fuzzy_corrections(
+            file, file_extension, form.fuzzy_corrections
+        )
 
     try:
-        metadata = {
-            **{str(k): str(v) for k, v in upload_metadata.items()},
-            "country": form.country,
-            "uploader_email": email,
-            "dq_mode": form.dq_mode,
-        }
+        await create_file_upload(
+            db,
+            file_upload,
+            dq_run,
+            data=upload_stream,
+            sidecar=metadata,
+            content_type=file_type,
+        )
+        response.status_code = status.HTTP_201_CREATED
+    except HttpResponseError as err:
+        raise HTTPException(
+            detail=err.message, status_code=err.response.status_code
+        ) from err
+    finally:
+        await file.close()
+        # Corrected XLSX and XLS files are written to streams of their own.
+        if upload_stream is not file and hasattr(upload_stream, "close"):
+            upload_stream.close()
+
+    if form.fuzzy_corrections:
+        await _record_fuzzy_corrections(
+            db, country_code, form.fuzzy_corrections, column_to_schema_mapping
+        )
 
-        if form.source is not None:
-            metadata["source"] = form.source
+    if isinstance(upload, UploadSession):
+        await delete_upload_session(upload.token)
+    return file_upload
 
-        await file.seek(0)
-        upload_content = await file.read()
-
-        # Apply fuzzy corrections if provided
-        if form.fuzzy_corrections:
-            loop = asyncio.get_running_loop()
-            upload_content = await loop.run_in_executor(
-                None,
-                apply_fuzzy_corrections,
-                form.fuzzy_corrections,
-                file_extension,
-                upload_content,
+
+async def _read_chunk(request: Request, length: int) -> bytearray:
+    """Read a chunk body of exactly ``length`` bytes, refusing anything larger."""
+    chunk = bytearray()
+    async for part in request.stream():
+        chunk += part
+        if len(chunk) > length:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Chunk must be {length} bytes.",
             )
+    if len(chunk) != length:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Chunk must be {length} bytes.",
+        )
+    return chunk
+
+
+async def _resumable_upload_status(upload: ResumableUpload) -> ResumableUploadStatus:
+    return ResumableUploadStatus(
+        token=upload.token,
+        size=upload.size,
+        chunk_size=upload.chunk_size,
+        offset=await get_resumable_offset(upload),
+        expires_at=upload.expires_at,
+    )
+
+
+@router.post(
+    "/resumable",
+    response_model=ResumableUploadStatus,
+    status_code=status.HTTP_201_CREATED,
+)
+async def start_resumable_upload(
+    dataset: str,
+    form: ResumableUploadRequest = Depends(),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(azure_scheme),
+    is_privileged: bool = Depends(IsPrivileged.raises(False)),
+):
+    """
+    Start a resumable upload of a file in chunks, for slow or flaky links.
 
-        client.upload_blob(
-            upload_content,
-            overwrite=True,
-            content_settings=ContentSettings(content_type=file_type),
+    Send each ``chunk_size`` slice of the file (the last one may be shorter)
+    with ``PUT /resumable/{token}?offset=...``, in any order and retrying as
+    needed; ``GET /resumable/{token}`` returns how much of the file has been
+    received from the start. ``POST /resumable/{token}/finalize`` then creates
+    the upload exactly like ``POST /upload``.
+    """
+    await _check_dataset_role(form.country, dataset, db, user, is_privileged)
+
+    if form.size > constants.UPLOAD_FILE_SIZE_LIMIT:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"File size exceeds {constants.UPLOAD_FILE_SIZE_LIMIT_MB} MB limit",
         )
-        # Upload metadata sidecar JSON
-        metadata_blob_client = storage_client.get_blob_client(
-            file_upload.metadata_json_path
+    file_extension = os.path.splitext(form.filename)[1]
+    if not any(
+        file_extension in extensions
+        for extensions in constants.VALID_UPLOAD_TYPES.values()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid file type.",
         )
-        metadata_json_bytes = json.dumps(metadata, indent=2).encode()
-        metadata_blob_client.upload_blob(metadata_json_bytes, overwrite=True)
-        response.status_code = status.HTTP_201_CREATED
+
+    email = user.claims.get("emails")[0]
+    database_user = await db.scalar(
+        select(DatabaseUser).where(DatabaseUser.email == email)
+    )
+    file_upload = prepare_file_upload(
+        FileUpload(
+            uploader_id=database_user.id,
+            uploader_email=database_user.email,
+            country=coco.convert(form.country, to="ISO3"),
+            dataset=dataset,
+            source=form.source,
+            original_filename=form.filename,
+        )
+    )
+
+    upload = await create_resumable_upload(
+        file_upload, country=form.country, size=form.size
+    )
+    return await _resumable_upload_status(upload)
+
+
+@router.head("/resumable/{token}")
+@router.get("/resumable/{token}", response_model=ResumableUploadStatus)
+async def get_resumable_upload_status(
+    token: str,
+    response: Response,
+    user: User = Depends(azure_scheme),
+):
+    upload = await get_resumable_upload(token, user.claims.get("emails")[0])
+    upload_status = await _resumable_upload_status(upload)
+    response.headers["Upload-Offset"] = str(upload_status.offset)
+    return upload_status
+
+
+@router.put("/resumable/{token}", status_code=status.HTTP_204_NO_CONTENT)
+async def put_resumable_upload_chunk(
+    token: str,
+    request: Request,
+    offset: int = Query(..., ge=0),
+    user: User = Depends(azure_scheme),
+):
+    """
+    Stage one chunk of the file, starting at ``offset``, as a block of the
+    upload's blob. Only this chunk is held in memory.
+    """
+    upload = await get_resumable_upload(token, user.claims.get("emails")[0])
+    if offset % upload.chunk_size != 0 or offset >= upload.size:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Offset must be a multiple of {upload.chunk_size} below {upload.size}.",
+        )
+
+    chunk = await _read_chunk(request, get_chunk_length(upload, offset))
+    if offset == 0:
+        file_extension = os.path.splitext(upload.original_filename)[1]
+        content_type = _check_upload_content_type(chunk, file_extension)
+        if upload.content_type != content_type:
+            upload.content_type = content_type
+            await save_resumable_upload(upload)
+
+    try:
+        await stage_resumable_chunk(upload, offset, chunk)
     except HttpResponseError as err:
-        await db.execute(delete(FileUpload).where(FileUpload.id == file_upload.id))
-        await db.commit()
         raise HTTPException(
             detail=err.message, status_code=err.response.status_code
         ) from err
-    except Exception as err:
-        await db.execute(delete(FileUpload).where(FileUpload.id == file_upload.id))
-        await db.commit()
-        raise err
+
+
+@router.post(
+    "/resumable/{token}/finalize",
+    response_model=FileUploadSchema,
+    status_code=status.HTTP_201_CREATED,
+)
+async def finalize_resumable_upload(
+    token: str,
+    dq_mode: Optional[DQModeEnum] = Query(None),
+    form: ResumableUploadFinalizeRequest = Depends(),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(azure_scheme),
+    is_privileged: bool = Depends(IsPrivileged.raises(False)),
+):
+    """
+    Commit the received chunks as the upload's file and create the upload
+    and its DQ run, as ``POST /upload`` does.
+    """
+    upload = await get_resumable_upload(token, user.claims.get("emails")[0])
+    await _check_dataset_role(upload.country, upload.dataset, db, user, is_privileged)
+
+    offset = await get_resumable_offset(upload)
+    if offset < upload.size or upload.content_type is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Upload is incomplete: {offset} of {upload.size} bytes received.",
+        )
+
+    form_dq_mode = getattr(dq_mode, "value", None) or form.dq_mode or "master"
+    upload_metadata = orjson.loads(form.metadata)
+
+    file_upload = prepare_file_upload(
+        FileUpload(
+            id=upload.upload_id,
+            created=upload.created,
+            uploader_id=upload.uploader_id,
+            uploader_email=upload.uploader_email,
+            country=upload.country_code,
+            dataset=upload.dataset,
+            source=upload.source,
+            mode=upload_metadata.get("mode") or None,
+            original_filename=upload.original_filename,
+            column_to_schema_mapping=orjson.loads(form.column_to_schema_mapping),
+            column_license=orjson.loads(form.column_license),
+            data_owner=upload_metadata.get("data_owner"),
+        )
+    )
+    dq_run = DQRun(
+        upload_id=file_upload.id,
+        dq_mode=form_dq_mode,
+        status="IN_PROGRESS",
+    )
+
+    metadata = {
+        **{str(k): str(v) for k, v in upload_metadata.items()},
+        "country": upload.country,
+        "uploader_email": upload.uploader_email,
+        "dq_mode": form_dq_mode,
+    }
+    if upload.source is not None:
+        metadata["source"] = upload.source
+
+    try:
+        await create_file_upload(
+            db,
+            file_upload,
+            dq_run,
+            data=StagedBlocks(get_block_ids(upload)),
+            sidecar=metadata,
+            content_type=upload.content_type,
+        )
+    except IntegrityError as err:
+        # The upload's row has a fixed ID, so only one finalize can insert it.
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Upload is already being finalized or was finalized.",
+        ) from err
+    except HttpResponseError as err:
+        raise HTTPException(
+            detail=err.message, status_code=err.response.status_code
+        ) from err
+
+    await delete_resumable_upload(upload.token)
     return file_upload
 
 
@@ -782,31 +1222,32 @@ async def trigger_dq_run(
     # Update blob metadata to trigger sensor
     # We update the 'dq_mode' in the metadata JSON
     try:
-        blob_client = storage_client.get_blob_client(file_upload.metadata_json_path)
-        if blob_client.exists():
-            metadata_json = json.loads(blob_client.download_blob().readall())
-            metadata_json["dq_mode"] = dq_mode.value
-            # We also add a timestamp to force the sensor to see it as a "new" event if it watches for changes
-            metadata_json["dq_triggered_at"] = datetime.now(UTC).isoformat()
-
-            blob_client.upload_blob(
-                json.dumps(metadata_json, indent=2).encode(), overwrite=True
+        storage = get_storage()
+        metadata_json = json.loads(
+            await read_blob(
+                file_upload.metadata_json_path,
+                not_found_detail="Metadata file not found in storage",
             )
+        )
+        metadata_json["dq_mode"] = dq_mode.value
+        # We also add a timestamp to force the sensor to see it as a "new" event if it watches for changes
+        metadata_json["dq_triggered_at"] = datetime.now(UTC).isoformat()
 
-            # Also update the metadata on the raw upload file itself
-            raw_blob_client = storage_client.get_blob_client(file_upload.upload_path)
-            if raw_blob_client.exists():
-                string_metadata = {str(k): str(v) for k, v in metadata_json.items()}
-                raw_blob_client.set_blob_metadata(metadata=string_metadata)
+        await storage.put(
+            file_upload.metadata_json_path,
+            json.dumps(metadata_json, indent=2).encode(),
+        )
 
-            # Reset DQ status in DB to indicate it's re-processing
-            file_upload.dq_status = DQStatusEnum.IN_PROGRESS
-            await db.commit()
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Metadata file not found in storage",
-            )
+        # Also update the metadata on the raw upload file itself
+        string_metadata = {str(k): str(v) for k, v in metadata_json.items()}
+        try:
+            await storage.set_metadata(file_upload.upload_path, string_metadata)
+        except BlobNotFoundError:
+            logger.warning(f"Raw upload not found at {file_upload.upload_path}")
+
+        # Reset DQ status in DB to indicate it's re-processing
+        file_upload.dq_status = DQStatusEnum.IN_PROGRESS
+        await db.commit()
     except HTTPException:
         await db.rollback()
         raise
@@ -891,46 +1332,31 @@ async def upload_unstructured(  # noqa: C901
         dq_status=DQStatusEnum.SKIPPED,
         data_owner=upload_metadata.get("data_owner"),
     )
-    db.add(file_upload)
-    await db.commit()
-    await db.refresh(file_upload)
 
-    # Keep parity with school uploads: persist a sidecar JSON metadata path.
-    metadata_file_path = get_metadata_path(file_upload.upload_path)
-    file_upload.metadata_json_path = metadata_file_path
-    db.add(file_upload)
-    await db.commit()
+    metadata = {
+        **{str(k): str(v) for k, v in upload_metadata.items()},
+        "country": form.country,
+        "uploader_email": email,
+    }
 
-    client = storage_client.get_blob_client(file_upload.upload_path)
+    if form.source is not None:
+        metadata["source"] = form.source
 
+    await file.seek(0)
     try:
-        metadata = {
-            **{str(k): str(v) for k, v in upload_metadata.items()},
-            "country": form.country,
-            "uploader_email": email,
-        }
-
-        if form.source is not None:
-            metadata["source"] = form.source
-
-        await file.seek(0)
-        client.upload_blob(
-            await file.read(),
+        await create_file_upload(
+            db,
+            file_upload,
+            data=file,
+            sidecar=metadata,
+            content_type=file_type,
             metadata=metadata,
-            content_settings=ContentSettings(content_type=file_type),
-        )
-        metadata_blob_client = storage_client.get_blob_client(
-            file_upload.metadata_json_path
         )
-        metadata_json_bytes = json.dumps(metadata, indent=2).encode()
-        metadata_blob_client.upload_blob(metadata_json_bytes, overwrite=True)
         response.status_code = status.HTTP_201_CREATED
     except HttpResponseError as err:
         raise HTTPException(
             detail=err.message, status_code=err.response.status_code
         ) from err
-    except Exception as err:
-        raise err
 
 
 @router.post("/structured", status_code=status.HTTP_201_CREATED)
@@ -1021,46 +1447,32 @@ async def upload_structured(  # noqa: C901
         dq_status=DQStatusEnum.SKIPPED,
         data_owner=upload_metadata.get("data_owner"),
     )
-    db.add(file_upload)
-    await db.commit()
-    await db.refresh(file_upload)
 
-    metadata_file_path = get_metadata_path(file_upload.upload_path)
-    file_upload.metadata_json_path = metadata_file_path
-    db.add(file_upload)
-    await db.commit()
+    metadata = {
+        **{str(k): str(v) for k, v in upload_metadata.items()},
+        "country": form.country,
+        "uploader_email": email,
+        "dataset_type": dataset_label,
+    }
 
-    client = storage_client.get_blob_client(file_upload.upload_path)
+    if form.source is not None:
+        metadata["source"] = form.source
 
+    await file.seek(0)
     try:
-        metadata = {
-            **{str(k): str(v) for k, v in upload_metadata.items()},
-            "country": form.country,
-            "uploader_email": email,
-            "dataset_type": dataset_label,
-        }
-
-        if form.source is not None:
-            metadata["source"] = form.source
-
-        await file.seek(0)
-        client.upload_blob(
-            await file.read(),
+        await create_file_upload(
+            db,
+            file_upload,
+            data=file,
+            sidecar=metadata,
+            content_type=file_type,
             metadata=metadata,
-            content_settings=ContentSettings(content_type=file_type),
-        )
-        metadata_blob_client = storage_client.get_blob_client(
-            file_upload.metadata_json_path
         )
-        metadata_json_bytes = json.dumps(metadata, indent=2).encode()
-        metadata_blob_client.upload_blob(metadata_json_bytes, overwrite=True)
         response.status_code = status.HTTP_201_CREATED
     except HttpResponseError as err:
         raise HTTPException(
             detail=err.message, status_code=err.response.status_code
         ) from err
-    except Exception as err:
-        raise err
 
 
 @router.get(
@@ -1093,15 +1505,24 @@ async def get_data_quality_check(
     if file_upload.dq_status != DQStatusEnum.COMPLETED:
         return {"dq_summary": None, "status": file_upload.dq_status}
 
-    dq_report_summary_dict = get_data_quality_summary(file_upload.dq_report_path)
+    dq_report_summary = await get_data_quality_summary_json(file_upload.dq_report_path)
 
-    return {"dq_summary": dq_report_summary_dict, "status": file_upload.dq_status}
+    return Response(
+        content=orjson.dumps(
+            {
+                "dq_summary": orjson.Fragment(dq_report_summary),
+                "status": file_upload.dq_status,
+            }
+        ),
+        media_type="application/json",
+    )
 
 
 @router.get(
     "/data_quality_check/{upload_id}/download",
 )
 async def download_data_quality_check(
+    request: Request,
     upload_id: str,
     db: AsyncSession = Depends(get_db),
     is_privileged: bool = Depends(IsPrivileged.raises(False)),
@@ -1129,17 +1550,25 @@ async def download_data_quality_check(
     upload_filename = path.name
 
     download_path_human_readable = f"data-quality-results/{dataset}/dq-human-readable-descriptions/{country_code}/{upload_filename}"
-    blob = storage_client.get_blob_client(download_path_human_readable)
-
-    if not blob.exists():
-        download_path_original_dq = f"data-quality-results/{dataset}/dq-overall/{country_code}/{upload_filename}"
-        blob = storage_client.get_blob_client(download_path_original_dq)
-
-    stream = blob.download_blob()
+    download_path_original_dq = (
+        f"data-quality-results/{dataset}/dq-overall/{country_code}/{upload_filename}"
+    )
     headers = {"Content-Disposition": f"attachment; filename={upload_filename}"}
 
-    return StreamingResponse(
-        stream.chunks(),
+    try:
+        return await blob_download_response(
+            request,
+            download_path_human_readable,
+            media_type="application/octet-stream",
+            headers=headers,
+        )
+    except HTTPException as err:
+        if err.status_code != status.HTTP_404_NOT_FOUND:
+            raise
+
+    return await blob_download_response(
+        request,
+        download_path_original_dq,
         media_type="application/octet-stream",
         headers=headers,
     )
@@ -1147,6 +1576,7 @@ async def download_data_quality_check(
 
 @router.get("/failed_rows/{dataset}/{country_code}/{filename}")
 async def download_failed_rows_direct(
+    request: Request,
     dataset: str,
     country_code: str,
     filename: str,
@@ -1154,32 +1584,19 @@ async def download_failed_rows_direct(
     filename = str(Path(filename).with_suffix(".csv"))
 
     path = f"data-quality-results/{dataset}/dq-failed-rows-human-readable/{country_code}/{filename}"
-    blob = storage_client.get_blob_client(path)
 
-    if not blob.exists():
-        logger.error(f"File not found at path: {path}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Failed rows file not found at path: {path}",
-        )
-
-    try:
-        stream = blob.download_blob()
-        return StreamingResponse(
-            stream.chunks(),
-            media_type="text/csv",
-            headers={"Content-Disposition": f"attachment; filename={filename}"},
-        )
-    except Exception as e:
-        logger.error(f"Error downloading blob: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error downloading file: {str(e)}",
-        ) from e
+    return await blob_download_response(
+        request,
+        path,
+        media_type="text/csv",
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+        not_found_detail=f"Failed rows file not found at path: {path}",
+    )
 
 
 @router.get("/passed_rows/{dataset}/{country_code}/{filename}")
 async def download_passed_rows_direct(
+    request: Request,
     dataset: str,
     country_code: str,
     filename: str,
@@ -1188,32 +1605,18 @@ async def download_passed_rows_direct(
 
     path = f"data-quality-results/{dataset}/dq-passed-rows-human-readable/{country_code}/{filename}"
 
-    blob = storage_client.get_blob_client(path)
-
-    if not blob.exists():
-        logger.error(f"File not found at path: {path}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Passed rows file not found at path: {path}",
-        )
-
-    try:
-        stream = blob.download_blob()
-        return StreamingResponse(
-            stream.chunks(),
-            media_type="text/csv",
-            headers={"Content-Disposition": f"attachment; filename={filename}"},
-        )
-    except Exception as e:
-        logger.error(f"Error downloading blob: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error downloading file: {str(e)}",
-        ) from e
+    return await blob_download_response(
+        request,
+        path,
+        media_type="text/csv",
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+        not_found_detail=f"Passed rows file not found at path: {path}",
+    )
 
 
 @router.get("/raw_file/{dataset}/{country_code}/{filename}")
 async def download_raw_file_direct(
+    request: Request,
     dataset: str,
     country_code: str,
     filename: str,
@@ -1226,34 +1629,12 @@ async def download_raw_file_direct(
     path = f"raw/uploads/school-{dataset}/{country_code}/{filename}"
     logger.info(f"Attempting to download raw file from path: {path}")
 
-    blob = storage_client.get_blob_client(path)
-
-    if not blob.exists():
-        logger.error(f"Raw file not found at path: {path}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Raw file not found",
-        )
-
-    try:
-        stream = blob.download_blob()
-        # Get the content type from blob properties or default to octet-stream
-        content_type = (
-            blob.get_blob_properties().content_settings.content_type
-            or "application/octet-stream"
-        )
-
-        return StreamingResponse(
-            stream.chunks(),
-            media_type=content_type,
-            headers={"Content-Disposition": f"attachment; filename={filename}"},
-        )
-    except Exception as e:
-        logger.error(f"Error downloading raw file: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error downloading file: {str(e)}",
-        ) from e
+    return await blob_download_response(
+        request,
+        path,
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+        not_found_detail="Raw file not found",
+    )
 
 
 @router.post(
@@ -1261,11 +1642,11 @@ async def download_raw_file_direct(
     response_model=UploadImpactPreviewResponse,
     status_code=status.HTTP_200_OK,
 )
-async def get_upload_impact_preview(
+async def get_upload_impact_preview(  # noqa: C901
     dataset: str,
     form: UploadImpactPreviewRequest = Depends(),
     db: AsyncSession = Depends(get_db),
-    trino: Session = Depends(get_trino_db),
+    trino: AsyncTrinoSession = Depends(get_trino_db),
     user: User = Depends(azure_scheme),
     is_privileged: bool = Depends(IsPrivileged.raises(False)),
 ):
@@ -1291,14 +1672,18 @@ async def get_upload_impact_preview(
                 detail="User does not have permissions on this dataset",
             )
 
-    file = form.file
-    if file.size > constants.UPLOAD_FILE_SIZE_LIMIT:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File size exceeds {constants.UPLOAD_FILE_SIZE_LIMIT_MB} MB limit",
-        )
+    upload = await _get_form_upload(form.file, form.upload_session, user)
+    if isinstance(upload, UploadSession):
+        check_upload_session_target(upload, form.country, dataset)
+        file_extension = upload.file_extension
+    else:
+        if upload.size > constants.UPLOAD_FILE_SIZE_LIMIT:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"File size exceeds {constants.UPLOAD_FILE_SIZE_LIMIT_MB} MB limit",
+            )
+        file_extension = os.path.splitext(upload.filename)[1].lower()
 
-    file_extension = os.path.splitext(file.filename)[1].lower()
     if file_extension not in constants.SUPPORTED_SPREADSHEET_EXTENSIONS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -1307,16 +1692,20 @@ async def get_upload_impact_preview(
 
     school_id_file_column = _get_impact_preview_school_id_column(form)
 
-    await file.seek(0)
-    try:
-        content = await file.read()
-        df = _parse_spreadsheet(content, file_extension, {school_id_file_column: str})
-    except Exception as err:
-        logger.error(f"Failed to parse file for impact preview: {err}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid {file_extension} format.",
-        ) from err
+    if isinstance(upload, UploadSession):
+        df = await read_upload_session_columns(upload, [school_id_file_column])
+    else:
+        await upload.seek(0)
+        try:
+            df = await asyncio.to_thread(
+                parse_spreadsheet, upload.file, file_extension, [school_id_file_column]
+            )
+        except Exception as err:
+            logger.error(f"Failed to parse file for impact preview: {err}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid {file_extension} format.",
+            ) from err
 
     if school_id_file_column not in df.columns:
         raise HTTPException(
@@ -1331,13 +1720,11 @@ async def get_upload_impact_preview(
             detail="Country could not be resolved to an ISO3 code.",
         )
 
-    file_school_ids = [
-        normalized_id
-        for value in df[school_id_file_column].tolist()
-        if (normalized_id := normalize_school_id(value)) is not None
-    ]
+    file_school_ids = normalize_school_ids(df[school_id_file_column])
 
-    master_school_ids = _get_master_school_ids(dataset, country_code, trino)
+    master_school_ids = await _get_matching_master_school_ids(
+        dataset, country_code, file_school_ids.unique().to_pylist(), trino
+    )
     return build_upload_impact_preview(
         file_school_ids=file_school_ids,
         total_rows=len(df.index),
@@ -1368,7 +1755,7 @@ async def list_rejected_uploads(
     search: Optional[str] = None,
     country_code: Optional[str] = None,
     dataset_type: Optional[str] = None,
-    trino: Session = Depends(get_trino_db),
+    trino: AsyncTrinoSession = Depends(get_trino_db),
     is_privileged: bool = Depends(IsPrivileged.raises(True)),
 ):
     """
@@ -1424,7 +1811,7 @@ async def list_rejected_uploads(
             FROM school_master.upload_errors
             {where_clause}
         """  # nosec B608
-        total_count = trino.execute(text(count_query), params).scalar()
+        total_count = await trino.scalar(text(count_query), params)
 
         # We need to group by to get distinct uploads, but we also want sorting.
         # If sorting by metadata that is constant per file_id (filename, country, dataset), distinct is fine.
@@ -1446,7 +1833,7 @@ async def list_rejected_uploads(
             LIMIT :limit OFFSET :offset
         """  # nosec B608
 
-        result = trino.execute(text(sql_query), params)
+        result = await trino.execute(text(sql_query), params)
         rows = result.fetchall()
 
         items = [
@@ -1467,6 +1854,8 @@ async def list_rejected_uploads(
             "total_count": total_count,
         }
 
+    except TrinoQueryTimeoutError:
+        raise
     except Exception as e:
         logger.error(f"Error listing rejected uploads: {str(e)}")
         raise HTTPException(
@@ -1484,7 +1873,7 @@ async def query_errors(
     country_code: Optional[str] = None,
     dataset_type: Optional[str] = None,
     upload_id: Optional[str] = None,
-    trino: Session = Depends(get_trino_db),
+    trino: AsyncTrinoSession = Depends(get_trino_db),
     is_privileged: bool = Depends(IsPrivileged.raises(True)),
 ):
     """
@@ -1536,7 +1925,7 @@ async def query_errors(
             FROM school_master.upload_errors
             {where_clause}
         """  # nosec B608
-        total_count = trino.execute(text(count_query), params).scalar()
+        total_count = await trino.scalar(text(count_query), params)
 
         # nosec B608: where_clause uses parameterized queries, sort_col and sort_order are validated
         sql_query = f"""
@@ -1547,7 +1936,7 @@ async def query_errors(
             LIMIT :limit OFFSET :offset
         """  # nosec B608
 
-        result = trino.execute(text(sql_query), params)
+        result = await trino.execute(text(sql_query), params)
         rows = result.fetchall()
 
         output = []
@@ -1572,6 +1961,8 @@ async def query_errors(
             "total_count": total_count,
         }
 
+    except TrinoQueryTimeoutError:
+        raise
     except Exception as e:
         logger.error(f"Error querying errors: {str(e)}")
         raise HTTPException(
@@ -1581,12 +1972,12 @@ async def query_errors(
 
 
 @router.get("/{upload_id}/rejected_rows/download")
-async def download_rejected_rows(
+async def download_rejected_rows(  # noqa: C901
     upload_id: str,
     user: User = Depends(azure_scheme),
     is_privileged: bool = Depends(IsPrivileged.raises(False)),
     db: AsyncSession = Depends(get_db),
-    trino: Session = Depends(get_trino_db),
+    trino: AsyncTrinoSession = Depends(get_trino_db),
 ):
     """
     Download rejected rows for a specific upload from the aggregated error table.
@@ -1615,7 +2006,7 @@ async def download_rejected_rows(
         req_query = text(
             "SELECT row_data, error_details FROM school_master.upload_errors WHERE giga_sync_file_id = :upload_id"
         )
-        result = trino.execute(req_query, {"upload_id": upload_id})
+        result = await trino.execute(req_query, {"upload_id": upload_id})
         rows = result.fetchall()
 
         parsed_rows = []
@@ -1652,6 +2043,8 @@ async def download_rejected_rows(
             headers={"Content-Disposition": f"attachment; filename={filename}"},
         )
 
+    except TrinoQueryTimeoutError:
+        raise
     except Exception as e:
         logger.error(f"Error querying rejected rows from Trino: {str(e)}")
         raise HTTPException(
@@ -1671,6 +2064,9 @@ async def validate_fuzzy_matching(
     """
     Synchronously validate an uploaded CSV file for fuzzy matching errors.
     Returns the errors grouped by column to display in the UI.
+
+    Only value counts of the mapped columns with valid values are kept, so
+    files up to ``FUZZY_VALIDATION_FILE_SIZE_LIMIT_MB`` are accepted.
     """
     if not is_privileged:
         roles = await get_user_roles(user, db)
@@ -1679,17 +2075,17 @@ async def validate_fuzzy_matching(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="User does not have permissions to upload structured datasets",
             )
-    file = form.file
-
-    if file.size > constants.UPLOAD_FILE_SIZE_LIMIT:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="File size exceeds 10 MB limit",
-        )
 
-    await file.read(8192)
-    await file.seek(0)
-    file_extension = os.path.splitext(file.filename)[1].lower()
+    upload = await _get_form_upload(form.file, form.upload_session, user)
+    if isinstance(upload, UploadSession):
+        file_extension = upload.file_extension
+    else:
+        if upload.size > constants.FUZZY_VALIDATION_FILE_SIZE_LIMIT:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"File size exceeds {constants.FUZZY_VALIDATION_FILE_SIZE_LIMIT_MB} MB limit",
+            )
+        file_extension = os.path.splitext(upload.filename)[1].lower()
 
     if file_extension not in constants.SUPPORTED_SPREADSHEET_EXTENSIONS:
         raise HTTPException(
@@ -1697,25 +2093,52 @@ async def validate_fuzzy_matching(
             detail=f"Fuzzy validation currently only supports {', '.join(constants.SUPPORTED_SPREADSHEET_EXTENSIONS)} files.",
         )
 
-    # Re-read the file to parse with pandas
-    await file.seek(0)
     try:
-        if file_extension == ".csv":
-            df = pd.read_csv(file.file)
-        elif file_extension == ".xlsx":
-            df = pd.read_excel(file.file, engine="openpyxl")
-        else:
-            df = pd.read_excel(file.file, engine="xlrd")
+        column_mapping = orjson.loads(form.column_to_schema_mapping)
     except Exception as e:
-        logger.error(f"Failed to parse file: {e}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid {file_extension} format.",
+            detail="Invalid column_to_schema_mapping.",
         ) from e
 
+    fuzzy_matchers = await get_fuzzy_matchers()
+    learned_corrections = await _get_learned_corrections(
+        db,
+        upload.country if isinstance(upload, UploadSession) else form.country,
+        column_mapping,
+        fuzzy_matchers,
+    )
+
+    # Only the values of columns with valid values are counted, so memory
+    # grows with the number of distinct values, not with the file.
+    fuzzy_columns = [
+        file_column
+        for file_column, schema_column in column_mapping.items()
+        if schema_column in fuzzy_matchers
+    ]
+    if isinstance(upload, UploadSession):
+        value_counts = await count_upload_session_values(upload, fuzzy_columns)
+    else:
+        await upload.seek(0)
+        try:
+            value_counts = await asyncio.to_thread(
+                count_spreadsheet_values, upload.file, file_extension, fuzzy_columns
+            )
+        except Exception as e:
+            logger.error(f"Failed to parse file: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid {file_extension} format.",
+            ) from e
+
     try:
-        column_mapping = orjson.loads(form.column_to_schema_mapping)
-        results = run_fuzzy_matching(df, column_mapping)
+        results = await asyncio.to_thread(
+            run_fuzzy_matching_on_value_counts,
+            value_counts,
+            column_mapping,
+            fuzzy_matchers,
+            learned_corrections,
+        )
         return results
 
     except Exception as e:
@@ -1728,14 +2151,15 @@ async def validate_fuzzy_matching(
 
 @router.head("/dq_kit/{upload_id}/download")
 @router.get("/dq_kit/{upload_id}/download")
-async def download_dq_kit(
+async def download_dq_kit(  # noqa: C901
+    request: Request,
     upload_id: str,
     db: AsyncSession = Depends(get_db),
     is_privileged: bool = Depends(IsPrivileged.raises(False)),
     user: User = Depends(azure_scheme),
 ):
     """Download a complete DQ Kit ZIP for a given upload."""
-    from data_ingestion.utils.dq_kit_generator import generate_dq_kit_zip
+    from data_ingestion.utils.dq_kit_generator import DQKitManager
 
     file_upload = await db.scalar(select(FileUpload).where(FileUpload.id == upload_id))
     if file_upload is None:
@@ -1759,25 +2183,56 @@ async def download_dq_kit(
             detail=f"DQ Kit is not available. DQ Status: {file_upload.dq_status.value}",
         )
 
-    try:
-        logger.info(f"Generating DQ Kit for upload_id: {upload_id}")
-        zip_buffer, filename = generate_dq_kit_zip(file_upload)
+    manager = DQKitManager(file_upload)
+    headers = {
+        "Content-Disposition": f"attachment; filename={manager.get_zip_filename()}"
+    }
 
-        return StreamingResponse(
-            io.BytesIO(zip_buffer.read()),
+    try:
+        return await blob_download_response(
+            request,
+            manager.prebuilt_zip_path(),
             media_type="application/zip",
-            headers={"Content-Disposition": f"attachment; filename={filename}"},
+            headers=headers,
         )
-    except Exception as e:
-        logger.error(f"Error generating DQ Kit: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error generating DQ Kit: {str(e)}",
-        ) from e
+    except HTTPException as err:
+        if err.status_code != status.HTTP_404_NOT_FOUND:
+            raise
+
+    no_artifacts = HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="No DQ Kit artifacts found for this upload",
+    )
+    # The UI probes the kit with HEAD on every upload page view; that is
+    # answered from the artifacts' existence alone, without reading them.
+    if request.method == "HEAD":
+        if not await manager.has_artifacts(manager.artifacts()):
+            raise no_artifacts
+        return Response(media_type="application/zip", headers=headers)
+
+    logger.info(f"Pre-built DQ Kit not found. Building on-demand for {upload_id}")
+    # Start the archive before responding: the first chunk only arrives once
+    # an artifact has been read, so a kit with no artifacts is still a 404.
+    chunks = manager.stream_zip(manager.artifacts())
+    first_chunk = await anext(chunks, None)
+    if first_chunk is None:
+        raise no_artifacts
+
+    async def body() -> AsyncIterator[bytes]:
+        # Also closes the artifact being read when the client disconnects.
+        try:
+            yield first_chunk
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await chunks.aclose()
+
+    return StreamingResponse(body(), media_type="application/zip", headers=headers)
 
 
 @router.get("/map/{upload_id}")
 async def get_school_map(
+    request: Request,
     upload_id: str,
     db: AsyncSession = Depends(get_db),
     is_privileged: bool = Depends(IsPrivileged.raises(False)),
@@ -1806,26 +2261,15 @@ async def get_school_map(
     map_filename = Path(map_path).name
     logger.info(f"Attempting to serve map from: {map_path}")
 
-    blob = storage_client.get_blob_client(map_path)
-    if not blob.exists():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Map not found. It may not have been generated yet.",
-        )
-
-    try:
-        stream = blob.download_blob()
-        return StreamingResponse(
-            stream.chunks(),
-            media_type="text/html",
-            headers={
-                "Content-Disposition": f"inline; filename={map_filename}",
-                "X-Frame-Options": "SAMEORIGIN",
-            },
-        )
-    except Exception as e:
-        logger.error(f"Error serving map: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error loading map: {str(e)}",
-        ) from e
+    # Always proxied, even in redirect mode: the map is embedded in the UI,
+    # which needs these headers and fetches it with a bearer token.
+    return await stream_blob(
+        request,
+        map_path,
+        media_type="text/html",
+        headers={
+            "Content-Disposition": f"inline; filename={map_filename}",
+            "X-Frame-Options": "SAMEORIGIN",
+        },
+        not_found_detail="Map not found. It may not have been generated yet.",
+    )
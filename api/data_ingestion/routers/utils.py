@@ -8,6 +8,7 @@ from country_converter import CountryConverter
 from fastapi import (
     APIRouter,
     HTTPException,
+    Request,
     Security,
     status,
 )
@@ -17,7 +18,7 @@ from starlette.background import BackgroundTask
 
 from data_ingestion.constants import constants
 from data_ingestion.internal.auth import azure_scheme
-from data_ingestion.internal.storage import storage_client
+from data_ingestion.internal.downloads import blob_download_response
 from data_ingestion.schemas.core import B2CPolicyGroupRequest, B2CPolicyGroupResponse
 from data_ingestion.schemas.util import (
     Country,
@@ -117,13 +118,12 @@ async def forward_get_request(
 
 
 @router.get("/data-privacy")
-async def get_data_privacy_document():
+async def get_data_privacy_document(request: Request):
     path = Path(constants.DATA_PRIVACY_DOCUMENT_PATH)
-    blob = storage_client.get_blob_client(str(path))
-    stream = blob.download_blob()
     headers = {"Content-Disposition": f"attachment; filename={path.name}"}
-    return StreamingResponse(
-        stream.chunks(),
+    return await blob_download_response(
+        request,
+        str(path),
         media_type="application/pdf",
         headers=headers,
     )
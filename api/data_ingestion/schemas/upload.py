@@ -1,3 +1,4 @@
+import os
 from dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID
@@ -41,6 +42,7 @@ class FileUpload(BaseModel):
     rows: int | None
     rows_passed: int | None
     rows_failed: int | None
+    content_hash: str | None = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -85,7 +87,6 @@ class FileUpload(BaseModel):
 
 @dataclass
 class FileUploadRequest:
-    file: UploadFile = Form(...)
     column_to_schema_mapping: str = Form(...)
     column_license: str = Form(...)
     country: str = Form(...)
@@ -94,6 +95,10 @@ class FileUploadRequest:
     source: str | None = Form(None)
     dq_mode: str = Form("master")
     fuzzy_corrections: str | None = Form(None)
+    file: UploadFile | None = Form(None)
+    upload_session: str | None = Form(None)
+    # Upload the file even if the same file was already uploaded and checked.
+    allow_duplicate: bool = Form(False)
 
 
 @dataclass
@@ -108,15 +113,86 @@ class UnstructuredFileUploadRequest:
 
 @dataclass
 class ValidateFuzzyRequest:
-    file: UploadFile = Form(...)
     column_to_schema_mapping: str = Form(...)
+    file: UploadFile | None = Form(None)
+    upload_session: str | None = Form(None)
+    # Suggests the corrections confirmed for the country; sessions know it.
+    country: str | None = Form(None)
 
 
 @dataclass
 class UploadImpactPreviewRequest:
-    file: UploadFile = Form(...)
     column_to_schema_mapping: str = Form(...)
     country: str = Form(...)
+    file: UploadFile | None = Form(None)
+    upload_session: str | None = Form(None)
+
+
+@dataclass
+class UploadSessionRequest:
+    file: UploadFile = Form(...)
+    country: str = Form(...)
+
+
+class UploadSession(BaseModel):
+    token: str
+    uploader_email: EmailStr
+    country: str
+    dataset: str
+    original_filename: str
+    content_type: str
+    size: int
+    columns: list[str]
+    rows: int
+    content_hash: str | None = None
+    created: datetime
+    expires_at: datetime
+
+    @property
+    def file_extension(self) -> str:
+        return os.path.splitext(self.original_filename)[1].lower()
+
+
+@dataclass
+class ResumableUploadRequest:
+    filename: str = Form(...)
+    size: int = Form(..., gt=0)
+    country: str = Form(...)
+    source: str | None = Form(None)
+
+
+@dataclass
+class ResumableUploadFinalizeRequest:
+    column_to_schema_mapping: str = Form(...)
+    column_license: str = Form(...)
+    metadata: str = Form(...)
+    dq_mode: str = Form("master")
+
+
+class ResumableUpload(BaseModel):
+    token: str
+    upload_id: str
+    created: datetime
+    expires_at: datetime
+    uploader_id: str
+    uploader_email: EmailStr
+    country: str
+    country_code: str
+    dataset: str
+    source: str | None
+    original_filename: str
+    upload_path: str
+    size: int
+    chunk_size: int
+    content_type: str | None = None
+
+
+class ResumableUploadStatus(BaseModel):
+    token: str
+    size: int
+    chunk_size: int
+    offset: int
+    expires_at: datetime
 
 
 class UploadImpactPreviewResponse(BaseModel):
@@ -24,6 +24,17 @@ class DeploymentEnvironment(StrEnum):
     PRD = "prd"
 
 
+class StorageBackendName(StrEnum):
+    AZURE = "azure"
+    LOCAL = "local"
+    MEMORY = "memory"
+
+
+class ArtifactDownloadMode(StrEnum):
+    PROXY = "proxy"
+    REDIRECT = "redirect"
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -81,6 +92,11 @@ class Settings(BaseSettings):
     REDIS_HOST: str = "redis"
     REDIS_PORT: int = 6379
     REDIS_CACHE_DEFAULT_TTL_SECONDS: int = int(timedelta(minutes=10).total_seconds())
+    AZURE_STORAGE_MAX_CONNECTIONS: int = 100
+    STORAGE_BACKEND: StorageBackendName = StorageBackendName.AZURE
+    LOCAL_STORAGE_PATH: Path = Path(__file__).parent.parent / ".storage"
+    ARTIFACT_DOWNLOAD_MODE: ArtifactDownloadMode = ArtifactDownloadMode.PROXY
+    ARTIFACT_DOWNLOAD_SAS_TTL_SECONDS: int = 300
     ADMIN_EMAIL: str = ""
     LAKEHOUSE_USERNAME: str = ""
     GIGAMETER_API_BASE_URL: str = ""
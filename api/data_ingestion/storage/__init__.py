@@ -0,0 +1,69 @@
+from data_ingestion.settings import StorageBackendName, settings
+from data_ingestion.storage.base import (
+    BlobDownload,
+    BlobNotFoundError,
+    BlobNotModifiedError,
+    BlobPreconditionFailedError,
+    BlobProperties,
+    InvalidRangeError,
+    StorageBackend,
+    StorageError,
+)
+
+_storage: StorageBackend | None = None
+
+
+def create_storage(backend: StorageBackendName) -> StorageBackend:
+    if backend == StorageBackendName.LOCAL:
+        from data_ingestion.storage.local import LocalFileStorage
+
+        return LocalFileStorage(settings.LOCAL_STORAGE_PATH)
+
+    if backend == StorageBackendName.MEMORY:
+        from data_ingestion.storage.memory import InMemoryStorage
+
+        return InMemoryStorage()
+
+    from data_ingestion.storage.adls import AzureBlobStorage
+
+    return AzureBlobStorage()
+
+
+def get_storage() -> StorageBackend:
+    """Return the process-wide storage backend selected by ``STORAGE_BACKEND``."""
+    global _storage
+
+    if _storage is None:
+        _storage = create_storage(settings.STORAGE_BACKEND)
+    return _storage
+
+
+def set_storage(storage: StorageBackend | None) -> None:
+    """Replace the process-wide storage backend, e.g. in tests and benchmarks."""
+    global _storage
+
+    _storage = storage
+
+
+async def close_storage() -> None:
+    global _storage
+
+    if _storage is not None:
+        await _storage.close()
+        _storage = None
+
+
+__all__ = [
+    "BlobDownload",
+    "BlobNotFoundError",
+    "BlobNotModifiedError",
+    "BlobPreconditionFailedError",
+    "BlobProperties",
+    "InvalidRangeError",
+    "StorageBackend",
+    "StorageError",
+    "close_storage",
+    "create_storage",
+    "get_storage",
+    "set_storage",
+]
@@ -0,0 +1,385 @@
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+
+import aiohttp
+from fastapi import status
+
+from azure.core import MatchConditions
+from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
+from azure.core.pipeline.transport import AioHttpTransport
+from azure.storage.blob import (
+    BlobBlock,
+    BlobSasPermissions,
+    ContentSettings,
+    UserDelegationKey,
+    generate_blob_sas,
+)
+from azure.storage.blob.aio import (
+    BlobClient as AsyncBlobClient,
+    BlobServiceClient as AsyncBlobServiceClient,
+    ContainerClient as AsyncContainerClient,
+)
+from data_ingestion.constants import constants
+from data_ingestion.settings import settings
+from data_ingestion.storage.base import (
+    BlobDownload,
+    BlobNotFoundError,
+    BlobNotModifiedError,
+    BlobPreconditionFailedError,
+    BlobProperties,
+    InvalidRangeError,
+    StorageBackend,
+    UploadData,
+    UploadStream,
+    read_chunk,
+)
+from data_ingestion.storage.metrics import StorageCallCountPolicy
+
+# Allowance for clock skew between the API and the storage service when
+# stamping SAS start times.
+SAS_CLOCK_SKEW = timedelta(minutes=5)
+USER_DELEGATION_KEY_LIFETIME = timedelta(hours=1)
+
+
+@contextmanager
+def _translate_errors(path: str) -> Iterator[None]:
+    try:
+        yield
+    except ResourceNotFoundError as err:
+        raise BlobNotFoundError(path) from err
+    except HttpResponseError as err:
+        if err.status_code == status.HTTP_304_NOT_MODIFIED:
+            raise BlobNotModifiedError(path) from err
+        if err.status_code == status.HTTP_412_PRECONDITION_FAILED:
+            raise BlobPreconditionFailedError(path) from err
+        if err.status_code == status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE:
+            raise InvalidRangeError(path) from err
+        raise
+
+
+def _total_size(content_range: str | None, fallback: int) -> int:
+    if content_range and "/" in content_range:
+        total = content_range.rsplit("/", 1)[1]
+        if total.isdigit():
+            return int(total)
+    return fallback
+
+
+def _to_properties(path: str, properties, size: int) -> BlobProperties:
+    return BlobProperties(
+        name=path,
+        size=size,
+        etag=properties.etag,
+        last_modified=properties.last_modified,
+        content_type=properties.content_settings.content_type,
+        metadata=dict(properties.metadata or {}),
+    )
+
+
+async def upload_blob_in_blocks(
+    blob_client: AsyncBlobClient,
+    stream: UploadStream,
+    *,
+    content_settings: ContentSettings | None = None,
+    metadata: dict[str, str] | None = None,
+    block_size: int | None = None,
+    max_concurrency: int | None = None,
+) -> None:
+    """
+    Upload a file to a block blob without buffering the whole file in memory.
+
+    The stream is read in fixed-size chunks, each chunk is staged as a block
+    while the next one is being read, and the block list is committed once
+    every block is staged. At most ``max_concurrency`` chunks are held in
+    memory at any time, so peak memory does not grow with the file size.
+
+    :param blob_client: The destination blob.
+    :param stream: An ``UploadFile`` or a binary file object, read from its
+        current position.
+    :param content_settings: Content settings to set on the committed blob.
+    :param metadata: Blob metadata to set on the committed blob.
+    :param block_size: Chunk size in bytes. Defaults to ``UPLOAD_BLOCK_SIZE``.
+    :param max_concurrency: Number of blocks staged in parallel. Defaults to
+        ``UPLOAD_MAX_CONCURRENCY``.
+    """
+    block_size = block_size or constants.UPLOAD_BLOCK_SIZE
+    max_concurrency = max_concurrency or constants.UPLOAD_MAX_CONCURRENCY
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    block_ids: list[str] = []
+    tasks: list[asyncio.Task] = []
+
+    async def stage(block_id: str, chunk: bytes) -> None:
+        try:
+            await blob_client.stage_block(block_id, chunk, length=len(chunk))
+        finally:
+            semaphore.release()
+
+    try:
+        while True:
+            await semaphore.acquire()
+            chunk = await read_chunk(stream, block_size)
+            if not chunk:
+                semaphore.release()
+                break
+
+            # Block IDs must all have the same length within a blob.
+            block_id = f"{len(block_ids):08d}"
+            block_ids.append(block_id)
+            tasks.append(asyncio.create_task(stage(block_id, chunk)))
+
+            # Surface staging failures early instead of reading the rest of
+            # the file first.
+            for task in tasks:
+                if task.done() and task.exception() is not None:
+                    task.result()
+
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+    await blob_client.commit_block_list(
+        [BlobBlock(block_id=block_id) for block_id in block_ids],
+        content_settings=content_settings,
+        metadata=metadata,
+    )
+
+
+class AzureBlobStorage(StorageBackend):
+    """Storage in the configured ADLS / Azure Blob (or Azurite) container."""
+
+    def __init__(self):
+        self._service_client: AsyncBlobServiceClient | None = None
+        self._container_client: AsyncContainerClient | None = None
+        self._user_delegation_key: UserDelegationKey | None = None
+        self._user_delegation_key_expiry: datetime | None = None
+
+    @property
+    def container_client(self) -> AsyncContainerClient:
+        """
+        The async container client, created lazily on first use so that its
+        aiohttp session (and connection pool) is bound to the running event
+        loop. Every request shares the same transport, so concurrent requests
+        reuse pooled connections to ADLS. Every HTTP request the client sends
+        is counted against the current API request (see ``storage.metrics``).
+        """
+        if self._container_client is None:
+            transport = AioHttpTransport(
+                session=aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(
+                        limit=settings.AZURE_STORAGE_MAX_CONNECTIONS,
+                    ),
+                    cookie_jar=aiohttp.DummyCookieJar(),
+                    auto_decompress=False,
+                ),
+                session_owner=True,
+            )
+
+            if settings.AZURE_STORAGE_CONNECTION_STRING:
+                self._service_client = AsyncBlobServiceClient.from_connection_string(
+                    settings.AZURE_STORAGE_CONNECTION_STRING,
+                    transport=transport,
+                    _additional_pipeline_policies=[StorageCallCountPolicy()],
+                )
+            else:
+                self._service_client = AsyncBlobServiceClient(
+                    f"https://{settings.AZURE_STORAGE_ACCOUNT_NAME}.blob.core.windows.net",
+                    credential=settings.AZURE_SAS_TOKEN,
+                    transport=transport,
+                    _additional_pipeline_policies=[StorageCallCountPolicy()],
+                )
+            self._container_client = self._service_client.get_container_client(
+                settings.AZURE_BLOB_CONTAINER_NAME
+            )
+
+        return self._container_client
+
+    def blob_client(self, path: str) -> AsyncBlobClient:
+        return self.container_client.get_blob_client(path)
+
+    async def open(
+        self,
+        path: str,
+        *,
+        offset: int | None = None,
+        length: int | None = None,
+        if_none_match: str | None = None,
+        if_match: str | None = None,
+    ) -> BlobDownload:
+        kwargs = {}
+        if if_none_match is not None:
+            kwargs = {
+                "etag": if_none_match,
+                "match_condition": MatchConditions.IfModified,
+            }
+        elif if_match is not None:
+            kwargs = {
+                "etag": if_match,
+                "match_condition": MatchConditions.IfNotModified,
+            }
+
+        with _translate_errors(path):
+            stream = await self.blob_client(path).download_blob(
+                offset=offset, length=length, **kwargs
+            )
+
+        offset = offset or 0
+        size = _total_size(stream.properties.content_range, offset + stream.size)
+        return BlobDownload(
+            _to_properties(path, stream.properties, size),
+            stream.chunks(),
+            offset=offset,
+            length=stream.size,
+        )
+
+    async def put(
+        self,
+        path: str,
+        data: UploadData,
+        *,
+        content_type: str | None = None,
+        metadata: dict[str, str] | None = None,
+    ) -> None:
+        blob_client = self.blob_client(path)
+        content_settings = (
+            ContentSettings(content_type=content_type) if content_type else None
+        )
+
+        if isinstance(data, bytes | bytearray | memoryview):
+            await blob_client.upload_blob(
+                data,
+                overwrite=True,
+                content_settings=content_settings,
+                metadata=metadata,
+            )
+        else:
+            await upload_blob_in_blocks(
+                blob_client,
+                data,
+                content_settings=content_settings,
+                metadata=metadata,
+            )
+
+    async def stage_block(self, path: str, block_id: str, data: bytes) -> None:
+        with _translate_errors(path):
+            await self.blob_client(path).stage_block(block_id, data, length=len(data))
+
+    async def staged_blocks(self, path: str) -> dict[str, int]:
+        try:
+            _, uncommitted = await self.blob_client(path).get_block_list("uncommitted")
+        except ResourceNotFoundError:
+            return {}
+        return {block.id: block.size for block in uncommitted}
+
+    async def commit_blocks(
+        self,
+        path: str,
+        block_ids: list[str],
+        *,
+        content_type: str | None = None,
+        metadata: dict[str, str] | None = None,
+    ) -> None:
+        with _translate_errors(path):
+            await self.blob_client(path).commit_block_list(
+                [BlobBlock(block_id=block_id) for block_id in block_ids],
+                content_settings=(
+                    ContentSettings(content_type=content_type) if content_type else None
+                ),
+                metadata=metadata,
+            )
+
+    async def exists(self, path: str) -> bool:
+        return await self.blob_client(path).exists()
+
+    async def properties(self, path: str) -> BlobProperties:
+        with _translate_errors(path):
+            properties = await self.blob_client(path).get_blob_properties()
+        return _to_properties(path, properties, properties.size)
+
+    async def list(self, prefix: str = "") -> AsyncIterator[BlobProperties]:
+        async for blob in self.container_client.list_blobs(
+            name_starts_with=prefix or None, include=["metadata"]
+        ):
+            yield _to_properties(blob.name, blob, blob.size)
+
+    async def set_metadata(self, path: str, metadata: dict[str, str]) -> None:
+        with _translate_errors(path):
+            await self.blob_client(path).set_blob_metadata(metadata=metadata)
+
+    async def delete(self, path: str) -> None:
+        try:
+            await self.blob_client(path).delete_blob()
+        except ResourceNotFoundError:
+            pass
+
+    async def _get_user_delegation_key(self, expiry: datetime) -> UserDelegationKey:
+        if (
+            self._user_delegation_key is None
+            or self._user_delegation_key_expiry < expiry
+        ):
+            now = datetime.now(UTC)
+            self._user_delegation_key_expiry = now + USER_DELEGATION_KEY_LIFETIME
+            self._user_delegation_key = (
+                await self._service_client.get_user_delegation_key(
+                    now - SAS_CLOCK_SKEW, self._user_delegation_key_expiry
+                )
+            )
+
+        return self._user_delegation_key
+
+    async def get_read_url(
+        self,
+        path: str,
+        *,
+        content_type: str | None = None,
+        content_disposition: str | None = None,
+    ) -> str | None:
+        """
+        Return a read-only SAS URL for the blob, valid for
+        ``ARTIFACT_DOWNLOAD_SAS_TTL_SECONDS``.
+
+        The SAS is signed with the account key when the client has one (e.g. a
+        connection string, including Azurite), and with a user delegation key
+        when the client authenticates with a token credential. Returns ``None``
+        when the client only holds a SAS token, which cannot sign narrower SAS.
+        """
+        blob = self.blob_client(path)
+        credential = self._service_client.credential
+
+        now = datetime.now(UTC)
+        expiry = now + timedelta(seconds=settings.ARTIFACT_DOWNLOAD_SAS_TTL_SECONDS)
+        signing_key = {}
+        if getattr(credential, "account_key", None):
+            signing_key["account_key"] = credential.account_key
+        elif hasattr(credential, "get_token"):
+            signing_key["user_delegation_key"] = await self._get_user_delegation_key(
+                expiry
+            )
+        else:
+            return None
+
+        sas = generate_blob_sas(
+            account_name=blob.account_name,
+            container_name=blob.container_name,
+            blob_name=blob.blob_name,
+            permission=BlobSasPermissions(read=True),
+            start=now - SAS_CLOCK_SKEW,
+            expiry=expiry,
+            content_type=content_type,
+            content_disposition=content_disposition,
+            **signing_key,
+        )
+        return f"{blob.url}?{sas}"
+
+    async def close(self) -> None:
+        if self._service_client is not None:
+            # Closing the service client closes the transport shared by the
+            # container and blob clients derived from it.
+            await self._service_client.close()
+            self._service_client = None
+            self._container_client = None
+            self._user_delegation_key = None
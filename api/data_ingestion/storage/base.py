@@ -0,0 +1,229 @@
+import inspect
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import BinaryIO
+
+from fastapi import UploadFile
+
+UploadStream = UploadFile | BinaryIO
+UploadData = bytes | UploadStream
+
+
+class StorageError(Exception):
+    """Base class for errors raised by storage backends."""
+
+
+class BlobNotFoundError(StorageError):
+    """The blob does not exist."""
+
+
+class BlobNotModifiedError(StorageError):
+    """The blob still matches the ``if_none_match`` entity tag."""
+
+
+class BlobPreconditionFailedError(StorageError):
+    """The blob no longer matches the ``if_match`` entity tag."""
+
+
+class InvalidRangeError(StorageError):
+    """The requested offset lies beyond the end of the blob."""
+
+
+@dataclass
+class BlobProperties:
+    name: str
+    size: int
+    etag: str | None = None
+    last_modified: datetime | None = None
+    content_type: str | None = None
+    metadata: dict[str, str] = field(default_factory=dict)
+
+
+class BlobDownload:
+    """
+    An open (possibly ranged) blob read.
+
+    ``properties.size`` is the size of the whole blob; ``offset`` and
+    ``length`` describe the bytes this download yields.
+    """
+
+    def __init__(
+        self,
+        properties: BlobProperties,
+        chunks: AsyncIterator[bytes],
+        *,
+        offset: int = 0,
+        length: int | None = None,
+    ):
+        self.properties = properties
+        self.offset = offset
+        self.length = properties.size - offset if length is None else length
+        self._chunks = chunks
+
+    def chunks(self) -> AsyncIterator[bytes]:
+        return self._chunks
+
+    async def readall(self) -> bytes:
+        return b"".join([chunk async for chunk in self._chunks])
+
+    async def aclose(self) -> None:
+        """Stop reading, releasing what an unfinished download holds open."""
+        if (aclose := getattr(self._chunks, "aclose", None)) is not None:
+            await aclose()
+
+
+async def read_chunk(stream: UploadStream, size: int) -> bytes:
+    chunk = stream.read(size)
+    if inspect.isawaitable(chunk):
+        chunk = await chunk
+    return chunk
+
+
+async def iter_upload_data(data: UploadData, chunk_size: int) -> AsyncIterator[bytes]:
+    if isinstance(data, bytes | bytearray | memoryview):
+        for start in range(0, len(data), chunk_size):
+            yield bytes(data[start : start + chunk_size])  # noqa: E203
+        return
+
+    while chunk := await read_chunk(data, chunk_size):
+        yield chunk
+
+
+def check_conditions(
+    properties: BlobProperties,
+    if_none_match: str | None,
+    if_match: str | None,
+) -> None:
+    if if_none_match is not None and if_none_match == properties.etag:
+        raise BlobNotModifiedError(properties.name)
+    if if_match is not None and if_match != properties.etag:
+        raise BlobPreconditionFailedError(properties.name)
+
+
+def resolve_range(
+    properties: BlobProperties, offset: int | None, length: int | None
+) -> tuple[int, int]:
+    """Clamp a requested range to the blob, returning ``(offset, length)``."""
+    if offset is None:
+        return 0, properties.size
+    if offset >= properties.size:
+        raise InvalidRangeError(properties.name)
+    available = properties.size - offset
+    return offset, available if length is None else min(length, available)
+
+
+class StorageBackend(ABC):
+    """
+    Blob storage used by the API.
+
+    Paths are relative to the configured container (or root directory).
+    Missing blobs raise :class:`BlobNotFoundError` from every method except
+    :meth:`exists` and :meth:`delete`.
+    """
+
+    @abstractmethod
+    async def open(
+        self,
+        path: str,
+        *,
+        offset: int | None = None,
+        length: int | None = None,
+        if_none_match: str | None = None,
+        if_match: str | None = None,
+    ) -> BlobDownload:
+        """
+        Start reading a blob, optionally a byte range of it.
+
+        The conditions are checked on the same call as the read:
+        ``if_none_match`` raises :class:`BlobNotModifiedError` if the blob's
+        ETag matches, ``if_match`` raises :class:`BlobPreconditionFailedError`
+        if it does not.
+        """
+
+    async def get(self, path: str) -> bytes:
+        return await (await self.open(path)).readall()
+
+    @abstractmethod
+    async def put(
+        self,
+        path: str,
+        data: UploadData,
+        *,
+        content_type: str | None = None,
+        metadata: dict[str, str] | None = None,
+    ) -> None:
+        """
+        Write a blob, replacing any existing one.
+
+        ``data`` may be bytes or a file object, which is read in chunks from
+        its current position.
+        """
+
+    @abstractmethod
+    async def stage_block(self, path: str, block_id: str, data: bytes) -> None:
+        """
+        Stage one block of a blob without making it visible.
+
+        Staging a block ID again replaces it. Blocks only become the blob's
+        content once they are committed with :meth:`commit_blocks`.
+        """
+
+    @abstractmethod
+    async def staged_blocks(self, path: str) -> dict[str, int]:
+        """Return the uncommitted blocks of a blob as ``{block ID: size}``."""
+
+    @abstractmethod
+    async def commit_blocks(
+        self,
+        path: str,
+        block_ids: list[str],
+        *,
+        content_type: str | None = None,
+        metadata: dict[str, str] | None = None,
+    ) -> None:
+        """
+        Write a blob from its staged blocks, in the given order, replacing any
+        existing one. Staged blocks not in ``block_ids`` are discarded.
+        """
+
+    @abstractmethod
+    async def exists(self, path: str) -> bool:
+        ...
+
+    @abstractmethod
+    async def properties(self, path: str) -> BlobProperties:
+        ...
+
+    @abstractmethod
+    def list(self, prefix: str = "") -> AsyncIterator[BlobProperties]:
+        ...
+
+    @abstractmethod
+    async def set_metadata(self, path: str, metadata: dict[str, str]) -> None:
+        ...
+
+    @abstractmethod
+    async def delete(self, path: str) -> None:
+        """
+        Delete a blob if it exists, and any blocks staged for it. (ADLS drops
+        uncommitted blocks of a blob that was never committed by itself, a
+        week after they were staged.)
+        """
+
+    async def get_read_url(
+        self,
+        path: str,
+        *,
+        content_type: str | None = None,
+        content_disposition: str | None = None,
+    ) -> str | None:
+        """
+        Return a short-lived, read-only URL for the blob, or ``None`` if the
+        backend cannot hand out direct URLs.
+        """
+        return None
+
+    async def close(self) -> None:
+        return None
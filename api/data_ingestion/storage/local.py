@@ -0,0 +1,234 @@
+import asyncio
+import json
+import os
+import shutil
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from pathlib import Path
+from uuid import uuid4
+
+from data_ingestion.storage.base import (
+    BlobDownload,
+    BlobNotFoundError,
+    BlobProperties,
+    StorageBackend,
+    StorageError,
+    UploadData,
+    check_conditions,
+    iter_upload_data,
+    resolve_range,
+)
+
+CHUNK_SIZE = 4 * 2**20
+META_DIR = ".meta"
+BLOCKS_DIR = ".blocks"
+
+
+class LocalFileStorage(StorageBackend):
+    """
+    Storage on the local filesystem, for development and benchmarks.
+
+    Blobs are plain files under ``root``; content type and metadata live in a
+    JSON sidecar under ``root/.meta``, and staged blocks in a directory per
+    blob under ``root/.blocks``.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root.resolve()
+
+    def _file(self, path: str) -> Path:
+        file = (self.root / path).resolve()
+        if not file.is_relative_to(self.root) or file == self.root:
+            raise ValueError(f"Invalid blob path: {path}")
+        return file
+
+    def _meta_file(self, path: str) -> Path:
+        self._file(path)
+        return self.root / META_DIR / f"{path}.json"
+
+    def _read_meta(self, path: str) -> dict:
+        try:
+            return json.loads(self._meta_file(path).read_text())
+        except FileNotFoundError:
+            return {}
+
+    def _write_meta(self, path: str, meta: dict) -> None:
+        meta_file = self._meta_file(path)
+        meta_file.parent.mkdir(parents=True, exist_ok=True)
+        meta_file.write_text(json.dumps(meta))
+
+    def _properties(self, path: str) -> BlobProperties:
+        try:
+            stat = self._file(path).stat()
+        except (FileNotFoundError, NotADirectoryError) as err:
+            raise BlobNotFoundError(path) from err
+
+        meta = self._read_meta(path)
+        return BlobProperties(
+            name=path,
+            size=stat.st_size,
+            etag=f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"',
+            last_modified=datetime.fromtimestamp(stat.st_mtime, UTC),
+            content_type=meta.get("content_type"),
+            metadata=meta.get("metadata", {}),
+        )
+
+    async def open(
+        self,
+        path: str,
+        *,
+        offset: int | None = None,
+        length: int | None = None,
+        if_none_match: str | None = None,
+        if_match: str | None = None,
+    ) -> BlobDownload:
+        properties = await asyncio.to_thread(self._properties, path)
+        check_conditions(properties, if_none_match, if_match)
+        offset, length = resolve_range(properties, offset, length)
+        file = self._file(path)
+
+        async def chunks() -> AsyncIterator[bytes]:
+            handle = await asyncio.to_thread(file.open, "rb")
+            try:
+                await asyncio.to_thread(handle.seek, offset)
+                remaining = length
+                while remaining > 0:
+                    chunk = await asyncio.to_thread(
+                        handle.read, min(CHUNK_SIZE, remaining)
+                    )
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    yield chunk
+            finally:
+                await asyncio.to_thread(handle.close)
+
+        return BlobDownload(properties, chunks(), offset=offset, length=length)
+
+    async def put(
+        self,
+        path: str,
+        data: UploadData,
+        *,
+        content_type: str | None = None,
+        metadata: dict[str, str] | None = None,
+    ) -> None:
+        file = self._file(path)
+        await asyncio.to_thread(file.parent.mkdir, parents=True, exist_ok=True)
+
+        # Write next to the destination and rename, so readers never see a
+        # partially written blob.
+        temp_file = file.with_name(f".{file.name}.{uuid4().hex}.tmp")
+        handle = await asyncio.to_thread(temp_file.open, "wb")
+        try:
+            async for chunk in iter_upload_data(data, CHUNK_SIZE):
+                await asyncio.to_thread(handle.write, chunk)
+        except BaseException:
+            await asyncio.to_thread(handle.close)
+            await asyncio.to_thread(temp_file.unlink, missing_ok=True)
+            raise
+        await asyncio.to_thread(handle.close)
+        await asyncio.to_thread(os.replace, temp_file, file)
+
+        await asyncio.to_thread(
+            self._write_meta,
+            path,
+            {"content_type": content_type, "metadata": dict(metadata or {})},
+        )
+
+    def _blocks_dir(self, path: str) -> Path:
+        self._file(path)
+        return self.root / BLOCKS_DIR / path
+
+    async def stage_block(self, path: str, block_id: str, data: bytes) -> None:
+        blocks_dir = self._blocks_dir(path)
+        await asyncio.to_thread(blocks_dir.mkdir, parents=True, exist_ok=True)
+        await asyncio.to_thread((blocks_dir / block_id).write_bytes, data)
+
+    def _staged_blocks(self, path: str) -> dict[str, int]:
+        blocks_dir = self._blocks_dir(path)
+        if not blocks_dir.is_dir():
+            return {}
+        return {block.name: block.stat().st_size for block in blocks_dir.iterdir()}
+
+    async def staged_blocks(self, path: str) -> dict[str, int]:
+        return await asyncio.to_thread(self._staged_blocks, path)
+
+    def _commit_blocks(self, path: str, block_ids: list[str], meta: dict) -> None:
+        blocks_dir = self._blocks_dir(path)
+        missing = [
+            block_id for block_id in block_ids if not (blocks_dir / block_id).is_file()
+        ]
+        if missing:
+            raise StorageError(f"Blocks {missing} of {path} are not staged")
+
+        file = self._file(path)
+        file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = file.with_name(f".{file.name}.{uuid4().hex}.tmp")
+        try:
+            with temp_file.open("wb") as handle:
+                for block_id in block_ids:
+                    with (blocks_dir / block_id).open("rb") as block:
+                        shutil.copyfileobj(block, handle)
+        except BaseException:
+            temp_file.unlink(missing_ok=True)
+            raise
+        os.replace(temp_file, file)
+        self._write_meta(path, meta)
+        shutil.rmtree(blocks_dir, ignore_errors=True)
+
+    async def commit_blocks(
+        self,
+        path: str,
+        block_ids: list[str],
+        *,
+        content_type: str | None = None,
+        metadata: dict[str, str] | None = None,
+    ) -> None:
+        await asyncio.to_thread(
+            self._commit_blocks,
+            path,
+            block_ids,
+            {"content_type": content_type, "metadata": dict(metadata or {})},
+        )
+
+    async def exists(self, path: str) -> bool:
+        return await asyncio.to_thread(self._file(path).is_file)
+
+    async def properties(self, path: str) -> BlobProperties:
+        return await asyncio.to_thread(self._properties, path)
+
+    def _list(self, prefix: str) -> list[str]:
+        paths = []
+        for directory, dirnames, filenames in os.walk(self.root):
+            if Path(directory) == self.root:
+                dirnames[:] = [
+                    name for name in dirnames if name not in (META_DIR, BLOCKS_DIR)
+                ]
+            for filename in filenames:
+                path = (Path(directory) / filename).relative_to(self.root).as_posix()
+                if path.startswith(prefix) and not filename.endswith(".tmp"):
+                    paths.append(path)
+        return sorted(paths)
+
+    async def list(self, prefix: str = "") -> AsyncIterator[BlobProperties]:
+        for path in await asyncio.to_thread(self._list, prefix):
+            try:
+                yield await self.properties(path)
+            except BlobNotFoundError:
+                continue
+
+    async def set_metadata(self, path: str, metadata: dict[str, str]) -> None:
+        await self.properties(path)
+        meta = await asyncio.to_thread(self._read_meta, path)
+        meta["metadata"] = dict(metadata)
+        await asyncio.to_thread(self._write_meta, path, meta)
+        # Metadata changes produce a new ETag, as in ADLS.
+        await asyncio.to_thread(os.utime, self._file(path))
+
+    async def delete(self, path: str) -> None:
+        await asyncio.to_thread(self._file(path).unlink, missing_ok=True)
+        await asyncio.to_thread(self._meta_file(path).unlink, missing_ok=True)
+        await asyncio.to_thread(
+            shutil.rmtree, self._blocks_dir(path), ignore_errors=True
+        )
@@ -0,0 +1,126 @@
+import itertools
+from collections.abc import AsyncIterator
+from dataclasses import replace
+from datetime import UTC, datetime
+
+from data_ingestion.storage.base import (
+    BlobDownload,
+    BlobNotFoundError,
+    BlobProperties,
+    StorageBackend,
+    StorageError,
+    UploadData,
+    check_conditions,
+    iter_upload_data,
+    resolve_range,
+)
+
+CHUNK_SIZE = 4 * 2**20
+
+
+class InMemoryStorage(StorageBackend):
+    """Process-local storage for tests and benchmarks. Nothing is persisted."""
+
+    def __init__(self):
+        self._blobs: dict[str, tuple[BlobProperties, bytes]] = {}
+        self._staged: dict[str, dict[str, bytes]] = {}
+        self._versions = itertools.count(1)
+
+    def _get(self, path: str) -> tuple[BlobProperties, bytes]:
+        try:
+            return self._blobs[path]
+        except KeyError as err:
+            raise BlobNotFoundError(path) from err
+
+    def _new_etag(self) -> str:
+        return f'"0x{next(self._versions):X}"'
+
+    async def open(
+        self,
+        path: str,
+        *,
+        offset: int | None = None,
+        length: int | None = None,
+        if_none_match: str | None = None,
+        if_match: str | None = None,
+    ) -> BlobDownload:
+        properties, data = self._get(path)
+        check_conditions(properties, if_none_match, if_match)
+        offset, length = resolve_range(properties, offset, length)
+
+        async def chunks() -> AsyncIterator[bytes]:
+            end = offset + length
+            for start in range(offset, end, CHUNK_SIZE):
+                yield data[start : min(start + CHUNK_SIZE, end)]  # noqa: E203
+
+        return BlobDownload(replace(properties), chunks(), offset=offset, length=length)
+
+    async def put(
+        self,
+        path: str,
+        data: UploadData,
+        *,
+        content_type: str | None = None,
+        metadata: dict[str, str] | None = None,
+    ) -> None:
+        content = b"".join(
+            [chunk async for chunk in iter_upload_data(data, CHUNK_SIZE)]
+        )
+        self._blobs[path] = (
+            BlobProperties(
+                name=path,
+                size=len(content),
+                etag=self._new_etag(),
+                last_modified=datetime.now(UTC),
+                content_type=content_type,
+                metadata=dict(metadata or {}),
+            ),
+            content,
+        )
+
+    async def stage_block(self, path: str, block_id: str, data: bytes) -> None:
+        self._staged.setdefault(path, {})[block_id] = bytes(data)
+
+    async def staged_blocks(self, path: str) -> dict[str, int]:
+        return {
+            block_id: len(data) for block_id, data in self._staged.get(path, {}).items()
+        }
+
+    async def commit_blocks(
+        self,
+        path: str,
+        block_ids: list[str],
+        *,
+        content_type: str | None = None,
+        metadata: dict[str, str] | None = None,
+    ) -> None:
+        staged = self._staged.get(path, {})
+        missing = [block_id for block_id in block_ids if block_id not in staged]
+        if missing:
+            raise StorageError(f"Blocks {missing} of {path} are not staged")
+
+        content = b"".join(staged[block_id] for block_id in block_ids)
+        del self._staged[path]
+        await self.put(path, content, content_type=content_type, metadata=metadata)
+
+    async def exists(self, path: str) -> bool:
+        return path in self._blobs
+
+    async def properties(self, path: str) -> BlobProperties:
+        return replace(self._get(path)[0])
+
+    async def list(self, prefix: str = "") -> AsyncIterator[BlobProperties]:
+        for path in sorted(self._blobs):
+            if path.startswith(prefix):
+                yield replace(self._blobs[path][0])
+
+    async def set_metadata(self, path: str, metadata: dict[str, str]) -> None:
+        properties, content = self._get(path)
+        self._blobs[path] = (
+            replace(properties, metadata=dict(metadata), etag=self._new_etag()),
+            content,
+        )
+
+    async def delete(self, path: str) -> None:
+        self._blobs.pop(path, None)
+        self._staged.pop(path, None)
@@ -0,0 +1,84 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from threading import Lock
+
+from azure.core.pipeline import PipelineRequest
+from azure.core.pipeline.policies import SansIOHTTPPolicy
+
+
+@dataclass
+class StorageCallCounter:
+    """Storage round trips made while handling one request."""
+
+    calls: int = 0
+
+
+@dataclass
+class StorageCallStats:
+    """Storage round trips per request, aggregated over one route."""
+
+    requests: int = 0
+    calls: int = 0
+    max_calls: int = 0
+
+    @property
+    def mean_calls(self) -> float:
+        return self.calls / self.requests if self.requests else 0.0
+
+
+# A mutable counter rather than an int, so that calls made from tasks spawned
+# while handling the request (which run in a copy of the context) still count.
+_current_counter: ContextVar[StorageCallCounter | None] = ContextVar(
+    "storage_call_counter", default=None
+)
+_route_stats: dict[str, StorageCallStats] = {}
+_route_stats_lock = Lock()
+
+
+def record_storage_call() -> None:
+    """Count one storage round trip against the current request, if any."""
+    counter = _current_counter.get()
+    if counter is not None:
+        counter.calls += 1
+
+
+@contextmanager
+def track_storage_calls() -> Iterator[StorageCallCounter]:
+    """Count the storage round trips made inside the block."""
+    counter = StorageCallCounter()
+    token = _current_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _current_counter.reset(token)
+
+
+def observe_storage_calls(route: str, calls: int) -> None:
+    with _route_stats_lock:
+        stats = _route_stats.setdefault(route, StorageCallStats())
+        stats.requests += 1
+        stats.calls += calls
+        stats.max_calls = max(stats.max_calls, calls)
+
+
+def get_storage_call_stats() -> dict[str, dict[str, float]]:
+    """Return per-route storage call statistics for this process."""
+    with _route_stats_lock:
+        return {
+            route: {**asdict(stats), "mean_calls": stats.mean_calls}
+            for route, stats in sorted(_route_stats.items())
+        }
+
+
+def reset_storage_call_stats() -> None:
+    with _route_stats_lock:
+        _route_stats.clear()
+
+
+class StorageCallCountPolicy(SansIOHTTPPolicy):
+    """Azure SDK pipeline policy counting every HTTP request sent to ADLS."""
+
+    def on_request(self, request: PipelineRequest) -> None:
+        record_storage_call()
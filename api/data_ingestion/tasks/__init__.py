@@ -1,4 +1,12 @@
 from .file_upload import file_upload_dq_checks_timeout
+from .fuzzy_match import update_fuzzy_match_config
 from .update_schema import update_schemas, update_schemas_list
+from .upload_session import delete_expired_upload_sessions_task
 
-__all__ = ["update_schemas", "update_schemas_list", "file_upload_dq_checks_timeout"]
+__all__ = [
+    "update_schemas",
+    "update_schemas_list",
+    "update_fuzzy_match_config",
+    "file_upload_dq_checks_timeout",
+    "delete_expired_upload_sessions_task",
+]
@@ -0,0 +1,19 @@
+from asgiref.sync import async_to_sync
+
+from data_ingestion.celery import celery
+from data_ingestion.utils.fuzzy_matching import refresh_fuzzy_match_config
+from data_ingestion.utils.nocodb import close_nocodb_client
+
+
+async def _refresh_fuzzy_match_config():
+    # Each call runs on a fresh event loop; don't leave its client behind.
+    try:
+        return await refresh_fuzzy_match_config()
+    finally:
+        await close_nocodb_client()
+
+
+@celery.task(name="data_ingestion.tasks.update_fuzzy_match_config")
+def update_fuzzy_match_config():
+    config = async_to_sync(_refresh_fuzzy_match_config)()
+    return sorted(config)
@@ -5,13 +5,17 @@ from fastapi.encoders import jsonable_encoder
 from data_ingestion.cache.keys import SCHEMAS_KEY, get_schema_key
 from data_ingestion.cache.serde import get_cache_list, set_cache_list, set_cache_string
 from data_ingestion.celery import celery
-from data_ingestion.db.trino import get_db_context
+from data_ingestion.db.trino import get_async_db_context, get_db_context
 from data_ingestion.internal.schema import get_schema, get_schemas
 
 
+async def _get_schemas() -> list[str]:
+    async with get_async_db_context() as db:
+        return await get_schemas(db)
+
+
 def get_schema_list() -> list[str]:
-    with get_db_context() as db:
-        return async_to_sync(get_schemas)(db)
+    return async_to_sync(_get_schemas)()
 
 
 @celery.task(name="data_ingestion.tasks.update_schemas_list")
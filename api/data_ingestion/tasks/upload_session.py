@@ -0,0 +1,22 @@
+from asgiref.sync import async_to_sync
+from loguru import logger
+
+from data_ingestion.celery import celery
+from data_ingestion.internal.upload_sessions import delete_expired_upload_sessions
+from data_ingestion.settings import settings
+from data_ingestion.storage import create_storage
+
+
+async def _delete_expired_upload_sessions() -> int:
+    # Each run gets its own event loop, so it also gets its own client.
+    storage = create_storage(settings.STORAGE_BACKEND)
+    try:
+        return await delete_expired_upload_sessions(storage)
+    finally:
+        await storage.close()
+
+
+@celery.task(name="data_ingestion.tasks.delete_expired_upload_sessions")
+def delete_expired_upload_sessions_task():
+    deleted = async_to_sync(_delete_expired_upload_sessions)()
+    logger.info(f"Deleted {deleted} expired upload session blobs")
@@ -1,16 +1,49 @@
 """
 Utility for serving DQ Kit ZIP files in the ingestion API.
-Tries to serve the pre-generated ZIP from Dagster first
+Tries to serve the pre-generated ZIP from Dagster first, and otherwise streams
+a ZIP assembled on the fly from the individual artifacts.
 """
 
+import asyncio
 import io
+import zipfile
+from collections.abc import AsyncIterator
 from pathlib import Path
 
 from loguru import logger
 
-from azure.core.exceptions import ResourceNotFoundError
-from data_ingestion.internal.storage import storage_client
 from data_ingestion.models.file_upload import FileUpload
+from data_ingestion.storage import BlobDownload, BlobNotFoundError, get_storage
+
+# Folder inside the kit for each artifact in ``DQKitManager._file_paths``.
+ARTIFACT_FOLDERS = {
+    "raw_data": "raw_data",
+    "dq_summary_json": "dq_summary",
+    "dq_report_txt": "dq_report",
+    "passed_rows": "passed_rows",
+    "failed_rows": "failed_rows",
+    "dq_full_report": "dq_full_report",
+    "map_html": "map",
+}
+
+
+class _ZipSink(io.RawIOBase):
+    """Unseekable file object that buffers ZIP output until it is drained."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
 
 
 class DQKitManager:
@@ -26,24 +59,6 @@ class DQKitManager:
         else:
             self.stem = Path(file_upload.original_filename or "").stem
 
-    @staticmethod
-    def _get_blob_if_exists(blob_path: str | None) -> bytes | None:
-        if not blob_path:
-            return None
-        try:
-            blob_client = storage_client.get_blob_client(blob_path)
-            if blob_client.exists():
-                logger.info(f"Found file: {blob_path}")
-                return blob_client.download_blob().readall()
-            logger.warning(f"File not found: {blob_path}")
-            return None
-        except ResourceNotFoundError:
-            logger.warning(f"File not found: {blob_path}")
-            return None
-        except Exception as e:
-            logger.error(f"Error downloading {blob_path}: {e}")
-            return None
-
     @property
     def _dataset_prefix(self) -> str:
         return (
@@ -74,35 +89,80 @@ class DQKitManager:
             "map_html": f"{dq_root}/dq-map/{country}/school_map_{country}_{stem}.html",
         }
 
+    def prebuilt_zip_path(self) -> str:
+        """Return the blob path of the ZIP pre-built by Dagster for this upload."""
+        return self._file_paths()["prebuilt_zip"]  # type: ignore[return-value]
+
     def map_blob_path(self) -> str:
         """Return the conventional map HTML blob path for this upload."""
         return self._file_paths()["map_html"]  # type: ignore[return-value]
 
-    def generate_zip(self) -> io.BytesIO:
+    def artifacts(self) -> list[tuple[str, str]]:
+        """Return ``(archive name, blob path)`` for every possible kit artifact."""
+        return [
+            (f"{ARTIFACT_FOLDERS[key]}/{Path(path).name}", path)
+            for key, path in self._file_paths().items()
+            if key in ARTIFACT_FOLDERS and path
+        ]
+
+    async def has_artifacts(self, artifacts: list[tuple[str, str]]) -> bool:
+        """Tell whether any of the artifacts exists, without reading them."""
+        storage = get_storage()
+        found = await asyncio.gather(*(storage.exists(path) for _, path in artifacts))
+        return any(found)
+
+    async def stream_zip(
+        self, artifacts: list[tuple[str, str]]
+    ) -> AsyncIterator[bytes]:
         """
-        Return ZIP bytes. Prefers the pre-built ZIP from Dagster; otherwise
-        builds one on-demand from the available artifacts.
-        """
-        paths = self._file_paths()
-
-        # Fast path: pre-built ZIP already exists
-        if prebuilt := self._get_blob_if_exists(paths["prebuilt_zip"]):
-            logger.info("Serving pre-built DQ Kit ZIP from Dagster")
-            buffer = io.BytesIO(prebuilt)
-            buffer.seek(0)
-            return buffer
+        Stream a ZIP of the given artifacts.
 
-        logger.info("Pre-built DQ Kit not found. Building on-demand.")
-        return None
+        Each artifact is opened only once the writer reaches it, and its
+        chunks are compressed into the archive as they arrive, so neither the
+        artifacts nor the archive are held in memory in full. Missing
+        artifacts are skipped on the read itself, without a separate
+        existence check; if none exist, nothing is yielded at all.
+        """
+        storage = get_storage()
+        sink = _ZipSink()
+        written = 0
+        with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            for name, path in artifacts:
+                try:
+                    stream = await storage.open(path)
+                except BlobNotFoundError:
+                    logger.warning(f"File not found: {path}")
+                    continue
+
+                try:
+                    info = zipfile.ZipInfo(name, _zip_timestamp(stream))
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                    # Lets zipfile decide up front whether ZIP64 is needed.
+                    info.file_size = stream.length
+                    with zf.open(info, "w") as entry:
+                        async for chunk in stream.chunks():
+                            await asyncio.to_thread(entry.write, chunk)
+                            if data := sink.drain():
+                                yield data
+                finally:
+                    await stream.aclose()
+
+                written += 1
+                if data := sink.drain():
+                    yield data
+
+        if written:
+            yield sink.drain()
 
     def get_zip_filename(self) -> str:
         return f"DQ_Kit_{self.country}_{self.dataset}_{self.file_upload.id}.zip"
 
 
-def generate_dq_kit_zip(file_upload: FileUpload) -> tuple[io.BytesIO, str]:
-    """Convenience function returning (zip_buffer, filename)."""
-    generator = DQKitManager(file_upload)
-    return generator.generate_zip(), generator.get_zip_filename()
+def _zip_timestamp(stream: BlobDownload) -> tuple[int, int, int, int, int, int]:
+    modified = stream.properties.last_modified
+    if modified is None or modified.year < 1980:
+        return (1980, 1, 1, 0, 0, 0)
+    return modified.timetuple()[:6]
 
 
 def get_map_blob_path(file_upload: FileUpload) -> str:
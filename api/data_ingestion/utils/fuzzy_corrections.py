@@ -0,0 +1,271 @@
+"""
+Streaming rewriters that apply confirmed fuzzy-match corrections to an upload.
+
+Corrections are ``{column name: {value found: replacement}}``. Only cells of
+the corrected columns are ever decoded; everything else is passed through, so
+a corrected upload differs from the original only in the replaced cells.
+"""
+
+import asyncio
+import csv
+import re
+from collections.abc import Callable, Iterator
+from typing import BinaryIO
+
+import openpyxl
+
+from data_ingestion.utils.xlsx import cell_text, header_names
+
+ColumnReplacements = dict[str, dict[str, str]]
+ColumnNames = Callable[[list], list[str]]
+
+# Corrected CSV is handed to the uploader in batches of about this size.
+CSV_BATCH_SIZE = 2**20
+
+_CSV_SPECIAL = re.compile(rb'[,"]')
+_CSV_NEEDS_QUOTES = re.compile(rb'[,"\r\n]')
+
+
+def _scan_csv(data: bytes, quoted: bool = False) -> tuple[list[int], bool]:
+    """
+    Scan ``data`` with the parser's quoting rules and return the offsets of
+    its field separators and whether a quoted field is still open at the end.
+
+    As in pyarrow's reader, a quote opens a quoted field only at the start of
+    a field, elsewhere it is a literal character; inside a quoted field ``""``
+    is an escaped quote. ``quoted`` tells whether ``data`` starts inside one.
+    """
+    separators = []
+    field_start = pos = 0
+    while True:
+        if quoted:
+            end = data.find(b'"', pos)
+            if end < 0:
+                return separators, True
+            if data[end + 1 : end + 2] == b'"':
+                pos = end + 2
+            else:
+                quoted = False
+                pos = end + 1
+            continue
+
+        match = _CSV_SPECIAL.search(data, pos)
+        if match is None:
+            return separators, False
+        if match.group() == b",":
+            separators.append(match.start())
+            field_start = match.end()
+        else:
+            quoted = match.start() == field_start
+        pos = match.end()
+
+
+def _iter_csv_records(source: BinaryIO) -> Iterator[bytes]:
+    """
+    Yield raw CSV records, terminator included; quoted fields may span lines.
+
+    Raises ``ValueError`` at the end of the file if a quoted field was never
+    closed, as the parser would reject the file then.
+    """
+    pending: list[bytes] = []
+    quoted = False
+    for line in source:
+        pending.append(line)
+        _, quoted = _scan_csv(line, quoted)
+        if not quoted:
+            yield b"".join(pending)
+            pending.clear()
+    if quoted:
+        raise ValueError("CSV has a quoted field that is never closed")
+    if pending:
+        yield b"".join(pending)
+
+
+def check_csv_quotes(source: BinaryIO) -> None:
+    """
+    Raise ``ValueError`` if a quoted field of the CSV in ``source`` is never
+    closed, then rewind ``source`` to where it was.
+
+    Run before :func:`iter_corrected_csv`, so a malformed file is uploaded
+    unchanged rather than corrected only up to the open quote.
+    """
+    start = source.tell()
+    try:
+        for _ in _iter_csv_records(source):
+            pass
+    finally:
+        source.seek(start)
+
+
+def _split_terminator(record: bytes) -> tuple[bytes, bytes]:
+    if record.endswith(b"\r\n"):
+        return record[:-2], b"\r\n"
+    if record.endswith(b"\n"):
+        return record[:-1], b"\n"
+    return record, b""
+
+
+def _split_csv_fields(body: bytes) -> list[bytes]:
+    """Split a record into its raw fields, quotes and escapes left in place."""
+    if b'"' not in body:
+        return body.split(b",")
+
+    separators, _ = _scan_csv(body)
+    starts = [0, *(separator + 1 for separator in separators)]
+    ends = [*separators, len(body)]
+    return [body[start:end] for start, end in zip(starts, ends, strict=True)]
+
+
+def _unquote_csv_field(field: bytes) -> bytes:
+    if len(field) >= 2 and field.startswith(b'"') and field.endswith(b'"'):
+        return field[1:-1].replace(b'""', b'"')
+    return field
+
+
+def _quote_csv_field(value: bytes) -> bytes:
+    if _CSV_NEEDS_QUOTES.search(value):
+        return b'"' + value.replace(b'"', b'""') + b'"'
+    return value
+
+
+def _csv_header_names(header: bytes, column_names: ColumnNames) -> list[str]:
+    body, _ = _split_terminator(header)
+    text = body.decode("utf-8-sig", errors="replace")
+    return column_names(next(csv.reader([text]), []))
+
+
+def iter_corrected_csv(
+    source: BinaryIO,
+    column_replacements: ColumnReplacements,
+    column_names: ColumnNames,
+) -> Iterator[bytes]:
+    """
+    Yield the CSV in ``source`` with the replacements applied, in batches.
+
+    Records are rewritten only if one of their corrected cells changes, and
+    then only that cell is re-encoded (quoted if it needs to be); every other
+    byte, including quoting, line endings and a byte order mark, is copied
+    from the source as is. ``column_names`` names the header fields the same
+    way the parser does, so corrections find the columns the user saw.
+    """
+    records = _iter_csv_records(source)
+    header = next(records, None)
+    if header is None:
+        return
+
+    names = _csv_header_names(header, column_names)
+    targets = {
+        index: {
+            old.encode(): _quote_csv_field(new.encode())
+            for old, new in column_replacements[name].items()
+        }
+        for index, name in enumerate(names)
+        if name in column_replacements
+    }
+
+    batch = [header]
+    size = len(header)
+    for record in records:
+        fields = None
+        for index, replacements in targets.items():
+            if fields is None:
+                body, terminator = _split_terminator(record)
+                fields = _split_csv_fields(body)
+            if index < len(fields):
+                replacement = replacements.get(_unquote_csv_field(fields[index]))
+                if replacement is not None:
+                    fields[index] = replacement
+                    record = b",".join(fields) + terminator
+
+        batch.append(record)
+        size += len(record)
+        if size >= CSV_BATCH_SIZE:
+            yield b"".join(batch)
+            batch.clear()
+            size = 0
+
+    if batch:
+        yield b"".join(batch)
+
+
+class CorrectedCsvStream:
+    """
+    Async file object over :func:`iter_corrected_csv`, for ``storage.put``.
+
+    The rewrite runs lazily as the uploader reads, one worker-thread call per
+    read, so the corrected file is never held in memory in full and the event
+    loop is not blocked while it is produced.
+    """
+
+    def __init__(
+        self,
+        source: BinaryIO,
+        column_replacements: ColumnReplacements,
+        column_names: ColumnNames,
+    ):
+        self._chunks = iter_corrected_csv(source, column_replacements, column_names)
+        self._buffer = bytearray()
+
+    def _read(self, size: int) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+
+        size = len(self._buffer) if size < 0 else size
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    async def read(self, size: int = -1) -> bytes:
+        return await asyncio.to_thread(self._read, size)
+
+
+def write_corrected_xlsx(
+    source: BinaryIO,
+    column_replacements: ColumnReplacements,
+    column_names: ColumnNames,
+    destination: BinaryIO,
+) -> None:
+    """
+    Copy the workbook in ``source`` to ``destination`` with the replacements
+    applied to the first sheet.
+
+    Rows are streamed from a read-only workbook into a write-only one, so the
+    workbook is never loaded in full. Cells keep their values and types,
+    including formulas; only cells whose text, read as :mod:`.xlsx` reads it,
+    matches a replacement change.
+    Other sheets are copied as they are.
+    """
+    workbook = openpyxl.load_workbook(source, read_only=True)
+    corrected = openpyxl.Workbook(write_only=True)
+    try:
+        for sheet_index, sheet in enumerate(workbook.worksheets):
+            target = corrected.create_sheet(sheet.title)
+            rows = sheet.iter_rows(values_only=True)
+            if sheet_index > 0:
+                for row in rows:
+                    target.append(row)
+                continue
+
+            header = next(rows, ())
+            target.append(header)
+            targets = {
+                index: column_replacements[name]
+                for index, name in enumerate(header_names(header, column_names))
+                if name in column_replacements
+            }
+
+            for row in rows:
+                row = list(row)
+                for index, replacements in targets.items():
+                    if index < len(row):
+                        # Matched on the text the parser read, so 7.0 is "7".
+                        text = cell_text(row[index])
+                        row[index] = replacements.get(text, row[index])
+                target.append(row)
+    finally:
+        workbook.close()
+
+    corrected.save(destination)
@@ -1,12 +1,26 @@
+import asyncio
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+import orjson
 import pandas as pd
 from rapidfuzz import fuzz, process, utils
 
+from data_ingestion.cache.keys import FUZZY_MATCH_CONFIG_KEY
+from data_ingestion.cache.local import LocalCache
+from data_ingestion.cache.serde import get_cache_bytes, set_cache_string
+from data_ingestion.constants import constants
 from data_ingestion.settings import logger, settings
-from data_ingestion.utils.nocodb import get_nocodb_table_rows
+from data_ingestion.utils.nocodb import fetch_nocodb_table_rows
 
 UNKNOWN_VALUES = ("unknown", "nan", "none")
 NULL_VAL_DISPLAY = ("nan", "none", "")
 
+# The config is kept in this process as matchers, built when it is loaded.
+_fuzzy_matchers_cache: LocalCache[dict[str, "FuzzyMatcher"]] = LocalCache(
+    1, constants.FUZZY_MATCH_CONFIG_LOCAL_TTL_SECONDS
+)
+
 
 def extract_valid_values_from_rows(
     rows: list[dict], target_column: str
@@ -18,6 +32,7 @@ def extract_valid_values_from_rows(
     """
     standardized_list = []
     matching_map = {}
+    seen = set()
 
     for r in rows:
         val = r.get(target_column)
@@ -25,130 +40,265 @@ def extract_valid_values_from_rows(
             continue
 
         val_str = str(val).strip()
-        original_compound = val_str
+        val_key = val_str.lower()
 
-        matching_map[original_compound.lower()] = original_compound
-        if original_compound.lower() not in [s.lower() for s in standardized_list]:
-            standardized_list.append(original_compound)
+        matching_map[val_key] = val_str
+        if val_key not in seen:
+            seen.add(val_key)
+            standardized_list.append(val_str)
 
-    seen = set()
-    final_std = []
-    for s in standardized_list:
-        if s.lower() not in seen:
-            seen.add(s.lower())
-            final_std.append(s)
+    standardized_list.sort()
+
+    return standardized_list, matching_map
+
+
+@dataclass(frozen=True)
+class FuzzyMatcher:
+    """
+    The valid values of a schema column, prepared once for matching.
+
+    ``dropdown_options`` and ``matching_map`` are the column's fuzzy match
+    config; the rest is derived from them: the options offered in the UI,
+    the case-insensitive exact matches, and the match targets already
+    normalized with ``utils.default_process``.
+    """
+
+    dropdown_options: list[str]
+    matching_map: dict[str, str]
+    options: list[str] = field(init=False)
+    exact_matches: dict[str, str] = field(init=False)
+    targets: list[str] = field(init=False)
+    processed_targets: list[str] = field(init=False)
+
+    def __post_init__(self):
+        # Always include "Unknown" in dropdown options so it's selectable
+        options = sorted(set(self.dropdown_options))
+        if "Unknown" not in options:
+            options.append("Unknown")
+
+        # Case-insensitive exact matches; the first valid value wins, as listed.
+        exact_matches: dict[str, str] = {}
+        for v in self.dropdown_options:
+            exact_matches.setdefault(v.strip().lower(), v)
+
+        targets = list(self.matching_map.keys())
+        object.__setattr__(self, "options", options)
+        object.__setattr__(self, "exact_matches", exact_matches)
+        object.__setattr__(self, "targets", targets)
+        object.__setattr__(
+            self, "processed_targets", [utils.default_process(t) for t in targets]
+        )
+
+    @property
+    def config(self) -> dict:
+        return {
+            "dropdown_options": self.dropdown_options,
+            "matching_map": self.matching_map,
+        }
+
+    def suggest(
+        self, values: list[str], score_cutoff: float = 60.0
+    ) -> list[tuple[str, bool]]:
+        """
+        Returns (suggested_value, was_changed) for each of ``values``.
+
+        Scores every value against every target with one ``process.cdist``
+        call per scorer, token_sort_ratio and token_set_ratio (to avoid
+        shorter-string bias), spread over ``FUZZY_MATCH_WORKERS`` threads.
+        """
+        results: list[tuple[str, bool] | None] = [None] * len(values)
+        pending = []
+        for index, val in enumerate(values):
+            # Pre-check: If 'unknown' is in the input string, automatically suggest 'Unknown'
+            if "unknown" in val.strip().lower():
+                results[index] = ("Unknown", True)
+            else:
+                pending.append(index)
+
+        if not (pending and self.targets):
+            return [
+                result or (val, False)
+                for val, result in zip(values, results, strict=True)
+            ]
+
+        # Values that only differ in case or punctuation are scored once.
+        queries = [utils.default_process(values[index]) for index in pending]
+        query_rows = {query: row for row, query in enumerate(dict.fromkeys(queries))}
+
+        # Pass 1: token_sort_ratio for overall string similarity.
+        # Pass 2: token_set_ratio to find cases where tokens perfectly overlap.
+        sort_scores, set_scores = (
+            process.cdist(
+                list(query_rows),
+                self.processed_targets,
+                scorer=scorer,
+                dtype="float64",
+                workers=constants.FUZZY_MATCH_WORKERS,
+            )
+            for scorer in (fuzz.token_sort_ratio, fuzz.token_set_ratio)
+        )
+        # argmax picks the first of equal scores, as process.extract ranks them.
+        best = list(
+            zip(
+                sort_scores.argmax(axis=1).tolist(),
+                sort_scores.max(axis=1).tolist(),
+                set_scores.argmax(axis=1).tolist(),
+                set_scores.max(axis=1).tolist(),
+                strict=True,
+            )
+        )
+
+        for index, query in zip(pending, queries, strict=True):
+            best_sort, best_sort_score, best_set, best_set_score = best[
+                query_rows[query]
+            ]
+            val = values[index]
+            str_val = val.strip()
+            best_sort_target = self.targets[best_sort]
+            best_set_target = self.targets[best_set]
+
+            # Decision logic:
+            # 1. If we have a very high token_sort_ratio (> 80), it's likely a match or a typo.
+            if best_sort_score >= 80:
+                matched_target = best_sort_target
+                score = best_sort_score
+            # 2. If token_set_ratio is perfect (100) and sort_ratio is decent (> 60),
+            # it's likely a compound match or a specific subset.
+            elif best_set_score == 100 and best_sort_score >= 60:
+                matched_target = best_set_target
+                score = best_set_score
+            # 3. Fallback to the best sort match if it's above a safe threshold
+            elif best_sort_score >= score_cutoff:
+                matched_target = best_sort_target
+                score = best_sort_score
+            else:
+                # If the best match is very weak, don't suggest it unless it's at least better than 50
+                if best_sort_score < 50:
+                    results[index] = ("Unknown", True)
+                else:
+                    results[index] = (val, False)
+                continue
 
-    final_std.sort()
+            suggested_val = self.matching_map[matched_target]
+            results[index] = (suggested_val, suggested_val.lower() != str_val.lower())
+            logger.debug(
+                f"Fuzzy Match: '{str_val}' -> '{matched_target}' ({score:.2f}%)"
+            )
+
+        return results
 
-    return final_std, matching_map
 
+def build_fuzzy_matchers(config: dict[str, dict]) -> dict[str, FuzzyMatcher]:
+    return {
+        column: FuzzyMatcher(entry["dropdown_options"], entry["matching_map"])
+        for column, entry in config.items()
+    }
 
-def get_fuzzy_match_config_from_nocodb() -> dict[str, dict]:
+
+async def _fetch_column_config(col_name: str, table_id: str) -> dict | None:
+    try:
+        table_rows = await fetch_nocodb_table_rows(table_id, fields="Govt")
+    except Exception as e:
+        logger.warning(f"Failed to fetch fuzzy match config for {col_name}: {e}")
+        return None
+
+    dropdown_options, matching_map = extract_valid_values_from_rows(table_rows, "Govt")
+    if not dropdown_options:
+        logger.warning(
+            f"No valid values found in NocoDB table {table_id} for {col_name}"
+        )
+        return None
+    return {"dropdown_options": dropdown_options, "matching_map": matching_map}
+
+
+async def get_fuzzy_match_config_from_nocodb() -> dict[str, dict]:
     """
     Fetches valid values for fuzzy matching from NocoDB.
     Returns a dictionary where keys are column names (e.g. 'electricity_type_govt')
     and values are dicts containing 'dropdown_options' and 'matching_map'.
+    The value tables of all columns are fetched concurrently.
     """
-    config = {}
     try:
-        rows = get_nocodb_table_rows(
+        rows = await fetch_nocodb_table_rows(
             settings.NOCODB_NAME_MAPPINGS_TABLE_ID,
             where="(column_name,notblank)",
             fields="column_name,table_id",
         )
-        for row in rows:
-            col_name = row.get("column_name", "")
-            table_id = row.get("table_id", "")
-
-            if not (col_name and table_id):
-                continue
-
-            try:
-                table_rows = get_nocodb_table_rows(table_id, fields="Govt")
-                dropdown_options, matching_map = extract_valid_values_from_rows(
-                    table_rows, "Govt"
-                )
-
-                if dropdown_options:
-                    config[col_name] = {
-                        "dropdown_options": dropdown_options,
-                        "matching_map": matching_map,
-                    }
-                else:
-                    logger.warning(
-                        f"No valid values found in NocoDB table {table_id} for {col_name}"
-                    )
-            except Exception as e:
-                logger.warning(
-                    f"Failed to fetch fuzzy match config for {col_name}: {e}"
-                )
     except Exception as e:
         logger.error(f"Error connecting to NocoDB for fuzzy match config: {e}")
+        return {}
+
+    tables = {
+        col_name: table_id
+        for row in rows
+        if (col_name := row.get("column_name", ""))
+        and (table_id := row.get("table_id", ""))
+    }
+    column_configs = await asyncio.gather(
+        *(
+            _fetch_column_config(col_name, table_id)
+            for col_name, table_id in tables.items()
+        )
+    )
+    return {
+        col_name: column_config
+        for col_name, column_config in zip(tables, column_configs, strict=True)
+        if column_config is not None
+    }
+
 
+async def refresh_fuzzy_match_config() -> dict[str, dict]:
+    """
+    Fetch the fuzzy match config from NocoDB and cache it in Redis and in this
+    process. An empty config means NocoDB could not be read, so it is not
+    cached and the last good config keeps being served.
+    """
+    config = await get_fuzzy_match_config_from_nocodb()
+    if config:
+        await set_cache_string(
+            FUZZY_MATCH_CONFIG_KEY,
+            orjson.dumps(config),
+            constants.FUZZY_MATCH_CONFIG_CACHE_TTL_SECONDS,
+        )
+        _fuzzy_matchers_cache.set(FUZZY_MATCH_CONFIG_KEY, build_fuzzy_matchers(config))
     return config
 
 
-def fuzzy_match_value(
-    val: str, matching_map: dict[str, str], score_cutoff: float = 60.0
-):
+async def get_fuzzy_matchers() -> dict[str, FuzzyMatcher]:
     """
-    Returns (suggested_value, was_changed)
-    Improved logic using token_sort_ratio and token_set_ratio to avoid shorter-string bias.
+    Return the matchers of the fuzzy match config cached in this process,
+    else in Redis.
+
+    The ``refresh_fuzzy_match_config`` beat task keeps Redis warm, so NocoDB
+    is only queried here when both caches are cold.
     """
-    str_val = val.strip()
+    if (matchers := _fuzzy_matchers_cache.get(FUZZY_MATCH_CONFIG_KEY)) is not None:
+        return matchers
 
-    # Pre-check: If 'unknown' is in the input string, automatically suggest 'Unknown'
-    if "unknown" in str_val.lower():
-        return "Unknown", True
+    if (payload := await get_cache_bytes(FUZZY_MATCH_CONFIG_KEY)) is not None:
+        matchers = build_fuzzy_matchers(orjson.loads(payload))
+        _fuzzy_matchers_cache.set(FUZZY_MATCH_CONFIG_KEY, matchers)
+        return matchers
 
-    match_targets = list(matching_map.keys())
+    return build_fuzzy_matchers(await refresh_fuzzy_match_config())
 
-    # Pass 1: Use token_sort_ratio for overall string similarity
-    results_sort = process.extract(
-        str_val,
-        match_targets,
-        scorer=fuzz.token_sort_ratio,
-        processor=utils.default_process,
-        limit=5,
-    )
 
-    # Pass 2: Use token_set_ratio to find cases where tokens perfectly overlap
-    results_set = process.extract(
-        str_val,
-        match_targets,
-        scorer=fuzz.token_set_ratio,
-        processor=utils.default_process,
-        limit=5,
-    )
+async def get_fuzzy_match_config() -> dict[str, dict]:
+    """Return the fuzzy match config; see ``get_fuzzy_matchers``."""
+    return {
+        column: matcher.config
+        for column, matcher in (await get_fuzzy_matchers()).items()
+    }
+
 
-    best_sort_target, best_sort_score, _ = results_sort[0]
-    best_set_target, best_set_score, _ = results_set[0]
-
-    # Decision logic:
-    # 1. If we have a very high token_sort_ratio (> 80), it's likely a match or a typo.
-    if best_sort_score >= 80:
-        matched_target = best_sort_target
-        score = best_sort_score
-    # 2. If token_set_ratio is perfect (100) and sort_ratio is decent (> 60),
-    # it's likely a compound match or a specific subset.
-    elif best_set_score == 100 and best_sort_score >= 60:
-        matched_target = best_set_target
-        score = best_set_score
-    # 3. Fallback to the best sort match if it's above a safe threshold
-    elif best_sort_score >= score_cutoff:
-        matched_target = best_sort_target
-        score = best_sort_score
-    else:
-        # If the best match is very weak, don't suggest it unless it's at least better than 50
-        if best_sort_score < 50:
-            return "Unknown", True
-        return val, False
-
-    suggested_val = matching_map[matched_target]
-    was_changed = suggested_val.lower() != str_val.lower()
-
-    logger.info(f"Fuzzy Match: '{str_val}' -> '{matched_target}' ({score:.2f}%)")
-    return suggested_val, was_changed
+def fuzzy_match_value(
+    val: str, matching_map: dict[str, str], score_cutoff: float = 60.0
+):
+    """
+    Returns (suggested_value, was_changed)
+    Single-value form of ``FuzzyMatcher.suggest``.
+    """
+    return FuzzyMatcher([], matching_map).suggest([val], score_cutoff)[0]
 
 
 def is_null_or_nan(val) -> bool:
@@ -162,11 +312,27 @@ def is_null_or_nan(val) -> bool:
 
 
 def process_column_fuzzy_matching(
-    value_counts: pd.Series, valid_values: list[str], matching_map: dict[str, str]
+    value_counts: pd.Series,
+    matcher: FuzzyMatcher,
+    learned_corrections: dict[str, str] | None = None,
 ) -> tuple[list[dict], int]:
+    """
+    ``learned_corrections`` maps lowercased values to replacements users
+    confirmed before; those are suggested as they are, marked
+    ``is_confirmed``, without scoring the value.
+    """
     errors_in_column = []
     total_unknown = 0
 
+    # Only replacements that are still valid options are suggested.
+    options = set(matcher.options)
+    learned = {
+        value_key: replace_with
+        for value_key, replace_with in (learned_corrections or {}).items()
+        if replace_with in options
+    }
+
+    unmatched: dict[str, list[tuple[int, int]]] = {}
     for val, count in value_counts.items():
         is_null = is_null_or_nan(val)
         str_val = str(val).strip() if not is_null else ""
@@ -187,49 +353,72 @@ def process_column_fuzzy_matching(
                     "count": int(count),
                     "replace_with": "Unknown",
                     "is_valid": True,  # Disables UI dropdown
+                    "is_confirmed": False,
                 }
             )
             continue
 
-        # Check if exactly in valid values (case insensitive comparison)
-        is_valid_exactly = False
-        exact_match_str = None
-        for v in valid_values:
-            if str_val.lower() == v.strip().lower():
-                is_valid_exactly = True
-                exact_match_str = v
-                break
-
-        if is_valid_exactly:
+        exact_match_str = matcher.exact_matches.get(str_val.lower())
+        if exact_match_str is not None:
             errors_in_column.append(
                 {
                     "value_found": str_val,
                     "count": int(count),
                     "replace_with": exact_match_str,
                     "is_valid": True,
+                    "is_confirmed": False,
                 }
             )
             continue
 
-        # It's an unknown value. See if we can suggest a fuzzy replacement.
-        suggested_val, was_changed = fuzzy_match_value(str_val, matching_map)
+        total_unknown += int(count)
+        learned_str = learned.get(str_val.lower())
+        if learned_str is not None:
+            errors_in_column.append(
+                {
+                    "value_found": str_val,
+                    "count": int(count),
+                    "replace_with": learned_str,
+                    "is_valid": False,
+                    "is_confirmed": True,
+                }
+            )
+            continue
+
+        # It's an unknown value; it is given a suggestion below, in one batch
+        # with the rest. Its entry is filled in then.
+        unmatched.setdefault(str_val, []).append((len(errors_in_column), int(count)))
+        errors_in_column.append({})
 
+    suggestions = matcher.suggest(list(unmatched))
+    for (str_val, entries), (suggested_val, was_changed) in zip(
+        unmatched.items(), suggestions, strict=True
+    ):
         # Whether we found a suggestion or not, it counts as an "error/unknown"
-        errors_in_column.append(
-            {
+        for position, count in entries:
+            errors_in_column[position] = {
                 "value_found": str_val,
-                "count": int(count),
+                "count": count,
                 "replace_with": suggested_val if was_changed else None,
                 "is_valid": False,
+                "is_confirmed": False,
             }
-        )
-        total_unknown += int(count)
 
     return errors_in_column, total_unknown
 
 
-def run_fuzzy_matching(df: pd.DataFrame, column_mappings: dict[str, str]) -> dict:
+def run_fuzzy_matching_on_value_counts(
+    value_counts: Mapping[str, pd.Series],
+    column_mappings: dict[str, str],
+    matchers: Mapping[str, FuzzyMatcher],
+    learned_corrections: dict[str, dict[str, str]] | None = None,
+) -> dict:
     """
+    Check the mapped columns, given as the ``value_counts(dropna=False)`` of
+    each file column (see ``count_spreadsheet_values``), against the valid
+    values in ``matchers`` (see ``get_fuzzy_matchers``). ``learned_corrections`` holds the
+    corrections users confirmed before, per schema column (see
+    ``get_learned_corrections``).
 
     Returns a dict matching the UI contract:
     {
@@ -241,13 +430,12 @@ def run_fuzzy_matching(df: pd.DataFrame, column_mappings: dict[str, str]) -> dic
           "unknown_count": 124,
           "dropdown_options": ["Primary", "Secondary"],
           "value_mappings": [
-            { "value_found": "PRMARY", "count": 22, "replace_with": "Primary", "is_valid": False }
+            { "value_found": "PRMARY", "count": 22, "replace_with": "Primary", "is_valid": False, "is_confirmed": True }
           ]
         }
       ]
     }
     """
-    config = get_fuzzy_match_config_from_nocodb()
     columns_with_errors = []
 
     # column_mappings: "Raw_CSV_Col" -> "standard_col"
@@ -255,29 +443,23 @@ def run_fuzzy_matching(df: pd.DataFrame, column_mappings: dict[str, str]) -> dic
 
     for raw_col, standard_col in column_mappings.items():
         # Check if the standard config maps to a known fuzzy target, e.g. "education_level_govt" -> "education_level"
-        if standard_col not in config:
+        if standard_col not in matchers:
             continue
 
-        dropdown_opts = config[standard_col]["dropdown_options"]
-        matching_map = config[standard_col]["matching_map"]
-        if raw_col not in df.columns:
+        matcher = matchers[standard_col]
+        if raw_col not in value_counts:
             continue
 
-        # Get unique values and their counts in the column
-        value_counts = df[raw_col].value_counts(dropna=False)
-
         errors_in_column, total_unknown = process_column_fuzzy_matching(
-            value_counts, dropdown_opts, matching_map
+            value_counts[raw_col],
+            matcher,
+            (learned_corrections or {}).get(standard_col),
         )
 
         if errors_in_column:
-            # Sort errors_in_column: Invalid ones first, then valid ones
-            errors_in_column.sort(key=lambda x: x["is_valid"])
-
-            # Always include "Unknown" in dropdown options so it's selectable
-            final_dropdown = sorted(set(dropdown_opts))
-            if "Unknown" not in final_dropdown:
-                final_dropdown.append("Unknown")
+            # Sort errors_in_column: Invalid ones first, confirmed corrections
+            # first among them, then valid ones
+            errors_in_column.sort(key=lambda x: (x["is_valid"], not x["is_confirmed"]))
 
             columns_with_errors.append(
                 {
@@ -285,9 +467,26 @@ def run_fuzzy_matching(df: pd.DataFrame, column_mappings: dict[str, str]) -> dic
                     "file_column": raw_col,
                     "header_title": f"{raw_col} ({standard_col})",
                     "unknown_count": total_unknown,
-                    "dropdown_options": final_dropdown,
+                    "dropdown_options": list(matcher.options),
                     "value_mappings": errors_in_column,
                 }
             )
 
     return {"columns": columns_with_errors}
+
+
+def run_fuzzy_matching(
+    df: pd.DataFrame,
+    column_mappings: dict[str, str],
+    matchers: Mapping[str, FuzzyMatcher],
+    learned_corrections: dict[str, dict[str, str]] | None = None,
+) -> dict:
+    """Check the mapped columns of ``df``; see ``run_fuzzy_matching_on_value_counts``."""
+    value_counts = {
+        raw_col: df[raw_col].value_counts(dropna=False)
+        for raw_col, standard_col in column_mappings.items()
+        if standard_col in matchers and raw_col in df.columns
+    }
+    return run_fuzzy_matching_on_value_counts(
+        value_counts, column_mappings, matchers, learned_corrections
+    )
@@ -1,64 +1,204 @@
+import asyncio
 import logging
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
 
+import httpx
 import pandas as pd
-import requests
 
+from data_ingestion.constants import constants
 from data_ingestion.settings import settings
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
 
-def get_nocodb_table_rows(table_id, offset=0, limit=100, where=None, fields=None):
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# Only reads are retried: a write that timed out or failed on the server may
+# have been applied already.
+RETRY_METHODS = frozenset({"GET"})
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def create_nocodb_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url=f"{settings.NOCODB_BASE_URL}/api/v2",
+        headers={"xc-token": settings.NOCODB_TOKEN},
+        timeout=httpx.Timeout(constants.NOCODB_TIMEOUT_SECONDS),
+        limits=httpx.Limits(max_connections=constants.NOCODB_MAX_CONCURRENCY * 2),
+    )
+
+
+def get_nocodb_client() -> httpx.AsyncClient:
+    """
+    Return the NocoDB client shared by this process's event loop.
+
+    A client's pooled connections belong to the loop that opened them, so a
+    loop started later (e.g. by ``async_to_sync`` in a Celery task) gets a
+    client of its own.
+    """
+    global _client, _client_loop
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = create_nocodb_client()
+        _client_loop = loop
+    return _client
+
+
+async def close_nocodb_client() -> None:
+    global _client, _client_loop
+
+    if _client is not None and _client_loop is asyncio.get_running_loop():
+        await _client.aclose()
+    _client = None
+    _client_loop = None
+
+
+def _retry_delay(attempt: int, response: httpx.Response | None) -> float | None:
+    """
+    Seconds to wait before the next attempt, or ``None`` if the server asks
+    for a longer wait than ``NOCODB_TIMEOUT_SECONDS``, the most a request may
+    take.
+    """
+    retry_after = response.headers.get("Retry-After") if response else None
+    if retry_after and retry_after.isdigit():
+        delay = float(retry_after)
+        return None if delay > constants.NOCODB_TIMEOUT_SECONDS else delay
+    return min(
+        constants.NOCODB_RETRY_BACKOFF_SECONDS * 2**attempt,
+        constants.NOCODB_TIMEOUT_SECONDS,
+    )
+
+
+async def _request(
+    client: httpx.AsyncClient, method: str, url: str, **kwargs
+) -> httpx.Response:
+    """
+    Send a request, retrying timeouts, connection errors, rate limiting and
+    server errors of ``RETRY_METHODS`` with exponential backoff. Other error
+    responses, any failure of other methods, and responses asking to retry
+    later than :func:`_retry_delay` allows are raised.
+    """
+    max_retries = constants.NOCODB_MAX_RETRIES if method in RETRY_METHODS else 0
+    attempt = 0
+    while True:
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.TransportError as exc:
+            if attempt >= max_retries:
+                raise
+            response = None
+            reason = repr(exc)
+        else:
+            if response.status_code not in RETRY_STATUS_CODES or attempt >= max_retries:
+                response.raise_for_status()
+                return response
+            reason = f"status {response.status_code}"
+
+        delay = _retry_delay(attempt, response)
+        if delay is None:
+            response.raise_for_status()
+        logger.warning(f"NocoDB {method} {url} failed ({reason}), retrying")
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+def _run_sync(function: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
+    """Run an async NocoDB call from sync code on a client of its own."""
+
+    async def run():
+        async with create_nocodb_client() as client:
+            return await function(*args, client=client, **kwargs)
+
+    return asyncio.run(run())
+
+
+async def fetch_nocodb_table_rows(
+    table_id, offset=0, limit=None, where=None, fields=None, *, client=None
+):
     """
     Retrieve rows from a specified NoCoDB table and returns them as a list of dictionaries
 
+    The first page tells how many rows match; the remaining pages are then
+    fetched concurrently, at most ``NOCODB_MAX_CONCURRENCY`` at a time, and
+    returned in table order.
+
     Args:
         table_id (str): The ID of the NocoDB table to query.
         offset (int, optional): Number of rows to skip before starting to return rows. Defaults to 0.
-        limit (int, optional): Maximum number of rows to return. Defaults to 500.
+        limit (int, optional): Number of rows to request per page. Defaults to NOCODB_PAGE_SIZE.
         where (str, optional): A query string for filtering rows based on conditions.
         fields (str, optional): A string specifying the fields to include in the result.
+        client (httpx.AsyncClient, optional): Defaults to the shared client.
 
     Returns:
         list[dict]: A list of dictionaries representing the rows in the table.
 
     """
+    client = client or get_nocodb_client()
+    url = f"tables/{table_id}/records"
+    offset = offset or 0
+    limit = limit or constants.NOCODB_PAGE_SIZE
 
-    table_url = f"{settings.NOCODB_BASE_URL}/api/v2/tables/{table_id}/records"
-    headers = {"xc-token": settings.NOCODB_TOKEN}
+    params_base = {}
+    if where:
+        params_base["where"] = where
+    if fields:
+        params_base["fields"] = fields
 
-    offset = offset or 0
-    all_rows = []
-    is_last_page = False
-
-    if where and fields:
-        params_base = {"where": where, "fields": fields}
-    elif where:
-        params_base = {"where": where}
-    elif fields:
-        params_base = {"fields": fields}
-    else:
-        params_base = {}
-
-    # loop through and get all the data in the table
-    while not is_last_page:
-        # set the parameters to query the current page of data
-        params = {"offset": offset, "limit": limit}
-        params = {**params_base, **params}
-
-        # fetch the data from the api
-        response = requests.get(table_url, params=params, headers=headers)
-        response_json = response.json()
-        rows = response_json.get("list", [])
+    async def fetch_page(page_offset: int) -> dict:
+        params = {**params_base, "offset": page_offset, "limit": limit}
+        response = await _request(client, "GET", url, params=params)
+        return response.json()
+
+    first_page = await fetch_page(offset)
+    all_rows = first_page.get("list", [])
+    page_info = first_page.get("pageInfo") or {}
+    if page_info.get("isLastPage", True):
+        return all_rows
+
+    # NocoDB may serve fewer rows per page than requested.
+    page_size = page_info.get("pageSize") or limit
+    total_rows = page_info.get("totalRows")
+    if total_rows is None:
+        # Without a row count, page through the table one page at a time.
+        while not page_info.get("isLastPage", True):
+            offset += page_size
+            page = await fetch_page(offset)
+            all_rows.extend(page.get("list", []))
+            page_info = page.get("pageInfo") or {}
+        return all_rows
+
+    semaphore = asyncio.Semaphore(constants.NOCODB_MAX_CONCURRENCY)
+
+    async def fetch_bounded(page_offset: int) -> list[dict]:
+        async with semaphore:
+            return (await fetch_page(page_offset)).get("list", [])
+
+    pages = await asyncio.gather(
+        *(
+            fetch_bounded(page_offset)
+            for page_offset in range(offset + page_size, total_rows, page_size)
+        )
+    )
+    for rows in pages:
         all_rows.extend(rows)
+    return all_rows
 
-        # get the page info to determine how to continue
-        page_info = response_json.get("pageInfo")
-        page_size = page_info.get("pageSize", 0)
-        offset += page_size
-        is_last_page = page_info.get("isLastPage", False)
 
-    return all_rows
+def get_nocodb_table_rows(table_id, offset=0, limit=None, where=None, fields=None):
+    """Sync wrapper of :func:`fetch_nocodb_table_rows`, for Celery tasks."""
+    return _run_sync(
+        fetch_nocodb_table_rows,
+        table_id,
+        offset=offset,
+        limit=limit,
+        where=where,
+        fields=fields,
+    )
 
 
 def get_nocodb_table_as_pandas_dataframe(table_id, where=None, fields=None):
@@ -135,10 +275,12 @@ def get_nocodb_table_as_key_value_mapping(
     return mapping_dict
 
 
-def get_nocodb_table_id_from_name(table_name):
-    table_name_mappings_id = settings.NOCODB_NAME_MAPPINGS_TABLE_ID
-    nocodb_response = get_nocodb_table_rows(
-        table_name_mappings_id, where=f"(table_name,eq,{table_name})", fields="table_id"
+async def fetch_nocodb_table_id_from_name(table_name, *, client=None):
+    nocodb_response = await fetch_nocodb_table_rows(
+        settings.NOCODB_NAME_MAPPINGS_TABLE_ID,
+        where=f"(table_name,eq,{table_name})",
+        fields="table_id",
+        client=client,
     )
     if nocodb_response:
         return nocodb_response[0]["table_id"]
@@ -146,8 +288,18 @@ def get_nocodb_table_id_from_name(table_name):
         raise ValueError(f"Unable to retrieve the table_id for table {table_name}")
 
 
-def update_nocodb_record_by_field(
-    table_name: str, field_name: str, field_value: str, update_data: dict
+def get_nocodb_table_id_from_name(table_name):
+    """Sync wrapper of :func:`fetch_nocodb_table_id_from_name`, for Celery tasks."""
+    return _run_sync(fetch_nocodb_table_id_from_name, table_name)
+
+
+async def patch_nocodb_record_by_field(
+    table_name: str,
+    field_name: str,
+    field_value: str,
+    update_data: dict,
+    *,
+    client: httpx.AsyncClient | None = None,
 ) -> dict | None:
     """
     Update a NoCoDB record by finding it via a specific field value.
@@ -157,17 +309,19 @@ def update_nocodb_record_by_field(
         field_name: The field name to search by (e.g., "giga_id_school")
         field_value: The value to search for
         update_data: The data to update
+        client: Defaults to the shared client.
 
     Returns:
         dict: Response from the update operation or None if record not found
     """
+    client = client or get_nocodb_client()
     try:
         # Get table ID from table name
-        table_id = get_nocodb_table_id_from_name(table_name)
+        table_id = await fetch_nocodb_table_id_from_name(table_name, client=client)
 
         # Find the record by the field
-        rows = get_nocodb_table_rows(
-            table_id, where=f"({field_name},eq,{field_value})", limit=1
+        rows = await fetch_nocodb_table_rows(
+            table_id, where=f"({field_name},eq,{field_value})", limit=1, client=client
         )
 
         if not rows:
@@ -186,13 +340,9 @@ def update_nocodb_record_by_field(
         update_data["Id"] = record_id
 
         # Update the record
-        table_url = f"{settings.NOCODB_BASE_URL}/api/v2/tables/{table_id}/records"
-        headers = {
-            "xc-token": settings.NOCODB_TOKEN,
-            "Content-Type": "application/json",
-        }
-        response = requests.patch(table_url, json=update_data, headers=headers)
-        response.raise_for_status()
+        response = await _request(
+            client, "PATCH", f"tables/{table_id}/records", json=update_data
+        )
 
         logger.info(
             f"NoCoDB update successful for {field_name}={field_value}: {update_data}"
@@ -202,3 +352,12 @@ def update_nocodb_record_by_field(
     except Exception as exc:
         logger.error(f"NoCoDB update failed for {field_name}={field_value}: {exc}")
         return None
+
+
+def update_nocodb_record_by_field(
+    table_name: str, field_name: str, field_value: str, update_data: dict
+) -> dict | None:
+    """Sync wrapper of :func:`patch_nocodb_record_by_field`, for Celery tasks."""
+    return _run_sync(
+        patch_nocodb_record_by_field, table_name, field_name, field_value, update_data
+    )
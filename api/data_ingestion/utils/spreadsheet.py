@@ -0,0 +1,230 @@
+"""
+Parsing of uploaded spreadsheets (CSV, XLSX and XLS) into Arrow-backed
+DataFrames of text columns, named the way pandas names them.
+"""
+
+import csv
+import io
+from collections import Counter
+from collections.abc import Collection, Iterable
+from typing import BinaryIO
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+
+from data_ingestion.utils.xlsx import NA_VALUES, count_xlsx_values, read_xlsx_columns
+
+ARROW_STRING = pd.ArrowDtype(pa.string())
+
+# CSV is counted in blocks of about this size.
+COUNT_BLOCK_SIZE = 16 * 2**20
+
+
+def dedupe_column_names(header: Iterable) -> list[str]:
+    """Name columns like pandas: blanks become ``Unnamed: i``, repeats ``a.1``."""
+    names: list[str] = []
+    seen: dict[str, int] = {}
+    for i, value in enumerate(header):
+        name = f"Unnamed: {i}" if value is None or value == "" else str(value)
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def _csv_column_names(source: BinaryIO) -> list[str]:
+    text_stream = io.TextIOWrapper(source, encoding="utf-8-sig", newline="")
+    try:
+        header = next(csv.reader(text_stream), None)
+    finally:
+        text_stream.detach()
+    source.seek(0)
+
+    if not header:
+        raise ValueError("No columns to parse from file")
+    return dedupe_column_names(header)
+
+
+def _csv_convert_options(selected: list[str]) -> pa_csv.ConvertOptions:
+    return pa_csv.ConvertOptions(
+        include_columns=selected,
+        column_types=dict.fromkeys(selected, pa.string()),
+        null_values=sorted(NA_VALUES),
+        strings_can_be_null=True,
+    )
+
+
+class _ShortRows:
+    """
+    ``invalid_row_handler`` noting rows with missing trailing fields: pandas
+    fills them with nulls, but pyarrow can only skip or reject them.
+    """
+
+    def __init__(self):
+        self.found = False
+
+    def __call__(self, row: pa_csv.InvalidRow) -> str:
+        if row.actual_columns < row.expected_columns:
+            self.found = True
+        return "error"
+
+
+def _csv_parse_options(short_rows: _ShortRows) -> pa_csv.ParseOptions:
+    # Quoted cells may span lines, as pandas allows.
+    return pa_csv.ParseOptions(newlines_in_values=True, invalid_row_handler=short_rows)
+
+
+def _read_csv_with_pandas(
+    source: BinaryIO, names: list[str], selected: list[str]
+) -> pd.DataFrame:
+    source.seek(0)
+    return pd.read_csv(
+        source,
+        header=0,
+        names=names,
+        usecols=selected,
+        dtype=str,
+        encoding="utf-8-sig",
+    )[selected].astype(ARROW_STRING)
+
+
+def _read_csv(source: BinaryIO, columns: Collection[str] | None) -> pd.DataFrame:
+    names = _csv_column_names(source)
+    selected = [name for name in names if columns is None or name in columns]
+    short_rows = _ShortRows()
+    try:
+        table = pa_csv.read_csv(
+            source,
+            read_options=pa_csv.ReadOptions(column_names=names, skip_rows=1),
+            parse_options=_csv_parse_options(short_rows),
+            convert_options=_csv_convert_options(selected),
+        )
+    except pa.ArrowInvalid:
+        if not short_rows.found:
+            raise
+        return _read_csv_with_pandas(source, names, selected)
+    return table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
+
+
+def _read_xlsx(source: BinaryIO, columns: Collection[str] | None) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            name: pd.array(values, dtype=ARROW_STRING)
+            for name, values in read_xlsx_columns(
+                source, columns, dedupe_column_names
+            ).items()
+        }
+    )
+
+
+def parse_spreadsheet(
+    content: bytes | BinaryIO,
+    file_ext: str,
+    columns: Collection[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Parse an uploaded spreadsheet into Arrow-backed columns.
+
+    Only the ``columns`` present in the file are read; pass ``None`` to read
+    them all. Every column is text, as written in the file. CSV is read with
+    the multithreaded pyarrow reader (empty and NA-like cells null), so no
+    Python object is created per cell; files with short rows, which pyarrow
+    rejects, fall back to pandas. XLSX rows are read one at a time by
+    openpyxl, keeping only the selected columns.
+    """
+    source = io.BytesIO(content) if isinstance(content, bytes) else content
+    if file_ext == ".csv":
+        return _read_csv(source, columns)
+    if file_ext == ".xlsx":
+        return _read_xlsx(source, columns)
+
+    usecols = None if columns is None else (lambda name: name in columns)
+    return pd.read_excel(source, engine="xlrd", usecols=usecols, dtype=str).astype(
+        ARROW_STRING
+    )
+
+
+def _to_value_counts(counts: Counter) -> pd.Series:
+    most_common = counts.most_common()
+    return pd.Series(
+        [frequency for _, frequency in most_common],
+        index=pd.Index([value for value, _ in most_common], dtype=object),
+        dtype="int64",
+        name="count",
+    )
+
+
+def count_arrow_values(
+    batches: Iterable[pa.RecordBatch], columns: Collection[str]
+) -> dict[str, pd.Series]:
+    """Merge the value counts of the given columns over record batches."""
+    counts = {name: Counter() for name in columns}
+    for batch in batches:
+        for name, column_counts in counts.items():
+            batch_counts = pc.value_counts(batch.column(name))
+            column_counts.update(
+                dict(
+                    zip(
+                        batch_counts.field("values").to_pylist(),
+                        batch_counts.field("counts").to_pylist(),
+                        strict=True,
+                    )
+                )
+            )
+    return {
+        name: _to_value_counts(column_counts) for name, column_counts in counts.items()
+    }
+
+
+def count_spreadsheet_values(
+    content: bytes | BinaryIO, file_ext: str, columns: Collection[str]
+) -> dict[str, pd.Series]:
+    """
+    Count the values of the ``columns`` present in an uploaded spreadsheet.
+
+    Returns what ``value_counts(dropna=False)`` gives for each column of
+    ``parse_spreadsheet``, most frequent first, with nulls counted under
+    ``None``. CSV is read in blocks and XLSX one row at a time, so memory
+    grows with the number of distinct values rather than with the file.
+    Legacy ``.xls`` is parsed in full.
+    """
+    source = io.BytesIO(content) if isinstance(content, bytes) else content
+    if file_ext == ".csv":
+        names = _csv_column_names(source)
+        selected = [name for name in names if name in columns]
+        if not selected:
+            return {}
+        short_rows = _ShortRows()
+        try:
+            reader = pa_csv.open_csv(
+                source,
+                read_options=pa_csv.ReadOptions(
+                    column_names=names, skip_rows=1, block_size=COUNT_BLOCK_SIZE
+                ),
+                parse_options=_csv_parse_options(short_rows),
+                convert_options=_csv_convert_options(selected),
+            )
+            return count_arrow_values(reader, selected)
+        except pa.ArrowInvalid:
+            if not short_rows.found:
+                raise
+        df = _read_csv_with_pandas(source, names, selected)
+        return count_arrow_values(
+            pa.Table.from_pandas(df, preserve_index=False).to_batches(), selected
+        )
+
+    if file_ext == ".xlsx":
+        return {
+            name: _to_value_counts(column_counts)
+            for name, column_counts in count_xlsx_values(
+                source, columns, dedupe_column_names
+            ).items()
+        }
+
+    df = parse_spreadsheet(source, file_ext, columns)
+    return {name: df[name].value_counts(dropna=False) for name in df.columns}
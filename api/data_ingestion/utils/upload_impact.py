@@ -1,6 +1,8 @@
-from collections import Counter
+from collections.abc import Collection, Sequence
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 
 def normalize_school_id(value) -> str | None:
@@ -14,6 +16,22 @@ def normalize_school_id(value) -> str | None:
     return normalized
 
 
+def normalize_school_ids(values: pd.Series) -> pa.Array:
+    """
+    ``normalize_school_id`` over a column at once: the IDs are trimmed and
+    the empty, null and ``"nan"`` ones dropped.
+    """
+    if not isinstance(values.dtype, pd.ArrowDtype):
+        values = values.astype(pd.StringDtype("pyarrow"))
+    ids = pa.array(values, from_pandas=True)
+    if not pa.types.is_string(ids.type):
+        ids = ids.cast(pa.string())
+    ids = pc.utf8_trim_whitespace(ids)
+    # Comparisons with null are null, which the filter drops too.
+    keep = pc.and_(pc.not_equal(ids, ""), pc.not_equal(pc.utf8_lower(ids), "nan"))
+    return ids.filter(keep)
+
+
 def get_school_id_file_column(column_mapping: dict[str, str]) -> str:
     for file_column, schema_column in column_mapping.items():
         if schema_column == "school_id_govt":
@@ -23,22 +41,26 @@ def get_school_id_file_column(column_mapping: dict[str, str]) -> str:
 
 
 def build_upload_impact_preview(
-    file_school_ids: list[str],
+    file_school_ids: Sequence[str] | pa.Array,
     total_rows: int,
-    master_school_ids: set[str],
+    master_school_ids: Collection[str],
 ) -> dict[str, int]:
+    file_school_ids = pa.array(file_school_ids, type=pa.string())
     rows_with_school_id = len(file_school_ids)
     missing_school_id_rows = total_rows - rows_with_school_id
-    school_id_counts = Counter(file_school_ids)
+    school_id_counts = pc.value_counts(file_school_ids)
+    counts = school_id_counts.field("counts")
     unique_school_ids = len(school_id_counts)
     # Count every row whose school ID is repeated, including its first
     # occurrence, so the total reflects all rows involved in a duplication.
-    duplicate_school_id_rows = sum(
-        count for count in school_id_counts.values() if count > 1
-    )
-    schools_to_update = sum(
-        1 for school_id in file_school_ids if school_id in master_school_ids
+    duplicate_school_id_rows = pc.sum(
+        counts.filter(pc.greater(counts, 1)), min_count=0
+    ).as_py()
+    in_master = pc.is_in(
+        school_id_counts.field("values"),
+        value_set=pa.array(list(master_school_ids), type=pa.string()),
     )
+    schools_to_update = pc.sum(counts.filter(in_master), min_count=0).as_py()
     new_schools = rows_with_school_id - schools_to_update
 
     return {
@@ -0,0 +1,171 @@
+"""
+Reading selected columns of the first sheet of an XLSX workbook, one row at
+a time, as the text ``pd.read_excel(..., dtype=str)`` would give.
+
+The workbook is opened the way pandas opens it (openpyxl in read-only mode,
+cached values instead of formulas), but rows are read as plain value tuples
+and only the requested columns are kept, so no DataFrame of the whole sheet
+is built.
+"""
+
+from collections import Counter
+from collections.abc import Callable, Collection, Iterator, Sequence
+from typing import BinaryIO
+
+from openpyxl import load_workbook
+from openpyxl.cell.cell import ERROR_CODES
+
+# pandas' default ``na_values``: cells read as null from CSV and XLSX alike.
+NA_VALUES = frozenset(
+    {
+        "",
+        "#N/A",
+        "#N/A N/A",
+        "#NA",
+        "-1.#IND",
+        "-1.#QNAN",
+        "-NaN",
+        "-nan",
+        "1.#IND",
+        "1.#QNAN",
+        "<NA>",
+        "N/A",
+        "NA",
+        "NULL",
+        "NaN",
+        "None",
+        "n/a",
+        "nan",
+        "null",
+    }
+)
+
+# Error cells (``#DIV/0!``, ...) are NaN in pandas too.
+_NULL_CELL_TEXT = NA_VALUES | frozenset(ERROR_CODES)
+
+
+def cell_value(value):
+    """Return a cell value as pandas reads it: integral numbers as ``int``."""
+    # pandas reads integral numbers as int, so 7.0 is "7".
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def cell_text(value) -> str | None:
+    """Return a cell as ``dtype=str`` text, ``None`` for empty and NA-like cells."""
+    if value is None:
+        return None
+    text = str(cell_value(value))
+    return None if text in _NULL_CELL_TEXT else text
+
+
+def header_names(
+    header: Sequence, column_names: Callable[[list], list[str]]
+) -> list[str]:
+    """
+    Name the columns of a header row with ``column_names``, as the parser
+    does: trailing empty cells are not columns.
+    """
+    header = list(header)
+    while header and header[-1] in (None, ""):
+        header.pop()
+    return column_names([cell_value(value) for value in header])
+
+
+def _iter_xlsx_rows(
+    source: BinaryIO | str,
+    columns: Collection[str] | None,
+    column_names: Callable[[list], list[str]],
+) -> Iterator:
+    """
+    Yield the names of the selected columns, then ``(values, has_data)`` for
+    each row of the first sheet, where ``values`` holds the row's cells in
+    the selected columns and ``has_data`` tells whether any cell of the row,
+    selected or not, has a value.
+    """
+    workbook = load_workbook(source, read_only=True, data_only=True, keep_links=False)
+    try:
+        sheet = workbook.worksheets[0]
+        # The stored dimensions may be missing or wrong; read what is there.
+        sheet.reset_dimensions()
+        rows = sheet.iter_rows(values_only=True)
+
+        names = header_names(next(rows, ()), column_names)
+        selected = [
+            index
+            for index, name in enumerate(names)
+            if columns is None or name in columns
+        ]
+        yield [names[index] for index in selected]
+
+        for row in rows:
+            values = [
+                cell_text(row[index]) if index < len(row) else None
+                for index in selected
+            ]
+            has_data = any(value not in (None, "") for value in row)
+            yield values, has_data
+    finally:
+        workbook.close()
+
+
+def read_xlsx_columns(
+    source: BinaryIO | str,
+    columns: Collection[str] | None,
+    column_names: Callable[[list], list[str]],
+) -> dict[str, list[str | None]]:
+    """
+    Read the given columns (all if ``None``) of the first sheet as text.
+
+    The first row is the header, turned into column names by
+    ``column_names``; columns whose name is not in ``columns`` are not kept.
+    Cells are rendered as ``pd.read_excel(..., dtype=str)`` renders them:
+    empty and NA-like cells are ``None``, and trailing empty rows are dropped.
+    """
+    rows = _iter_xlsx_rows(source, columns, column_names)
+    names = next(rows)
+    values: list[list[str | None]] = [[] for _ in names]
+    row_count = last_row_with_data = 0
+
+    for row_values, has_data in rows:
+        row_count += 1
+        for column_values, value in zip(values, row_values, strict=True):
+            column_values.append(value)
+        if has_data:
+            last_row_with_data = row_count
+
+    return {
+        name: column_values[:last_row_with_data]
+        for name, column_values in zip(names, values, strict=True)
+    }
+
+
+def count_xlsx_values(
+    source: BinaryIO | str,
+    columns: Collection[str] | None,
+    column_names: Callable[[list], list[str]],
+) -> dict[str, Counter]:
+    """
+    Count the values of the given columns of the first sheet, read as
+    :func:`read_xlsx_columns` reads them, one row at a time.
+    """
+    rows = _iter_xlsx_rows(source, columns, column_names)
+    names = next(rows)
+    counts = [Counter() for _ in names]
+    empty_rows = 0
+
+    for row_values, has_data in rows:
+        # Trailing empty rows are dropped, so empty rows only count once a
+        # row with data follows them.
+        if not has_data:
+            empty_rows += 1
+            continue
+        if empty_rows:
+            for column_counts in counts:
+                column_counts[None] += empty_rows
+            empty_rows = 0
+        for column_counts, value in zip(counts, row_values, strict=True):
+            column_counts[value] += 1
+
+    return dict(zip(names, counts, strict=True))
@@ -0,0 +1,321 @@
+"""
+Benchmark fuzzy validation on synthetic dirty uploads.
+
+Generates uploads from a stand-in NocoDB config (built with the same helpers
+as the real one) for every combination of ``--rows``, ``--cardinality``
+(distinct values per column), ``--typo-rate`` (share of rows whose value is
+misspelt) and ``--columns`` (mapped columns), then times
+``run_fuzzy_matching`` on them. Misspellings are generated from known valid
+values, a tenth of them as noise that should become ``Unknown``, so every
+suggestion can be scored against the value it came from. Each case runs in
+a fresh process so its peak RSS is not inflated by earlier cases.
+
+Results are printed, and written to ``--output`` as JSON; pass an earlier
+file as ``--baseline`` to compare latency and accuracy with it.
+
+Usage:
+    python -m scripts.benchmark_fuzzy_matching --rows 100000 --cardinality 5000 \
+        --output fuzzy-matching.json
+"""
+
+import argparse
+import itertools
+import json
+import multiprocessing
+import platform
+import random
+import resource
+import statistics
+import string
+import time
+import tracemalloc
+from datetime import UTC, datetime
+from pathlib import Path
+
+VALID_VALUES = {
+    "education_level_govt": [
+        "Pre-Primary",
+        "Primary",
+        "Secondary",
+        "Post-Secondary",
+        "Primary and Secondary",
+        "Lower Secondary",
+        "Upper Secondary",
+        "Early Childhood Education",
+    ],
+    "electricity_type_govt": [
+        "Grid",
+        "Solar",
+        "Generator",
+        "Wind",
+        "Solar and Grid",
+        "Battery",
+        "Hydro",
+        "Biomass",
+    ],
+    "connectivity_type_govt": [
+        "Fiber",
+        "Satellite",
+        "Cellular",
+        "Microwave",
+        "DSL",
+        "Cable",
+        "Fixed Wireless",
+        "Mobile Broadband",
+    ],
+    "school_area_type_govt": ["Urban", "Rural", "Peri-Urban"],
+}
+NOISE_RATE = 0.1
+
+
+def _misspell(rng: random.Random, value: str) -> str:
+    chars = list(value)
+    for _ in range(rng.randint(1, 2)):
+        edit = rng.randrange(6)
+        i = rng.randrange(len(chars))
+        if edit == 0 and len(chars) > 3:
+            del chars[i]
+        elif edit == 1:
+            chars.insert(i, rng.choice(string.ascii_lowercase))
+        elif edit == 2:
+            chars[i] = rng.choice(string.ascii_lowercase)
+        elif edit == 3 and i + 1 < len(chars):
+            chars[i], chars[i + 1] = chars[i + 1], chars[i]
+        elif edit == 4:
+            chars = list("".join(chars).upper())
+        else:
+            chars.append(rng.choice([" ", ".", " school", " level"]))
+    words = "".join(chars).split(" ")
+    if len(words) > 1 and rng.random() < 0.2:
+        words.reverse()
+    return " ".join(words)
+
+
+def _noise(rng: random.Random) -> str:
+    length = rng.randint(3, 10)
+    return "".join(rng.choices(string.ascii_lowercase + string.digits, k=length))
+
+
+def _dirty_values(
+    rng: random.Random, options: list[str], cardinality: int
+) -> dict[str, str]:
+    """Return ``{dirty value: value it should be corrected to}``."""
+    valid_keys = {option.lower() for option in options}
+    dirty: dict[str, str] = {}
+    attempts = 0
+    while len(dirty) < cardinality and attempts < cardinality * 20:
+        attempts += 1
+        if rng.random() < NOISE_RATE:
+            value, expected = _noise(rng), "Unknown"
+        else:
+            expected = rng.choice(options)
+            value = _misspell(rng, expected)
+        key = value.strip().lower()
+        if key and key not in valid_keys and "unknown" not in key:
+            dirty.setdefault(value, expected)
+    return dirty
+
+
+def generate_case(
+    rows: int, cardinality: int, typo_rate: float, columns: int, seed: int
+):
+    """Return the upload, its column mapping, the config and the expected fixes."""
+    import pandas as pd
+    import pyarrow as pa
+    from data_ingestion.utils.fuzzy_matching import extract_valid_values_from_rows
+
+    rng = random.Random(seed)
+    config = {}
+    for schema_column, options in VALID_VALUES.items():
+        dropdown_options, matching_map = extract_valid_values_from_rows(
+            [{"Govt": option} for option in options], "Govt"
+        )
+        config[schema_column] = {
+            "dropdown_options": dropdown_options,
+            "matching_map": matching_map,
+        }
+
+    data = {}
+    column_mapping = {}
+    expected = {}
+    schema_columns = itertools.cycle(VALID_VALUES)
+    for index in range(columns):
+        schema_column = next(schema_columns)
+        file_column = f"{schema_column.removesuffix('_govt')}_{index}"
+        options = VALID_VALUES[schema_column]
+        dirty = _dirty_values(rng, options, cardinality)
+        dirty_values = list(dirty)
+        data[file_column] = [
+            rng.choice(dirty_values)
+            if dirty_values and rng.random() < typo_rate
+            else rng.choice([str.lower, str.upper, str])(rng.choice(options))
+            for _ in range(rows)
+        ]
+        column_mapping[file_column] = schema_column
+        expected[file_column] = {value.strip(): fix for value, fix in dirty.items()}
+
+    df = pd.DataFrame(data).astype(pd.ArrowDtype(pa.string()))
+    return df, column_mapping, config, expected
+
+
+def score_suggestions(results: dict, expected: dict[str, dict[str, str]]) -> dict:
+    distinct = correct = rows = correct_rows = suggested = 0
+    for column in results["columns"]:
+        fixes = expected[column["file_column"]]
+        for mapping in column["value_mappings"]:
+            if mapping["is_valid"]:
+                continue
+            distinct += 1
+            rows += mapping["count"]
+            suggested += mapping["replace_with"] is not None
+            if mapping["replace_with"] == fixes.get(mapping["value_found"]):
+                correct += 1
+                correct_rows += mapping["count"]
+    return {
+        "invalid_values": distinct,
+        "suggestion_rate": round(suggested / distinct, 4) if distinct else None,
+        "accuracy": round(correct / distinct, 4) if distinct else None,
+        "row_accuracy": round(correct_rows / rows, 4) if rows else None,
+    }
+
+
+def _run(case: dict, repeats: int, queue: multiprocessing.Queue) -> None:
+    from data_ingestion.utils.fuzzy_matching import (
+        build_fuzzy_matchers,
+        run_fuzzy_matching,
+    )
+    from loguru import logger
+
+    # Per-match debug logging would dominate the timings.
+    logger.disable("data_ingestion")
+
+    df, column_mapping, config, expected = generate_case(**case)
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.perf_counter()
+    matchers = build_fuzzy_matchers(config)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    timings = []
+    for _ in range(repeats + 1):
+        start = time.perf_counter()
+        results = run_fuzzy_matching(df, column_mapping, matchers)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings = timings[1:]  # The first run warms up rapidfuzz's thread pool.
+
+    tracemalloc.start()
+    run_fuzzy_matching(df, column_mapping, matchers)
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    queue.put(
+        {
+            **case,
+            "matcher_build_ms": round(build_ms, 3),
+            "latency_ms": {
+                "min": round(min(timings), 2),
+                "median": round(statistics.median(timings), 2),
+                "max": round(max(timings), 2),
+            },
+            "traced_peak_mb": round(traced_peak / 2**20, 2),
+            "peak_rss_mb": round(peak_kb / 1024, 1),
+            "match_rss_mb": round((peak_kb - baseline_kb) / 1024, 1),
+            **score_suggestions(results, expected),
+        }
+    )
+
+
+def run_case(case: dict, repeats: int) -> dict:
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=_run, args=(case, repeats, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def _case_key(result: dict) -> tuple:
+    return tuple(
+        result[name] for name in ("rows", "cardinality", "typo_rate", "columns")
+    )
+
+
+def compare(results: list[dict], baseline: dict) -> list[dict]:
+    """Latency ratio and accuracy change of each case also in ``baseline``."""
+    previous = {_case_key(result): result for result in baseline["results"]}
+    comparison = []
+    for result in results:
+        if (before := previous.get(_case_key(result))) is None:
+            continue
+        comparison.append(
+            {
+                "rows": result["rows"],
+                "cardinality": result["cardinality"],
+                "typo_rate": result["typo_rate"],
+                "columns": result["columns"],
+                "median_latency_ratio": round(
+                    result["latency_ms"]["median"]
+                    / max(before["latency_ms"]["median"], 1e-9),
+                    3,
+                ),
+                "accuracy_change": (
+                    None
+                    if result["accuracy"] is None or before["accuracy"] is None
+                    else round(result["accuracy"] - before["accuracy"], 4)
+                ),
+            }
+        )
+    return comparison
+
+
+def main(args: argparse.Namespace) -> None:
+    results = [
+        run_case(
+            {
+                "rows": rows,
+                "cardinality": cardinality,
+                "typo_rate": typo_rate,
+                "columns": columns,
+                "seed": args.seed,
+            },
+            args.repeats,
+        )
+        for rows, cardinality, typo_rate, columns in itertools.product(
+            args.rows, args.cardinality, args.typo_rate, args.columns
+        )
+    ]
+
+    report = {
+        "created": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": multiprocessing.cpu_count(),
+        "repeats": args.repeats,
+        "results": results,
+    }
+    if args.baseline:
+        report["comparison"] = compare(
+            results, json.loads(Path(args.baseline).read_text())
+        )
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--cardinality", type=int, nargs="+", default=[100, 2_000])
+    parser.add_argument("--typo-rate", type=float, nargs="+", default=[0.05, 0.3])
+    parser.add_argument("--columns", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="JSON results of an earlier run")
+    args = parser.parse_args()
+
+    main(args)
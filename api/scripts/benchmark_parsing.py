@@ -0,0 +1,155 @@
+"""
+Benchmark spreadsheet parsing for uploads: pandas defaults vs the Arrow engine.
+
+Generates a synthetic school dataset as CSV (of roughly ``--size-mb``) and as
+XLSX with the same rows, then parses each file with the previous pandas path
+(``pd.read_csv`` / ``pd.read_excel`` with object dtypes) and with
+``parse_spreadsheet``, both for the mapped columns only (as fuzzy validation
+and impact preview do) and for every column. Each parse
+runs in a fresh process so its peak RSS is not inflated by earlier runs.
+
+Usage:
+    python -m scripts.benchmark_parsing --size-mb 100
+"""
+
+import argparse
+import csv
+import json
+import multiprocessing
+import random
+import resource
+import tempfile
+import time
+from pathlib import Path
+
+import openpyxl
+
+MAPPED_COLUMNS = ["school_id_govt", "education_level_govt", "connectivity_govt"]
+EDUCATION_LEVELS = ["Primary", "Secondary", "Pre-Primary", "PRMARY", "secondry", ""]
+CONNECTIVITY = ["Yes", "No", "yes", "NO", "Unknown", ""]
+HEADER = [
+    "school_id_govt",
+    "school_name",
+    "education_level_govt",
+    "connectivity_govt",
+    "latitude",
+    "longitude",
+    "admin1",
+    "admin2",
+    "address",
+    "num_students",
+]
+
+
+def _rows(rng: random.Random):
+    i = 0
+    while True:
+        i += 1
+        yield [
+            f"{i:010d}",
+            f"School {rng.randrange(10**6)} {rng.choice(['North', 'South', 'East'])}",
+            rng.choice(EDUCATION_LEVELS),
+            rng.choice(CONNECTIVITY),
+            f"{rng.uniform(-35, 5):.6f}",
+            f"{rng.uniform(-75, -35):.6f}",
+            f"Region {rng.randrange(30)}",
+            f"District {rng.randrange(500)}",
+            f"{rng.randrange(9999)} Main Street, Town {rng.randrange(5000)}",
+            str(rng.randrange(20, 2000)),
+        ]
+
+
+def generate_files(directory: Path, size_mb: float) -> tuple[Path, Path, int]:
+    rng = random.Random(42)
+    csv_path = directory / "schools.csv"
+    xlsx_path = directory / "schools.xlsx"
+    target_bytes = int(size_mb * 1024 * 1024)
+
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(HEADER)
+
+    rows = 0
+    with csv_path.open("w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(HEADER)
+        for row in _rows(rng):
+            writer.writerow(row)
+            sheet.append(row)
+            rows += 1
+            if rows % 10_000 == 0 and handle.tell() >= target_bytes:
+                break
+
+    workbook.save(xlsx_path)
+    return csv_path, xlsx_path, rows
+
+
+def _parse(engine: str, path: str, queue: multiprocessing.Queue) -> None:
+    import pandas as pd
+    from data_ingestion.utils.spreadsheet import parse_spreadsheet
+
+    ext = Path(path).suffix
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+
+    if engine == "pandas":
+        if ext == ".csv":
+            df = pd.read_csv(path)
+        else:
+            df = pd.read_excel(path, engine="openpyxl")
+    elif engine == "arrow-mapped":
+        df = parse_spreadsheet(Path(path).read_bytes(), ext, MAPPED_COLUMNS)
+    else:
+        df = parse_spreadsheet(Path(path).read_bytes(), ext)
+
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put(
+        {
+            "rows": len(df.index),
+            "columns": len(df.columns),
+            "seconds": round(elapsed, 2),
+            "peak_rss_mb": round(peak_kb / 1024, 1),
+            "parse_rss_mb": round((peak_kb - baseline_kb) / 1024, 1),
+        }
+    )
+
+
+def run_case(engine: str, path: Path) -> dict:
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=_parse, args=(engine, str(path), queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return {"file": path.name, "engine": engine, **result}
+
+
+def main(size_mb: float, formats: list[str]) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path, xlsx_path, rows = generate_files(Path(directory), size_mb)
+        paths = {"csv": csv_path, "xlsx": xlsx_path}
+
+        results = []
+        for file_format in formats:
+            path = paths[file_format]
+            for engine in ("pandas", "arrow-mapped", "arrow-all"):
+                results.append(
+                    {
+                        "file_mb": round(path.stat().st_size / 2**20, 1),
+                        **run_case(engine, path),
+                    }
+                )
+
+    print(json.dumps({"generated_rows": rows, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=float, default=100)
+    parser.add_argument(
+        "--formats", nargs="+", choices=["csv", "xlsx"], default=["csv", "xlsx"]
+    )
+    args = parser.parse_args()
+
+    main(args.size_mb, args.formats)
@@ -0,0 +1,163 @@
+"""
+Benchmark request-path blob I/O against any configured storage backend.
+
+Simulates a burst of concurrent API requests doing a mix of uploads and
+downloads through the storage backend. On the Azure backend (ADLS or Azurite)
+the burst is also replayed with the synchronous container client, to show how
+long it stalls the event loop: a probe coroutine ticks on the loop
+throughout, so its lag shows how long unrelated requests would have waited.
+The local and in-memory backends need no Azure access, so they also run on a
+laptop or in CI.
+
+Usage:
+    python -m scripts.benchmark_storage --requests 40 --size-mb 5 --backend local
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+from uuid import uuid4
+
+from data_ingestion.settings import StorageBackendName, settings
+from data_ingestion.storage import (
+    StorageBackend,
+    close_storage,
+    create_storage,
+    get_storage,
+    set_storage,
+)
+
+from azure.storage.blob import BlobServiceClient, ContainerClient
+
+BENCHMARK_PREFIX = "benchmarks/storage"
+PROBE_INTERVAL_SECONDS = 0.01
+
+
+def _percentile(values: list[float], percentile: int) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method="inclusive")[percentile - 1]
+
+
+async def _probe_event_loop(stop: asyncio.Event, lags: list[float]) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL_SECONDS)
+        elapsed = time.perf_counter() - start
+        lags.append((elapsed - PROBE_INTERVAL_SECONDS) * 1000)
+
+
+def _sync_container_client() -> ContainerClient:
+    if settings.AZURE_STORAGE_CONNECTION_STRING:
+        client = BlobServiceClient.from_connection_string(
+            settings.AZURE_STORAGE_CONNECTION_STRING
+        )
+    else:
+        client = BlobServiceClient(
+            f"https://{settings.AZURE_STORAGE_ACCOUNT_NAME}.blob.core.windows.net",
+            credential=settings.AZURE_SAS_TOKEN,
+        )
+    return client.get_container_client(settings.AZURE_BLOB_CONTAINER_NAME)
+
+
+def _sync_request(container: ContainerClient):
+    async def request(path: str, payload: bytes | None) -> float:
+        start = time.perf_counter()
+        blob = container.get_blob_client(path)
+        if payload is not None:
+            blob.upload_blob(payload, overwrite=True)
+        else:
+            blob.download_blob().readall()
+        return (time.perf_counter() - start) * 1000
+
+    return request
+
+
+def _async_request(storage: StorageBackend):
+    async def request(path: str, payload: bytes | None) -> float:
+        start = time.perf_counter()
+        if payload is not None:
+            await storage.put(path, payload)
+        else:
+            await storage.get(path)
+        return (time.perf_counter() - start) * 1000
+
+    return request
+
+
+async def run_mode(mode: str, requests: int, payload: bytes) -> dict:
+    storage = get_storage()
+    run_prefix = f"{BENCHMARK_PREFIX}/{uuid4().hex}"
+    download_path = f"{run_prefix}/download.bin"
+    await storage.put(download_path, payload)
+
+    request = (
+        _sync_request(_sync_container_client())
+        if mode == "sync"
+        else _async_request(storage)
+    )
+    stop = asyncio.Event()
+    lags: list[float] = []
+    probe = asyncio.create_task(_probe_event_loop(stop, lags))
+
+    start = time.perf_counter()
+    latencies = await asyncio.gather(
+        *(
+            request(f"{run_prefix}/upload-{i}.bin", payload)
+            if i % 2 == 0
+            else request(download_path, None)
+            for i in range(requests)
+        )
+    )
+    wall_seconds = time.perf_counter() - start
+
+    stop.set()
+    await probe
+
+    async for blob in storage.list(run_prefix):
+        await storage.delete(blob.name)
+
+    return {
+        "backend": settings.STORAGE_BACKEND.value,
+        "mode": mode,
+        "requests": requests,
+        "payload_bytes": len(payload),
+        "wall_seconds": round(wall_seconds, 3),
+        "latency_p50_ms": round(_percentile(latencies, 50), 1),
+        "latency_p95_ms": round(_percentile(latencies, 95), 1),
+        "latency_p99_ms": round(_percentile(latencies, 99), 1),
+        "loop_lag_p99_ms": round(_percentile(lags, 99), 1),
+        "loop_lag_max_ms": round(max(lags, default=0.0), 1),
+    }
+
+
+async def main(requests: int, size_mb: float, backend: StorageBackendName):
+    settings.STORAGE_BACKEND = backend
+    set_storage(create_storage(backend))
+
+    modes = ["sync", "async"] if backend == StorageBackendName.AZURE else ["async"]
+    payload = os.urandom(int(size_mb * 1024 * 1024))
+    try:
+        results = [await run_mode(mode, requests, payload) for mode in modes]
+    finally:
+        await close_storage()
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=40)
+    parser.add_argument("--size-mb", type=float, default=5)
+    parser.add_argument(
+        "--backend",
+        type=StorageBackendName,
+        choices=list(StorageBackendName),
+        default=settings.STORAGE_BACKEND,
+    )
+    args = parser.parse_args()
+
+    asyncio.run(main(args.requests, args.size_mb, args.backend))
@@ -0,0 +1,160 @@
+"""
+Load test unrelated endpoint latency while heavy Trino queries run.
+
+Serves a small app in process with an unrelated ``/health`` route and a
+heavy query route, then keeps ``--concurrency`` heavy requests in flight
+for ``--duration`` seconds while probing ``/health``. The heavy route runs
+either the way routes used to, calling the synchronous Trino session from
+the event loop (``blocking``), or through ``AsyncTrinoSession`` (``async``).
+
+By default the heavy query is simulated: an SQLite session that sleeps for
+``--query-seconds`` before each query. Pass ``--query`` to run that SQL on
+the configured Trino instead.
+
+Usage:
+    python -m scripts.load_test_trino --concurrency 8 --duration 10 \
+        --output trino-load.json
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from pathlib import Path
+
+import httpx
+from data_ingestion.db.trino import AsyncTrinoSession, close_trino_executor
+from fastapi import FastAPI
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+
+def get_session_factory(args: argparse.Namespace):
+    if args.query:
+        from data_ingestion.db.trino import session_maker
+
+        return session_maker, text(args.query)
+
+    # Sessions are closed on the event loop, not on the thread that ran them.
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False})
+
+    class SlowSession(Session):
+        def execute(self, *a, **kw):
+            time.sleep(args.query_seconds)
+            return super().execute(*a, **kw)
+
+    return lambda: SlowSession(engine), text("SELECT 1")
+
+
+def build_app(args: argparse.Namespace) -> FastAPI:
+    session_factory, query = get_session_factory(args)
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    @app.get("/heavy/blocking")
+    async def heavy_blocking():
+        session = session_factory()
+        try:
+            return {"rows": len(session.execute(query).all())}
+        finally:
+            session.close()
+
+    @app.get("/heavy/async")
+    async def heavy_async():
+        db = AsyncTrinoSession(session_factory)
+        try:
+            return {"rows": len((await db.execute(query)).all())}
+        finally:
+            db.close()
+
+    return app
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+async def run_mode(app: FastAPI, mode: str, args: argparse.Namespace) -> dict:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://test", timeout=None
+    ) as client:
+        deadline = time.perf_counter() + args.duration
+        heavy_done = 0
+
+        async def heavy():
+            nonlocal heavy_done
+            while time.perf_counter() < deadline:
+                (await client.get(f"/heavy/{mode}")).raise_for_status()
+                heavy_done += 1
+
+        async def probe() -> list[float]:
+            # Probes are due every interval; latency is counted from when a
+            # probe was due, so time the event loop was stalled counts too.
+            start = time.perf_counter()
+            latencies = []
+            for i in range(int(args.duration / args.probe_interval)):
+                due = start + i * args.probe_interval
+                await asyncio.sleep(max(0.0, due - time.perf_counter()))
+                (await client.get("/health")).raise_for_status()
+                latencies.append((time.perf_counter() - due) * 1000)
+            return latencies
+
+        latencies, *_ = await asyncio.gather(
+            probe(), *(heavy() for _ in range(args.concurrency))
+        )
+
+    return {
+        "mode": mode,
+        "heavy_requests": heavy_done,
+        "health_requests": len(latencies),
+        "health_latency_ms": {
+            "p50": round(statistics.median(latencies), 2),
+            "p95": round(_percentile(latencies, 95), 2),
+            "p99": round(_percentile(latencies, 99), 2),
+            "max": round(max(latencies), 2),
+        },
+    }
+
+
+def main(args: argparse.Namespace) -> None:
+    app = build_app(args)
+    results = [asyncio.run(run_mode(app, mode, args)) for mode in args.modes]
+    close_trino_executor()
+
+    output = json.dumps(
+        {
+            "concurrency": args.concurrency,
+            "duration_seconds": args.duration,
+            "query": args.query or f"simulated, {args.query_seconds}s",
+            "results": results,
+        },
+        indent=2,
+    )
+    if args.output:
+        Path(args.output).write_text(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        choices=["blocking", "async"],
+        default=["blocking", "async"],
+    )
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=5)
+    parser.add_argument("--query-seconds", type=float, default=0.5)
+    parser.add_argument("--query", help="SQL to run on the configured Trino")
+    parser.add_argument("--probe-interval", type=float, default=0.01)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    args = parser.parse_args()
+
+    main(args)
@@ -0,0 +1,91 @@
+import pytest
+from data_ingestion.internal.uploads import prepare_file_upload
+from data_ingestion.models import FileUpload
+from data_ingestion.storage import set_storage
+from data_ingestion.storage.memory import InMemoryStorage
+
+
+@pytest.fixture
+def storage():
+    """An empty in-memory storage backend, active for the duration of a test."""
+    storage = InMemoryStorage()
+    set_storage(storage)
+    yield storage
+    set_storage(None)
+
+
+def make_file_upload(**fields) -> FileUpload:
+    """A prepared geolocation upload for Brazil; ``fields`` override the defaults."""
+    return prepare_file_upload(
+        FileUpload(
+            **{
+                "uploader_id": "user-1",
+                "uploader_email": "user@example.com",
+                "country": "BRA",
+                "dataset": "geolocation",
+                "original_filename": "schools.csv",
+                **fields,
+            }
+        )
+    )
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = list(rows)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def scalar(self):
+        return self.rows[0] if self.rows else None
+
+    def scalars(self):
+        return iter(self.rows)
+
+    def mappings(self):
+        return iter(self.rows)
+
+
+class FakeSyncSession:
+    """
+    A database session that records every statement it is given and answers
+    it with ``rows``; subclasses override :meth:`rows_for` to answer by query.
+    """
+
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.statements = []
+        self.params = []
+
+    def rows_for(self, statement, params):
+        return self.rows
+
+    def _query(self, statement, params=None) -> FakeResult:
+        self.statements.append(statement)
+        self.params.append(params)
+        return FakeResult(self.rows_for(statement, params))
+
+    def execute(self, statement, params=None):
+        return self._query(statement, params)
+
+
+class FakeSession(FakeSyncSession):
+    """The ``AsyncSession`` counterpart of :class:`FakeSyncSession`."""
+
+    rolled_back = False
+
+    async def execute(self, statement, params=None):
+        return self._query(statement, params)
+
+    async def scalar(self, statement, params=None):
+        return self._query(statement, params).scalar()
+
+    async def scalars(self, statement, params=None):
+        return self._query(statement, params).scalars()
+
+    async def commit(self):
+        pass
+
+    async def rollback(self):
+        self.rolled_back = True
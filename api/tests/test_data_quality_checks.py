@@ -0,0 +1,103 @@
+import asyncio
+import json
+
+import orjson
+import pytest
+from data_ingestion.internal import data_quality_checks
+from data_ingestion.internal.data_quality_checks import get_data_quality_summary_json
+from fastapi import HTTPException
+
+PATH = "dq/report.json"
+SUMMARY = {
+    "summary": {"rows": 3},
+    "critical": [
+        {"assertion": "is_valid", "column": "b", "count_failed": 1},
+        {"assertion": "mandatory_null", "column": "z", "count_failed": 0},
+        {"assertion": "is_valid", "column": "a", "count_failed": 1},
+        {"assertion": "is_valid", "column": "c", "count_failed": 5},
+    ],
+}
+
+
+@pytest.fixture
+def storage(storage, monkeypatch):
+    """The storage holding ``SUMMARY``, counting property reads and downloads."""
+    storage.reads = storage.downloads = 0
+    properties, open_blob = storage.properties, storage.open
+
+    async def counting_properties(path):
+        storage.reads += 1
+        return await properties(path)
+
+    async def counting_open(path, **kwargs):
+        storage.downloads += 1
+        return await open_blob(path, **kwargs)
+
+    monkeypatch.setattr(storage, "properties", counting_properties)
+    monkeypatch.setattr(storage, "open", counting_open)
+    asyncio.run(storage.put(PATH, json.dumps(SUMMARY).encode()))
+    return storage
+
+
+@pytest.fixture
+def redis(monkeypatch) -> dict[str, bytes]:
+    redis: dict[str, bytes] = {}
+
+    async def get_cache_bytes(key):
+        return redis.get(key)
+
+    async def set_cache_string(key, value):
+        redis[key] = value
+
+    monkeypatch.setattr(data_quality_checks, "get_cache_bytes", get_cache_bytes)
+    monkeypatch.setattr(data_quality_checks, "set_cache_string", set_cache_string)
+    data_quality_checks._dq_summary_cache.clear()
+    return redis
+
+
+# The summary is sorted once; repeat reads are one bodiless properties request.
+def test_get_data_quality_summary_json_caches_sorted_payload(storage, redis):
+    first = asyncio.run(get_data_quality_summary_json(PATH))
+    second = asyncio.run(get_data_quality_summary_json(PATH))
+
+    assert first == second
+    assert storage.reads == 2
+    assert storage.downloads == 1
+    assert list(redis.values()) == [first]
+    assert [check["column"] for check in orjson.loads(first)["critical"]] == [
+        "z",
+        "c",
+        "a",
+        "b",
+    ]
+
+
+# A new ETag means the blob was rewritten, so the summary is read again.
+def test_get_data_quality_summary_json_misses_on_new_etag(storage, redis):
+    asyncio.run(get_data_quality_summary_json(PATH))
+    asyncio.run(storage.put(PATH, json.dumps(SUMMARY).encode()))
+    asyncio.run(get_data_quality_summary_json(PATH))
+
+    assert storage.downloads == 2
+    assert len(redis) == 2
+
+
+# A worker with a cold local cache reuses the summary another one put in Redis.
+def test_get_data_quality_summary_json_reuses_redis_payload(storage, redis):
+    asyncio.run(get_data_quality_summary_json(PATH))
+    data_quality_checks._dq_summary_cache.clear()
+    redis[next(iter(redis))] = b'{"cached":true}'
+
+    assert asyncio.run(get_data_quality_summary_json(PATH)) == b'{"cached":true}'
+    assert storage.reads == 2
+    assert storage.downloads == 1
+
+
+# A missing summary is a 404.
+def test_get_data_quality_summary_json_missing_blob(storage, redis):
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(get_data_quality_summary_json("dq/missing.json", "No summary"))
+
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.detail == "No summary"
+    assert storage.downloads == 0
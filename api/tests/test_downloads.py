@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+from data_ingestion.internal import downloads
+from data_ingestion.internal.downloads import (
+    blob_download_response,
+    parse_range_header,
+    stream_blob,
+)
+from data_ingestion.settings import ArtifactDownloadMode
+from fastapi import Request
+from starlette.responses import StreamingResponse
+
+CONTENT = b"0123456789" * 10
+PATH = "some/path.csv"
+
+
+@pytest.fixture
+def storage(storage, monkeypatch):
+    async def get_read_url(path, **kwargs):
+        storage.signed = {"path": path, **kwargs}
+        return f"https://storage.example/{path}?sig=abc"
+
+    monkeypatch.setattr(storage, "get_read_url", get_read_url)
+    asyncio.run(storage.put(PATH, CONTENT, content_type="text/csv"))
+    return storage
+
+
+def _request(headers: dict[str, str], method: str = "GET") -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": method,
+            "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+        }
+    )
+
+
+# Only single, explicit byte ranges are passed through to storage.
+def test_parse_range_header():
+    assert parse_range_header("bytes=0-99") == (0, 99)
+    assert parse_range_header("bytes=100-") == (100, None)
+    assert parse_range_header("bytes=-500") is None
+    assert parse_range_header("bytes=0-1,5-6") is None
+    assert parse_range_header("bytes=9-3") is None
+    assert parse_range_header(None) is None
+
+
+# A Range request is answered with a ranged read and a 206.
+def test_stream_blob_serves_partial_content(storage):
+    etag = asyncio.run(storage.properties(PATH)).etag
+
+    response = asyncio.run(stream_blob(_request({"Range": "bytes=10-19"}), PATH))
+
+    assert isinstance(response, StreamingResponse)
+    assert response.status_code == 206
+    assert response.headers["content-range"] == "bytes 10-19/100"
+    assert response.headers["content-length"] == "10"
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["etag"] == etag
+    assert "last-modified" in response.headers
+
+
+# A matching If-None-Match is answered with a bodiless 304.
+def test_stream_blob_returns_not_modified(storage):
+    etag = asyncio.run(storage.properties(PATH)).etag
+
+    response = asyncio.run(stream_blob(_request({"If-None-Match": etag}), PATH))
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == etag
+
+
+# HEAD is answered from the blob's properties, without opening it.
+def test_stream_blob_answers_head_without_reading(storage, monkeypatch):
+    async def fail_open(*args, **kwargs):
+        raise AssertionError("HEAD must not read the blob")
+
+    monkeypatch.setattr(storage, "open", fail_open)
+    etag = asyncio.run(storage.properties(PATH)).etag
+
+    response = asyncio.run(stream_blob(_request({}, "HEAD"), PATH))
+    not_modified = asyncio.run(
+        stream_blob(_request({"If-None-Match": etag}, "HEAD"), PATH)
+    )
+
+    assert response.status_code == 200
+    assert response.body == b""
+    assert response.headers["content-length"] == "100"
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["etag"] == etag
+    assert not_modified.status_code == 304
+
+
+# In redirect mode the client is sent to a signed blob URL instead of proxied.
+def test_blob_download_response_redirects_to_read_url(storage, monkeypatch):
+    monkeypatch.setattr(
+        downloads.settings, "ARTIFACT_DOWNLOAD_MODE", ArtifactDownloadMode.REDIRECT
+    )
+
+    response = asyncio.run(
+        blob_download_response(
+            _request({}),
+            PATH,
+            headers={"Content-Disposition": "attachment; filename=path.csv"},
+        )
+    )
+
+    assert response.status_code == 307
+    assert response.headers["location"] == f"https://storage.example/{PATH}?sig=abc"
+    assert storage.signed == {
+        "path": PATH,
+        "content_type": "text/csv",
+        "content_disposition": "attachment; filename=path.csv",
+    }
@@ -0,0 +1,144 @@
+import asyncio
+import io
+import zipfile
+from pathlib import Path
+
+from data_ingestion.api import app
+from data_ingestion.db.primary import get_db
+from data_ingestion.internal import downloads
+from data_ingestion.internal.auth import azure_scheme, local_auth_bypass
+from data_ingestion.permissions import permissions
+from data_ingestion.settings import ArtifactDownloadMode
+from data_ingestion.storage import BlobDownload
+from data_ingestion.utils.dq_kit_generator import DQKitManager, get_map_blob_path
+from fastapi.testclient import TestClient
+
+from tests.conftest import FakeSession, make_file_upload
+
+DQ_ROOT = "data-quality-results/school-geolocation"
+
+
+def _file_upload():
+    return make_file_upload(
+        id="upload-1",
+        dq_full_path=f"{DQ_ROOT}/dq-overall/BRA/upload-1_BRA_geolocation.csv",
+        dq_report_path=f"{DQ_ROOT}/dq-summary/BRA/upload-1_BRA_geolocation.json",
+    )
+
+
+# Without a pre-built ZIP, the kit is streamed from whichever artifacts exist.
+def test_stream_zip_assembles_available_artifacts(storage):
+    file_upload = _file_upload()
+    failed_rows = b"school_id,error\n" + b"1,missing\n" * 50_000
+
+    async def run() -> bytes:
+        await storage.put(file_upload.upload_path, b"school_id\n1\n")
+        await storage.put(
+            f"{DQ_ROOT}/dq-failed-rows-human-readable/BRA/upload-1_BRA_geolocation.csv",
+            failed_rows,
+        )
+        manager = DQKitManager(file_upload)
+        chunks = manager.stream_zip(manager.artifacts())
+        return b"".join([chunk async for chunk in chunks])
+
+    with zipfile.ZipFile(io.BytesIO(asyncio.run(run()))) as zf:
+        assert zf.namelist() == [
+            f"raw_data/{Path(file_upload.upload_path).name}",
+            "failed_rows/upload-1_BRA_geolocation.csv",
+        ]
+        assert zf.read("failed_rows/upload-1_BRA_geolocation.csv") == failed_rows
+        assert zf.testzip() is None
+
+
+# With no artifacts at all, nothing is yielded, so the route can answer 404.
+def test_stream_zip_yields_nothing_without_artifacts(storage):
+    manager = DQKitManager(_file_upload())
+
+    async def run() -> list[bytes]:
+        return [chunk async for chunk in manager.stream_zip(manager.artifacts())]
+
+    assert asyncio.run(run()) == []
+
+
+# Artifacts are opened one at a time, and the one being read is closed when
+# the consumer stops early.
+def test_stream_zip_opens_artifacts_lazily_and_closes_them(storage, monkeypatch):
+    file_upload = _file_upload()
+    opened, closed = [], []
+    open_blob = storage.open
+
+    async def counting_open(path, **kwargs):
+        opened.append(path)
+        return await open_blob(path, **kwargs)
+
+    async def aclose(download):
+        closed.append(download.properties.name)
+
+    monkeypatch.setattr(storage, "open", counting_open)
+    monkeypatch.setattr(BlobDownload, "aclose", aclose)
+
+    async def run():
+        await storage.put(file_upload.upload_path, b"school_id\n" + b"1\n" * 500_000)
+        await storage.put(file_upload.dq_report_path, b"{}")
+        manager = DQKitManager(file_upload)
+        chunks = manager.stream_zip(manager.artifacts())
+        await anext(chunks)
+        await chunks.aclose()
+
+    asyncio.run(run())
+
+    assert opened == [file_upload.upload_path]
+    assert closed == [file_upload.upload_path]
+
+
+# Whether a kit can be built is told from the artifacts' existence alone.
+def test_has_artifacts_does_not_read_them(storage, monkeypatch):
+    file_upload = _file_upload()
+    manager = DQKitManager(file_upload)
+
+    async def fail_open(*args, **kwargs):
+        raise AssertionError("artifacts must not be read")
+
+    monkeypatch.setattr(storage, "open", fail_open)
+
+    async def run():
+        before = await manager.has_artifacts(manager.artifacts())
+        await storage.put(file_upload.dq_report_path, b"{}")
+        return before, await manager.has_artifacts(manager.artifacts())
+
+    assert asyncio.run(run()) == (False, True)
+
+
+# The map is always proxied, so it keeps its framing and inline headers even
+# when other artifacts are served by redirect.
+def test_school_map_is_proxied_in_redirect_mode(storage, monkeypatch):
+    file_upload = _file_upload()
+    map_path = get_map_blob_path(file_upload)
+    asyncio.run(storage.put(map_path, b"<html></html>", content_type="text/html"))
+
+    async def get_primary_db():
+        yield FakeSession([file_upload])
+
+    async def get_user_roles(*args):
+        return ["Admin"]
+
+    async def get_read_url(path, **kwargs):
+        return f"https://storage.example/{path}?sig=abc"
+
+    monkeypatch.setattr(storage, "get_read_url", get_read_url)
+    monkeypatch.setattr(
+        downloads.settings, "ARTIFACT_DOWNLOAD_MODE", ArtifactDownloadMode.REDIRECT
+    )
+    monkeypatch.setattr(permissions, "get_user_roles", get_user_roles)
+    monkeypatch.setitem(app.dependency_overrides, azure_scheme, local_auth_bypass)
+    monkeypatch.setitem(app.dependency_overrides, get_db, get_primary_db)
+
+    response = TestClient(app).get(
+        f"/api/upload/map/{file_upload.id}", follow_redirects=False
+    )
+
+    assert response.status_code == 200
+    assert response.content == b"<html></html>"
+    assert response.headers["content-type"].startswith("text/html")
+    assert response.headers["x-frame-options"] == "SAMEORIGIN"
+    assert response.headers["content-disposition"].startswith("inline")
@@ -0,0 +1,160 @@
+import asyncio
+import io
+import zipfile
+from datetime import datetime
+
+import openpyxl
+from data_ingestion.routers import upload
+from data_ingestion.utils.fuzzy_corrections import (
+    CorrectedCsvStream,
+    iter_corrected_csv,
+    write_corrected_xlsx,
+)
+from data_ingestion.utils.spreadsheet import dedupe_column_names
+from fastapi import UploadFile
+
+
+def _correct_csv(content: bytes, replacements: dict) -> bytes:
+    return b"".join(
+        iter_corrected_csv(io.BytesIO(content), replacements, dedupe_column_names)
+    )
+
+
+# Only the replaced cells change; quoting, endings and number formats are kept.
+def test_csv_corrections_preserve_other_bytes():
+    content = (
+        b"\xef\xbb\xbfid,level,note,level\r\n"
+        b'007,Prmary,"a, b",Prmary\r\n'
+        b'1.50,"Prmary","multi\r\nline",x\r\n'
+        b"2024-01-02,Secondary,,Prmary"
+    )
+
+    corrected = _correct_csv(
+        content, {"level": {"Prmary": "Primary, lower"}, "missing": {"a": "b"}}
+    )
+
+    assert corrected == (
+        b"\xef\xbb\xbfid,level,note,level\r\n"
+        b'007,"Primary, lower","a, b",Prmary\r\n'
+        b'1.50,"Primary, lower","multi\r\nline",x\r\n'
+        b"2024-01-02,Secondary,,Prmary"
+    )
+    assert _correct_csv(content, {"level": {"Tertiary": "x"}}) == content
+
+
+# A quote inside an unquoted field is literal, as for the parser, and does not
+# swallow the records after it.
+def test_csv_corrections_treat_stray_quotes_as_text():
+    content = b'id,size,level\n1,5" screen,Prmary\n2,"a ""b""",Prmary\n3,x,Prmary\n'
+
+    assert _correct_csv(content, {"level": {"Prmary": "Primary"}}) == (
+        content.replace(b"Prmary", b"Primary")
+    )
+
+
+# The async stream hands out the corrected CSV in reads of the requested size.
+def test_corrected_csv_stream_reads_in_chunks():
+    content = b"id,level\n" + b"".join(b"%d,Prmary\n" % i for i in range(1000))
+    stream = CorrectedCsvStream(
+        io.BytesIO(content), {"level": {"Prmary": "Primary"}}, dedupe_column_names
+    )
+
+    async def read_all() -> list[bytes]:
+        chunks = []
+        while chunk := await stream.read(4096):
+            chunks.append(chunk)
+        return chunks
+
+    chunks = asyncio.run(read_all())
+
+    assert all(len(chunk) == 4096 for chunk in chunks[:-1])
+    assert b"".join(chunks) == content.replace(b"Prmary", b"Primary")
+
+
+# XLSX corrections touch only matching cells of the first sheet.
+def test_xlsx_corrections_keep_cell_types():
+    workbook = openpyxl.Workbook()
+    workbook.active.append(["id", "level", "when", "total"])
+    workbook.active.append([7, "Prmary", datetime(2024, 1, 2), "=A2*2"])
+    workbook.active.append([8.5, "Secondary", None, None])
+    workbook.create_sheet("notes").append(["Prmary"])
+    source = io.BytesIO()
+    workbook.save(source)
+    source.seek(0)
+
+    destination = io.BytesIO()
+    write_corrected_xlsx(
+        source, {"level": {"Prmary": "Primary"}}, dedupe_column_names, destination
+    )
+    destination.seek(0)
+    corrected = openpyxl.load_workbook(destination)
+
+    assert list(corrected.worksheets[0].values) == [
+        ("id", "level", "when", "total"),
+        (7, "Primary", datetime(2024, 1, 2), "=A2*2"),
+        (8.5, "Secondary", None, None),
+    ]
+    assert list(corrected["notes"].values) == [("Prmary",)]
+
+
+# XLSX cells and headers are matched on the text the user saw, so numbers
+# stored as 7.0 (as some writers store them) are "7".
+def test_xlsx_corrections_match_parsed_text():
+    workbook = openpyxl.Workbook()
+    workbook.active.append(["id", 2024])
+    workbook.active.append([1, 7])
+    workbook.active.append([2, "7.0"])
+    saved = io.BytesIO()
+    workbook.save(saved)
+    source = io.BytesIO()
+    with zipfile.ZipFile(saved) as zin, zipfile.ZipFile(source, "w") as zout:
+        for item in zin.infolist():
+            data = zin.read(item)
+            if item.filename == "xl/worksheets/sheet1.xml":
+                data = data.replace(b"<v>2024</v>", b"<v>2024.0</v>")
+                data = data.replace(b"<v>7</v>", b"<v>7.0</v>")
+            zout.writestr(item, data)
+    source.seek(0)
+
+    destination = io.BytesIO()
+    write_corrected_xlsx(
+        source, {"2024": {"7": "Seven"}}, dedupe_column_names, destination
+    )
+    destination.seek(0)
+    corrected = openpyxl.load_workbook(destination)
+
+    assert [row[1] for row in corrected.active.values] == [2024, "Seven", "7.0"]
+
+
+# A failed XLSX rewrite closes its temporary file and the original is uploaded.
+def test_apply_fuzzy_corrections_closes_temp_file_on_failure(monkeypatch):
+    temp_files = []
+
+    def temporary_file():
+        temp_files.append(io.BytesIO())
+        return temp_files[-1]
+
+    monkeypatch.setattr(upload.tempfile, "TemporaryFile", temporary_file)
+    file = UploadFile(io.BytesIO(b"not a workbook"), filename="schools.xlsx")
+    corrections = '[{"column_name": "level", "value_found": "a", "replace_with": "b"}]'
+
+    stream = asyncio.run(upload._apply_fuzzy_corrections(file, ".xlsx", corrections))
+
+    assert stream is file
+    assert len(temp_files) == 1
+    assert temp_files[0].closed
+
+
+# A CSV whose quoted field is never closed is uploaded as it is, not corrected
+# only up to the open quote.
+def test_apply_fuzzy_corrections_skips_csv_with_open_quote():
+    content = b'id,level\n1,Prmary\n2,"Prmary\n3,Prmary\n'
+    file = UploadFile(io.BytesIO(content), filename="schools.csv")
+    corrections = (
+        '[{"column_name": "level", "value_found": "Prmary", "replace_with": "Primary"}]'
+    )
+
+    stream = asyncio.run(upload._apply_fuzzy_corrections(file, ".csv", corrections))
+
+    assert stream is file
+    assert asyncio.run(file.read()) == content
@@ -0,0 +1,58 @@
+import asyncio
+
+import orjson
+import pytest
+from data_ingestion.utils import fuzzy_matching
+
+CONFIG = {
+    "education_level_govt": {
+        "dropdown_options": ["Primary"],
+        "matching_map": {"primary": "Primary"},
+    }
+}
+
+
+@pytest.fixture
+def caches(monkeypatch):
+    redis: dict[str, bytes] = {}
+    calls = []
+
+    async def get_cache_bytes(key):
+        return redis.get(key)
+
+    async def set_cache_string(key, value, ttl_seconds=None):
+        redis[key] = value
+
+    async def from_nocodb():
+        calls.append(1)
+        return CONFIG if len(calls) > 1 else {}
+
+    monkeypatch.setattr(fuzzy_matching, "get_cache_bytes", get_cache_bytes)
+    monkeypatch.setattr(fuzzy_matching, "set_cache_string", set_cache_string)
+    monkeypatch.setattr(
+        fuzzy_matching, "get_fuzzy_match_config_from_nocodb", from_nocodb
+    )
+    fuzzy_matching._fuzzy_matchers_cache.clear()
+    yield redis, calls
+    fuzzy_matching._fuzzy_matchers_cache.clear()
+
+
+# A failed NocoDB read is not cached; a good one is served from cache afterwards.
+def test_fuzzy_match_config_cached_after_first_good_read(caches):
+    redis, calls = caches
+
+    assert asyncio.run(fuzzy_matching.get_fuzzy_match_config()) == {}
+    assert asyncio.run(fuzzy_matching.get_fuzzy_match_config()) == CONFIG
+    assert asyncio.run(fuzzy_matching.get_fuzzy_match_config()) == CONFIG
+
+    assert len(calls) == 2
+    assert orjson.loads(redis[fuzzy_matching.FUZZY_MATCH_CONFIG_KEY]) == CONFIG
+
+
+# With Redis warm, a worker never queries NocoDB.
+def test_fuzzy_match_config_reads_warm_redis(caches):
+    redis, calls = caches
+    redis[fuzzy_matching.FUZZY_MATCH_CONFIG_KEY] = orjson.dumps(CONFIG)
+
+    assert asyncio.run(fuzzy_matching.get_fuzzy_match_config()) == CONFIG
+    assert calls == []
@@ -0,0 +1,91 @@
+import pandas as pd
+from data_ingestion.utils.fuzzy_matching import (
+    FuzzyMatcher,
+    build_fuzzy_matchers,
+    extract_valid_values_from_rows,
+    fuzzy_match_value,
+    process_column_fuzzy_matching,
+    run_fuzzy_matching,
+)
+
+VALID_VALUES = ["Pre-Primary", "Primary", "Secondary"]
+MATCHING_MAP = {value.lower(): value for value in VALID_VALUES}
+MATCHER = FuzzyMatcher(VALID_VALUES, MATCHING_MAP)
+
+
+# Each distinct value gets the same suggestion it would get on its own.
+def test_process_column_fuzzy_matching_batches_unmatched_values():
+    value_counts = pd.Series(
+        {
+            "primary": 5,
+            "PRMARY": 3,
+            "secondry ": 2,
+            "secondry": 1,
+            "not known": 1,
+            "xyz": 1,
+            None: 4,
+        }
+    )
+
+    mappings, total_unknown = process_column_fuzzy_matching(value_counts, MATCHER)
+
+    assert total_unknown == 8
+    assert [
+        (m["value_found"], m["count"], m["replace_with"], m["is_valid"])
+        for m in mappings
+    ] == [
+        ("primary", 5, "Primary", True),
+        ("PRMARY", 3, "Primary", False),
+        ("secondry", 2, "Secondary", False),
+        ("secondry", 1, "Secondary", False),
+        ("not known", 1, "Unknown", False),
+        ("xyz", 1, "Unknown", False),
+        ("null/nan/empty", 4, "Unknown", True),
+    ]
+    for value in ("PRMARY", "secondry", "not known", "xyz"):
+        suggestion = next(m for m in mappings if m["value_found"] == value)
+        assert fuzzy_match_value(value, MATCHING_MAP)[0] == suggestion["replace_with"]
+
+
+# Confirmed corrections skip the scorer and are listed before other suggestions.
+def test_run_fuzzy_matching_suggests_learned_corrections_first():
+    df = pd.DataFrame({"level": ["Prim", "PRMARY", "sec. school", "sec. school"]})
+    config = {
+        "education_level_govt": {
+            "dropdown_options": VALID_VALUES,
+            "matching_map": MATCHING_MAP,
+        }
+    }
+    learned = {"education_level_govt": {"sec. school": "Secondary", "prim": "Gone"}}
+
+    [column] = run_fuzzy_matching(
+        df, {"level": "education_level_govt"}, build_fuzzy_matchers(config), learned
+    )["columns"]
+
+    assert column["unknown_count"] == 4
+    assert column["value_mappings"][0] == {
+        "value_found": "sec. school",
+        "count": 2,
+        "replace_with": "Secondary",
+        "is_valid": False,
+        "is_confirmed": True,
+    }
+    assert not any(m["is_confirmed"] for m in column["value_mappings"][1:])
+
+
+# Options are deduped case-insensitively, the first spelling kept; the map
+# keeps the last one, and the matcher prepares its targets once.
+def test_fuzzy_matcher_from_nocodb_rows():
+    rows = [{"Govt": " Secondary"}, {"Govt": "Primary"}, {"Govt": "PRIMARY"}, {}]
+
+    dropdown_options, matching_map = extract_valid_values_from_rows(rows, "Govt")
+    matcher = FuzzyMatcher(dropdown_options, matching_map)
+
+    assert dropdown_options == ["Primary", "Secondary"]
+    assert matching_map == {"secondary": "Secondary", "primary": "PRIMARY"}
+    assert matcher.options == ["Primary", "Secondary", "Unknown"]
+    assert matcher.processed_targets == ["secondary", "primary"]
+    assert matcher.suggest(["secondry", "prmary"]) == [
+        ("Secondary", True),
+        ("PRIMARY", True),
+    ]
@@ -0,0 +1,90 @@
+import asyncio
+
+import orjson
+from data_ingestion.cache.keys import get_fuzzy_corrections_key
+from data_ingestion.internal import learned_corrections
+from data_ingestion.internal.learned_corrections import (
+    collect_confirmed_corrections,
+    get_learned_corrections,
+)
+from data_ingestion.routers import upload
+
+from tests.conftest import FakeSession
+
+
+# Only corrections that change a value of a mapped column are remembered.
+def test_collect_confirmed_corrections():
+    corrections = [
+        {"column_name": "level", "value_found": " PRMARY ", "replace_with": "Primary"},
+        {"column_name": "level", "value_found": "primary", "replace_with": "Primary"},
+        {"column_name": "level", "value_found": "null/nan/empty", "replace_with": "X"},
+        {"column_name": "level", "value_found": "secondry", "replace_with": None},
+        {"column_name": "other", "value_found": "a", "replace_with": "b"},
+    ]
+
+    assert collect_confirmed_corrections(
+        corrections, {"level": "education_level_govt"}
+    ) == {("education_level_govt", "prmary"): "Primary"}
+
+
+# Cached columns come from Redis; the rest are read once and cached, the most
+# confirmed replacement of a value winning.
+def test_get_learned_corrections_reads_through_cache(monkeypatch):
+    redis = {
+        get_fuzzy_corrections_key("BRA", "connectivity_govt"): orjson.dumps(
+            {"y": "Yes"}
+        )
+    }
+
+    async def get_cache_bytes(key):
+        return redis.get(key)
+
+    async def set_cache_string(key, value, ttl_seconds=None):
+        redis[key] = value
+
+    monkeypatch.setattr(learned_corrections, "get_cache_bytes", get_cache_bytes)
+    monkeypatch.setattr(learned_corrections, "set_cache_string", set_cache_string)
+    db = FakeSession(
+        [
+            ("education_level_govt", "prmary", "Primary"),
+            ("education_level_govt", "prmary", "Pre-Primary"),
+        ]
+    )
+
+    learned = asyncio.run(
+        get_learned_corrections(
+            db,
+            country="BRA",
+            schema_columns=["connectivity_govt", "education_level_govt"],
+        )
+    )
+
+    assert learned == {
+        "connectivity_govt": {"y": "Yes"},
+        "education_level_govt": {"prmary": "Primary"},
+    }
+    assert len(db.statements) == 1
+    assert orjson.loads(
+        redis[get_fuzzy_corrections_key("BRA", "education_level_govt")]
+    ) == {"prmary": "Primary"}
+
+
+# A failed write of the confirmed corrections is logged and rolled back, so the
+# session can still be used for the rest of the upload request.
+def test_record_fuzzy_corrections_rolls_back_on_failure():
+    class FailingSession(FakeSession):
+        async def execute(self, statement, params=None):
+            raise RuntimeError("database is down")
+
+    db = FailingSession()
+    corrections = (
+        '[{"column_name": "level", "value_found": "prmary", "replace_with": "Primary"}]'
+    )
+
+    asyncio.run(
+        upload._record_fuzzy_corrections(
+            db, "BRA", corrections, {"level": "education_level_govt"}
+        )
+    )
+
+    assert db.rolled_back
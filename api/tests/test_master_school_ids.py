@@ -0,0 +1,180 @@
+import asyncio
+
+from data_ingestion.cache.keys import (
+    get_master_school_ids_key,
+    get_silver_table_version_key,
+)
+from data_ingestion.constants import constants
+from data_ingestion.db.trino import AsyncTrinoSession
+from data_ingestion.internal import master_school_ids
+from data_ingestion.internal.master_school_ids import (
+    decode_school_ids,
+    get_history_table,
+    get_matching_master_school_ids,
+)
+
+from tests.conftest import FakeSyncSession
+
+TABLE = "delta_lake.school_geolocation_silver.bra"
+
+
+class FakeSession(FakeSyncSession):
+    def __init__(self, version, school_ids):
+        super().__init__()
+        self.version = version
+        self.school_ids = school_ids
+
+    def execute(self, statement, params=None):
+        return super().execute(str(statement), params)
+
+    def rows_for(self, statement, params):
+        if "$history" in statement:
+            return [self.version]
+        if statement.startswith("SHOW STATS"):
+            return [
+                {"column_name": "school_id_govt", "row_count": None},
+                {"column_name": None, "row_count": len(self.school_ids)},
+            ]
+        if statement.endswith("LIMIT 1"):
+            untrimmed = [i for i in self.school_ids if i and i != i.strip()]
+            return untrimmed[:1]
+        if params is not None:
+            trim = "trim(" in statement
+            return [
+                school_id.strip() if trim else school_id
+                for school_id in self.school_ids
+                if (school_id.strip() if trim else school_id) in params["ids"]
+            ]
+        return self.school_ids
+
+
+def _fake_redis(monkeypatch) -> dict:
+    redis = {}
+
+    async def get_cache_bytes(key):
+        return redis.get(key)
+
+    async def get_cache_string(key):
+        value = redis.get(key)
+        return None if value is None else str(value)
+
+    async def set_cache_string(key, value, ttl_seconds=None):
+        redis[key] = value
+
+    monkeypatch.setattr(master_school_ids, "get_cache_bytes", get_cache_bytes)
+    monkeypatch.setattr(master_school_ids, "get_cache_string", get_cache_string)
+    monkeypatch.setattr(master_school_ids, "set_cache_string", set_cache_string)
+    return redis
+
+
+# The IDs are read once per table version; warm reads do not touch Trino and
+# a new version is read again.
+def test_master_school_ids_are_cached_per_table_version(monkeypatch):
+    redis = _fake_redis(monkeypatch)
+    db = FakeSession(3, [" A1 ", "B2", "", None, "nan"])
+
+    def match(*school_ids):
+        return asyncio.run(
+            get_matching_master_school_ids(
+                AsyncTrinoSession(lambda: db), TABLE, school_ids
+            )
+        )
+
+    assert match("A1", "X9") == {"A1"}
+    assert match("A1", "B2") == {"A1", "B2"}
+    assert len(db.statements) == 3
+    assert 'school_geolocation_silver."bra$history"' in db.statements[0]
+    assert decode_school_ids(redis[get_master_school_ids_key(TABLE, 3)]) == {
+        "A1",
+        "B2",
+    }
+
+    del redis[get_silver_table_version_key(TABLE)]
+    db.version, db.school_ids = 4, ["C3"]
+    assert match("A1", "C3") == {"C3"}
+    assert len(db.statements) == 6
+
+
+# Large tables are matched in Trino, in batches of bound parameters, and their
+# IDs are not pulled into the API.
+def test_master_school_ids_of_large_tables_are_matched_in_trino(monkeypatch):
+    redis = _fake_redis(monkeypatch)
+    monkeypatch.setattr(constants, "IMPACT_PREVIEW_SERVER_SIDE_MIN_ROWS", 3)
+    monkeypatch.setattr(constants, "IMPACT_PREVIEW_SCHOOL_ID_BATCH_SIZE", 2)
+    db = FakeSession(1, ["A1", " B2", "O'Neil"])
+
+    matching = asyncio.run(
+        get_matching_master_school_ids(
+            AsyncTrinoSession(lambda: db), TABLE, ["A1", "B2", "O'Neil", "X9"]
+        )
+    )
+
+    assert matching == {"A1", "B2", "O'Neil"}
+    batches = [params["ids"] for params in db.params if params is not None]
+    assert batches == [["A1", "B2"], ["O'Neil", "X9"]]
+    assert not any("O'Neil" in statement for statement in db.statements)
+    assert get_master_school_ids_key(TABLE, 1) not in redis
+
+
+# Tables whose IDs are all trimmed are matched on the bare column, so Trino can
+# skip Delta files; the check for untrimmed IDs runs once per table version.
+def test_master_school_ids_of_trimmed_tables_match_the_bare_column(monkeypatch):
+    _fake_redis(monkeypatch)
+    monkeypatch.setattr(constants, "IMPACT_PREVIEW_SERVER_SIDE_MIN_ROWS", 2)
+    db = FakeSession(1, ["A1", "B2"])
+
+    def match(*school_ids):
+        return asyncio.run(
+            get_matching_master_school_ids(
+                AsyncTrinoSession(lambda: db), TABLE, school_ids
+            )
+        )
+
+    assert match("A1", "X9") == {"A1"}
+    assert match("B2") == {"B2"}
+    matches = [
+        statement
+        for statement, params in zip(db.statements, db.params, strict=True)
+        if params is not None
+    ]
+    assert len(matches) == 2
+    assert all("WHERE school_id_govt IN" in statement for statement in matches)
+    assert sum(statement.endswith("LIMIT 1") for statement in db.statements) == 1
+
+
+# A Redis outage is a cache miss: the IDs are still read from Trino.
+def test_master_school_ids_survive_redis_errors(monkeypatch):
+    async def unavailable(*args):
+        raise ConnectionError("Redis is down")
+
+    for name in ("get_cache_bytes", "get_cache_string", "set_cache_string"):
+        monkeypatch.setattr(master_school_ids, name, unavailable)
+    db = FakeSession(2, ["A1", "B2"])
+
+    assert asyncio.run(
+        get_matching_master_school_ids(
+            AsyncTrinoSession(lambda: db), TABLE, ["A1", "X9"]
+        )
+    ) == {"A1"}
+
+
+# Countries without a silver table have no master school IDs.
+def test_get_master_school_ids_of_missing_table(monkeypatch):
+    redis = _fake_redis(monkeypatch)
+
+    class MissingTable:
+        def execute(self, statement):
+            raise RuntimeError("TABLE_NOT_FOUND: Table does not exist")
+
+    assert (
+        asyncio.run(
+            get_matching_master_school_ids(
+                AsyncTrinoSession(MissingTable), TABLE, ["A1"]
+            )
+        )
+        == set()
+    )
+    assert redis == {}
+    assert get_history_table(TABLE) == (
+        'delta_lake.school_geolocation_silver."bra$history"'
+    )
@@ -0,0 +1,129 @@
+import asyncio
+
+import httpx
+import pytest
+from data_ingestion.constants import constants
+from data_ingestion.utils import nocodb
+
+ROWS = [{"Id": i} for i in range(1, 26)]
+
+
+def _page_handler(requests: list[httpx.Request], page_size: int = 10):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        offset = int(request.url.params["offset"])
+        rows = ROWS[offset : offset + page_size]
+        return httpx.Response(
+            200,
+            json={
+                "list": rows,
+                "pageInfo": {
+                    "totalRows": len(ROWS),
+                    "pageSize": page_size,
+                    "isLastPage": offset + page_size >= len(ROWS),
+                },
+            },
+        )
+
+    return handler
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(constants, "NOCODB_RETRY_BACKOFF_SECONDS", 0)
+
+
+# Pages after the first are requested by offset from the row count, in order.
+def test_fetch_nocodb_table_rows_fetches_remaining_pages():
+    requests = []
+
+    async def fetch():
+        transport = httpx.MockTransport(_page_handler(requests))
+        async with httpx.AsyncClient(
+            base_url="http://nocodb/api/v2", transport=transport
+        ) as client:
+            return await nocodb.fetch_nocodb_table_rows(
+                "table", where="(a,eq,b)", client=client
+            )
+
+    assert asyncio.run(fetch()) == ROWS
+    assert requests[0].url.params["limit"] == str(constants.NOCODB_PAGE_SIZE)
+    assert requests[0].url.params["where"] == "(a,eq,b)"
+    assert sorted(int(r.url.params["offset"]) for r in requests) == [0, 10, 20]
+
+
+# Rate limiting and server errors are retried; client errors are not.
+def test_fetch_nocodb_table_rows_retries(no_backoff):
+    requests = []
+    pages = _page_handler(requests, page_size=len(ROWS))
+    statuses = iter([429, 503])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if (status_code := next(statuses, None)) is not None:
+            return httpx.Response(status_code)
+        return pages(request)
+
+    async def fetch(transport):
+        async with httpx.AsyncClient(
+            base_url="http://nocodb/api/v2", transport=transport
+        ) as client:
+            return await nocodb.fetch_nocodb_table_rows("table", client=client)
+
+    assert asyncio.run(fetch(httpx.MockTransport(handler))) == ROWS
+    assert len(requests) == 1
+
+    forbidden = httpx.MockTransport(lambda request: httpx.Response(403))
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(fetch(forbidden))
+
+
+# Writes are not retried, since a failed PATCH may have been applied already.
+def test_patch_nocodb_record_is_not_retried(no_backoff):
+    patches = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "PATCH":
+            patches.append(request)
+            return httpx.Response(503)
+        # The table ID lookup and the record lookup both find one row.
+        return httpx.Response(
+            200,
+            json={
+                "list": [{"Id": 1, "table_id": "table"}],
+                "pageInfo": {"totalRows": 1, "isLastPage": True},
+            },
+        )
+
+    async def patch():
+        async with httpx.AsyncClient(
+            base_url="http://nocodb/api/v2", transport=httpx.MockTransport(handler)
+        ) as client:
+            return await nocodb.patch_nocodb_record_by_field(
+                "T", "Id", "1", {"status": "done"}, client=client
+            )
+
+    assert asyncio.run(patch()) is None
+    assert len(patches) == 1
+
+
+# A Retry-After longer than a request may take is raised instead of waited out.
+def test_long_retry_after_is_not_waited_out(monkeypatch):
+    requests = []
+    monkeypatch.setattr(constants, "NOCODB_TIMEOUT_SECONDS", 30)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(429, headers={"Retry-After": "3600"})
+
+    async def fetch():
+        async with httpx.AsyncClient(
+            base_url="http://nocodb/api/v2", transport=httpx.MockTransport(handler)
+        ) as client:
+            return await nocodb.fetch_nocodb_table_rows("table", client=client)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(asyncio.wait_for(fetch(), timeout=5))
+    assert len(requests) == 1
+    assert (
+        nocodb._retry_delay(0, httpx.Response(429, headers={"Retry-After": "2"})) == 2
+    )
@@ -0,0 +1,121 @@
+import asyncio
+
+import pytest
+from data_ingestion.api import app
+from data_ingestion.constants import constants
+from data_ingestion.db.primary import get_db
+from data_ingestion.internal.auth import azure_scheme, local_auth_bypass
+from data_ingestion.internal.resumable_uploads import (
+    create_resumable_upload,
+    get_block_ids,
+    get_resumable_offset,
+    get_resumable_upload,
+    save_resumable_upload,
+    stage_resumable_chunk,
+)
+from data_ingestion.internal.uploads import StagedBlocks, write_upload_blobs
+from data_ingestion.permissions import permissions
+from fastapi import HTTPException, status
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import IntegrityError
+
+from tests.conftest import make_file_upload
+
+
+@pytest.fixture(autouse=True)
+def small_blocks(monkeypatch):
+    monkeypatch.setattr(constants, "UPLOAD_BLOCK_SIZE_MB", 4 / 2**20)
+
+
+# Chunks may arrive in any order; the offset counts contiguous chunks from 0.
+def test_resumable_upload_offset_and_commit(storage):
+    content = b"id\n1\n2\n"
+    file_upload = make_file_upload()
+
+    async def run():
+        upload = await create_resumable_upload(
+            file_upload, country="Brazil", size=len(content)
+        )
+        upload = await get_resumable_upload(upload.token, "user@example.com")
+        offsets = []
+        for offset in (4, 0, 4):
+            await stage_resumable_chunk(upload, offset, content[offset : offset + 4])
+            offsets.append(await get_resumable_offset(upload))
+
+        await write_upload_blobs(file_upload, StagedBlocks(get_block_ids(upload)), {})
+        return upload, offsets
+
+    upload, offsets = asyncio.run(run())
+
+    assert upload.chunk_size == 4
+    assert upload.upload_path == file_upload.upload_path
+    assert offsets == [0, 7, 7]
+    assert storage._blobs[file_upload.upload_path][1] == content
+
+
+# Uploads are private to their uploader.
+def test_resumable_upload_is_not_found_for_other_users(storage):
+    upload = asyncio.run(
+        create_resumable_upload(make_file_upload(), country="Brazil", size=10)
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(get_resumable_upload(upload.token, "other@example.com"))
+
+    assert exc_info.value.status_code == 404
+
+
+# A finalize racing another one for the same upload is a conflict, and leaves
+# the staged blocks to the one that inserted the row.
+def test_finalize_resumable_upload_twice_is_a_conflict(storage, monkeypatch):
+    content = b"id\n1\n2\n"
+    file_upload = make_file_upload(uploader_email="dev@example.com")
+
+    async def stage():
+        upload = await create_resumable_upload(
+            file_upload, country="Brazil", size=len(content)
+        )
+        upload.content_type = "text/csv"
+        await save_resumable_upload(upload)
+        for offset in (0, 4):
+            await stage_resumable_chunk(upload, offset, content[offset : offset + 4])
+        return upload
+
+    class AlreadyInserted:
+        rolled_back = False
+
+        def add_all(self, rows):
+            pass
+
+        async def commit(self):
+            raise IntegrityError("INSERT INTO file_uploads", {}, Exception("duplicate"))
+
+        async def rollback(self):
+            self.rolled_back = True
+
+    async def get_user_roles(*args):
+        return ["Admin"]
+
+    db = AlreadyInserted()
+
+    async def get_primary_db():
+        yield db
+
+    upload = asyncio.run(stage())
+    monkeypatch.setattr(permissions, "get_user_roles", get_user_roles)
+    monkeypatch.setitem(app.dependency_overrides, azure_scheme, local_auth_bypass)
+    monkeypatch.setitem(app.dependency_overrides, get_db, get_primary_db)
+
+    response = TestClient(app).post(
+        f"/api/upload/resumable/{upload.token}/finalize",
+        data={
+            "column_to_schema_mapping": "{}",
+            "column_license": "{}",
+            "metadata": "{}",
+        },
+    )
+
+    assert response.status_code == status.HTTP_409_CONFLICT
+    assert db.rolled_back
+    assert file_upload.upload_path not in storage._blobs
+    assert len(storage._staged[file_upload.upload_path]) == 2
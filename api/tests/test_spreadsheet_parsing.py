@@ -0,0 +1,140 @@
+import io
+from datetime import datetime
+
+import openpyxl
+import pandas as pd
+import pytest
+from data_ingestion.utils import spreadsheet
+from data_ingestion.utils.spreadsheet import count_spreadsheet_values, parse_spreadsheet
+from openpyxl.utils.datetime import CALENDAR_MAC_1904, CALENDAR_WINDOWS_1900
+
+
+def _xlsx(rows: list[list], epoch=None) -> bytes:
+    workbook = openpyxl.Workbook()
+    if epoch is not None:
+        workbook.epoch = epoch
+    for row in rows:
+        workbook.active.append(row)
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+# Only the requested CSV columns are read, as Arrow strings, values as written.
+def test_parse_csv_projects_columns_as_strings():
+    content = "﻿school_id,level,level\n007,Prmary,x\n,NA,y\n".encode()
+
+    df = parse_spreadsheet(content, ".csv", ["school_id", "level.1", "missing"])
+
+    assert list(df.columns) == ["school_id", "level.1"]
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+    assert df["school_id"].tolist() == ["007", pd.NA]
+    assert df["level.1"].tolist() == ["x", "y"]
+
+
+# CSV and XLSX read the same NA-like text as null, as pandas does.
+def test_csv_and_xlsx_agree_on_na_values():
+    rows = [["id"], ["None"], ["<NA>"], ["NA"], ["null"], ["A1"]]
+    csv_content = "\n".join(row[0] for row in rows).encode()
+
+    for content, file_ext in ((csv_content, ".csv"), (_xlsx(rows), ".xlsx")):
+        df = parse_spreadsheet(content, file_ext)
+        assert df["id"].tolist() == [pd.NA, pd.NA, pd.NA, pd.NA, "A1"]
+    assert pd.read_csv(io.BytesIO(csv_content), dtype=str)["id"].isna().sum() == 4
+
+
+# Quoted CSV cells may span lines, as pandas reads them.
+def test_parse_csv_with_line_breaks_in_quoted_cells():
+    content = b'school_id,name\n1,"Escola\nCentral"\n2,"A, B"\n'
+
+    df = parse_spreadsheet(content, ".csv")
+    counts = count_spreadsheet_values(content, ".csv", ["name"])
+
+    assert df["name"].tolist() == ["Escola\nCentral", "A, B"]
+    assert counts["name"].to_dict() == {"Escola\nCentral": 1, "A, B": 1}
+
+
+# Rows missing trailing fields are read with nulls there, like pandas does.
+def test_parse_csv_with_missing_trailing_fields():
+    content = b"school_id,name,level\n1,A,Primary\n2,B\n3\n"
+
+    df = parse_spreadsheet(content, ".csv", ["school_id", "level"])
+    counts = count_spreadsheet_values(content, ".csv", ["level"])
+
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+    assert df["school_id"].tolist() == ["1", "2", "3"]
+    assert df["level"].tolist() == ["Primary", pd.NA, pd.NA]
+    assert counts["level"].to_dict() == {None: 2, "Primary": 1}
+
+
+# Selected XLSX columns come out as the text pandas would read with dtype=str.
+def test_parse_xlsx_columns_match_pandas():
+    content = _xlsx(
+        [
+            ["id", "level", "when", "flag", None, "id"],
+            [7, "Prmary", datetime(2024, 1, 2), True, None, "x"],
+            [None, None],
+            [8.5, "x", 45000.5, False, None, 1e-7],
+            [None],
+        ]
+    )
+    columns = ["id", "level", "when", "flag", "id.1"]
+
+    df = parse_spreadsheet(content, ".xlsx", columns)
+    expected = pd.read_excel(io.BytesIO(content), dtype=str)[columns]
+
+    assert df.astype(object).where(df.notna(), None).values.tolist() == (
+        expected.astype(object).where(expected.notna(), None).values.tolist()
+    )
+
+
+# NA-like text is null, as in pandas and the CSV reader, and dates of 1904
+# workbooks are read against their own epoch.
+@pytest.mark.parametrize("epoch", [CALENDAR_WINDOWS_1900, CALENDAR_MAC_1904])
+def test_parse_xlsx_na_values_and_dates_match_pandas(epoch):
+    content = _xlsx(
+        [
+            ["id", "when"],
+            ["NA", datetime(2024, 1, 2, 3, 4)],
+            ["N/A", datetime(1999, 12, 31)],
+            ["#N/A", None],
+            ["null", datetime(2024, 1, 2)],
+            ["A1", None],
+        ],
+        epoch,
+    )
+
+    df = parse_spreadsheet(content, ".xlsx")
+    expected = pd.read_excel(io.BytesIO(content), dtype=str)
+
+    assert df["id"].tolist() == [pd.NA, pd.NA, pd.NA, pd.NA, "A1"]
+    assert df["when"].tolist()[:2] == ["2024-01-02 03:04:00", "1999-12-31 00:00:00"]
+    assert df.astype(object).where(df.notna(), None).values.tolist() == (
+        expected.astype(object).where(expected.notna(), None).values.tolist()
+    )
+    assert count_spreadsheet_values(content, ".xlsx", ["id"])["id"].to_dict() == {
+        None: 4,
+        "A1": 1,
+    }
+
+
+# Streamed value counts match value_counts(dropna=False) of the parsed columns.
+def test_count_spreadsheet_values_matches_parsed_value_counts(monkeypatch):
+    monkeypatch.setattr(spreadsheet, "COUNT_BLOCK_SIZE", 64)
+    rows = [["id", "level", "other"]]
+    rows += [[i, ["Prmary", "Primary", None][i % 3], "x"] for i in range(100)]
+    rows += [[None, None, "x"], [None], [None, "NA", None], [None], [None]]
+    csv_content = "\n".join(
+        ",".join("" if value is None else str(value) for value in row) for row in rows
+    ).encode()
+
+    for content, file_ext in ((csv_content, ".csv"), (_xlsx(rows), ".xlsx")):
+        counts = count_spreadsheet_values(content, file_ext, ["level", "missing"])
+        df = parse_spreadsheet(content, file_ext, ["level"])
+        expected = df["level"].value_counts(dropna=False)
+
+        assert list(counts) == ["level"]
+        assert {
+            None if pd.isna(value) else value: count
+            for value, count in expected.items()
+        } == counts["level"].to_dict()
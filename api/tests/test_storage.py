@@ -0,0 +1,209 @@
+import asyncio
+import io
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from data_ingestion.storage import (
+    BlobNotFoundError,
+    BlobNotModifiedError,
+    InvalidRangeError,
+    StorageBackend,
+    adls,
+)
+from data_ingestion.storage.adls import AzureBlobStorage, upload_blob_in_blocks
+from data_ingestion.storage.local import LocalFileStorage
+from data_ingestion.storage.memory import InMemoryStorage
+
+AZURITE_CONNECTION_STRING = (
+    "DefaultEndpointsProtocol=http;AccountName=devstoreaccount1;"
+    "AccountKey=Eby8vdM02xNOcqFlqUwJPLlmEtlCDXJ1OUzFT50uSRZ6IFsuFq2UVErCz4I6tq/"
+    "K1SZFPTOtr/KBHBeksoGMGw==;BlobEndpoint=http://127.0.0.1:10000/devstoreaccount1;"
+)
+
+
+class FakeBlockBlobClient:
+    def __init__(self, fail_block_id: str | None = None):
+        self.staged: dict[str, bytes] = {}
+        self.committed: bytes | None = None
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail_block_id = fail_block_id
+
+    async def stage_block(self, block_id: str, data: bytes, length: int):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        if block_id == self.fail_block_id:
+            raise RuntimeError("stage failed")
+        self.staged[block_id] = data[:length]
+
+    async def commit_block_list(self, block_list, **_):
+        self.committed = b"".join(self.staged[block.id] for block in block_list)
+
+
+# Blocks are committed in file order even though they are staged in parallel.
+def test_upload_blob_in_blocks_commits_blocks_in_order():
+    content = bytes(range(256)) * 40
+    client = FakeBlockBlobClient()
+
+    asyncio.run(
+        upload_blob_in_blocks(
+            client, io.BytesIO(content), block_size=100, max_concurrency=3
+        )
+    )
+
+    assert client.committed == content
+    assert len(client.staged) == 103
+    assert client.max_in_flight <= 3
+
+
+# An empty file still commits an (empty) blob.
+def test_upload_blob_in_blocks_handles_empty_stream():
+    client = FakeBlockBlobClient()
+
+    asyncio.run(upload_blob_in_blocks(client, io.BytesIO(b""), block_size=100))
+
+    assert client.committed == b""
+
+
+# A failed block aborts the upload without committing a partial blob.
+def test_upload_blob_in_blocks_does_not_commit_after_failure():
+    client = FakeBlockBlobClient(fail_block_id="00000002")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(
+            upload_blob_in_blocks(
+                client, io.BytesIO(b"x" * 1000), block_size=100, max_concurrency=2
+            )
+        )
+
+    assert client.committed is None
+
+
+# With an account key, downloads are signed as read-only SAS URLs for one blob.
+def test_azure_get_read_url_signs_read_only_sas(monkeypatch):
+    monkeypatch.setattr(
+        adls.settings, "AZURE_STORAGE_CONNECTION_STRING", AZURITE_CONNECTION_STRING
+    )
+
+    async def generate():
+        storage = AzureBlobStorage()
+        try:
+            return await storage.get_read_url(
+                "raw/file.csv", content_disposition="attachment; filename=file.csv"
+            )
+        finally:
+            await storage.close()
+
+    url = urlsplit(asyncio.run(generate()))
+    query = parse_qs(url.query)
+
+    assert url.path.endswith("/raw/file.csv")
+    assert query["sp"] == ["r"]
+    assert query["sr"] == ["b"]
+    assert query["rscd"] == ["attachment; filename=file.csv"]
+
+
+@pytest.fixture(params=["memory", "local"])
+def storage(request, tmp_path: Path) -> StorageBackend:
+    if request.param == "local":
+        return LocalFileStorage(tmp_path)
+    return InMemoryStorage()
+
+
+# Local and in-memory backends round-trip content, ranges, properties and listings.
+def test_storage_backend_round_trip(storage: StorageBackend):
+    async def run():
+        await storage.put(
+            "a/b.csv",
+            io.BytesIO(b"0123456789"),
+            content_type="text/csv",
+            metadata={"country": "BRA"},
+        )
+        await storage.put("a/c.json", b"{}")
+        await storage.put("d.txt", b"d")
+
+        download = await storage.open("a/b.csv", offset=2, length=3)
+        ranged = await download.readall()
+        properties = await storage.properties("a/b.csv")
+        listed = [blob.name async for blob in storage.list("a/")]
+        return download, ranged, properties, listed
+
+    download, ranged, properties, listed = asyncio.run(run())
+
+    assert ranged == b"234"
+    assert (download.offset, download.length, download.properties.size) == (2, 3, 10)
+    assert properties.content_type == "text/csv"
+    assert properties.metadata == {"country": "BRA"}
+    assert properties.etag
+    assert listed == ["a/b.csv", "a/c.json"]
+
+
+# Conditions, metadata updates and missing blobs behave as they do in ADLS.
+def test_storage_backend_conditions(storage: StorageBackend):
+    async def run():
+        await storage.put("blob.bin", b"content")
+        etag = (await storage.properties("blob.bin")).etag
+
+        with pytest.raises(BlobNotModifiedError):
+            await storage.open("blob.bin", if_none_match=etag)
+        with pytest.raises(InvalidRangeError):
+            await storage.open("blob.bin", offset=100)
+
+        await storage.set_metadata("blob.bin", {"dq_mode": "uploaded"})
+        assert (await storage.properties("blob.bin")).metadata == {
+            "dq_mode": "uploaded"
+        }
+
+        await storage.delete("blob.bin")
+        assert not await storage.exists("blob.bin")
+        with pytest.raises(BlobNotFoundError):
+            await storage.get("blob.bin")
+
+    asyncio.run(run())
+
+
+# Staged blocks stay invisible until committed, in the order given.
+def test_storage_backend_blocks(storage: StorageBackend):
+    async def run():
+        await storage.stage_block("a/blocks.csv", "00000001", b"def")
+        await storage.stage_block("a/blocks.csv", "00000000", b"abc")
+        await storage.stage_block("a/blocks.csv", "00000002", b"unused")
+        assert not await storage.exists("a/blocks.csv")
+        staged = await storage.staged_blocks("a/blocks.csv")
+
+        await storage.commit_blocks(
+            "a/blocks.csv", ["00000000", "00000001"], content_type="text/csv"
+        )
+        properties = await storage.properties("a/blocks.csv")
+        listed = [blob.name async for blob in storage.list()]
+        return staged, await storage.get("a/blocks.csv"), properties, listed
+
+    staged, content, properties, listed = asyncio.run(run())
+
+    assert staged == {"00000000": 3, "00000001": 3, "00000002": 6}
+    assert content == b"abcdef"
+    assert properties.content_type == "text/csv"
+    assert listed == ["a/blocks.csv"]
+
+
+# Deleting a blob drops the blocks staged for it, committed or not.
+def test_storage_backend_delete_drops_staged_blocks(storage: StorageBackend):
+    async def run():
+        await storage.stage_block("a/abandoned.csv", "00000000", b"abc")
+        await storage.delete("a/abandoned.csv")
+        return await storage.staged_blocks("a/abandoned.csv")
+
+    assert asyncio.run(run()) == {}
+
+
+# Sidecar metadata paths are checked like blob paths.
+def test_local_storage_rejects_paths_outside_root(tmp_path: Path):
+    storage = LocalFileStorage(tmp_path / "root")
+
+    with pytest.raises(ValueError):
+        asyncio.run(storage.delete("../outside.csv"))
+    with pytest.raises(ValueError):
+        asyncio.run(storage.set_metadata("../../outside.csv", {}))
@@ -0,0 +1,58 @@
+from data_ingestion.middlewares.storage_metrics import StorageMetricsMiddleware
+from data_ingestion.storage.metrics import (
+    StorageCallCountPolicy,
+    get_storage_call_stats,
+    record_storage_call,
+    reset_storage_call_stats,
+    track_storage_calls,
+)
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(StorageMetricsMiddleware)
+
+    @app.get("/blob")
+    async def read_blob():
+        record_storage_call()
+
+        async def body():
+            record_storage_call()
+            yield b"data"
+
+        return StreamingResponse(body())
+
+    return app
+
+
+# Calls before the response starts go in the header; all of them are aggregated.
+def test_middleware_counts_storage_calls_per_request():
+    reset_storage_call_stats()
+    client = TestClient(_app())
+
+    assert client.get("/blob").headers["X-Storage-Calls"] == "1"
+    client.get("/blob")
+
+    assert get_storage_call_stats() == {
+        "GET read_blob": {
+            "requests": 2,
+            "calls": 4,
+            "max_calls": 2,
+            "mean_calls": 2.0,
+        }
+    }
+
+
+# The Azure pipeline policy counts each HTTP request against the current one.
+def test_pipeline_policy_records_calls():
+    policy = StorageCallCountPolicy()
+    record_storage_call()
+
+    with track_storage_calls() as counter:
+        policy.on_request(None)
+        policy.on_request(None)
+
+    assert counter.calls == 2
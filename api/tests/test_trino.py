@@ -0,0 +1,104 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from data_ingestion.api import app
+from data_ingestion.db.primary import get_db
+from data_ingestion.db.trino import (
+    AsyncTrinoSession,
+    TrinoQueryTimeoutError,
+    get_async_db,
+)
+from data_ingestion.internal.auth import azure_scheme, local_auth_bypass
+from data_ingestion.permissions import permissions
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+
+class SessionFactory:
+    def __init__(self):
+        # Calls on a session may run on any thread of the pool.
+        self.engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}
+        )
+        self.sessions = []
+
+    def __call__(self) -> Session:
+        session = Session(self.engine)
+        self.sessions.append(session)
+        return session
+
+
+# Queries run on the Trino pool and their rows are fetched there too.
+def test_async_trino_session_runs_queries_off_the_event_loop():
+    factory = SessionFactory()
+
+    async def run():
+        db = AsyncTrinoSession(factory)
+        result = await db.execute(text("SELECT 1 AS a UNION ALL SELECT 2"))
+        thread_name = await db.run_sync(lambda _: threading.current_thread().name)
+        return result.mappings().all(), await db.scalar(text("SELECT 3")), thread_name
+
+    rows, scalar, thread_name = asyncio.run(run())
+
+    assert rows == [{"a": 1}, {"a": 2}]
+    assert scalar == 3
+    assert thread_name.startswith("trino")
+    assert len(factory.sessions) == 1
+
+
+# A timed out query keeps its session until it ends; later calls get another.
+def test_async_trino_session_timeout_abandons_the_session():
+    factory = SessionFactory()
+    finished = threading.Event()
+
+    def slow(_):
+        time.sleep(0.2)
+        finished.set()
+
+    async def run():
+        db = AsyncTrinoSession(factory)
+        with pytest.raises(TrinoQueryTimeoutError):
+            await db.run_sync(slow, timeout=0.01)
+        return await db.scalar(text("SELECT 1"))
+
+    assert asyncio.run(run()) == 1
+    assert len(factory.sessions) == 2
+    assert finished.wait(1)
+
+
+# A Trino query that times out in a route is answered with 504, not wrapped
+# into the route's generic error.
+def test_trino_query_timeout_returns_gateway_timeout(monkeypatch):
+    class TimedOutSession:
+        async def execute(self, *args, **kwargs):
+            raise TrinoQueryTimeoutError("Trino query did not finish in time")
+
+        scalar = execute
+
+    async def get_user_roles(*args):
+        return ["Admin"]
+
+    class PrimarySession:
+        async def scalar(self, *args):
+            return SimpleNamespace(uploader_email="uploader@example.com")
+
+    async def get_primary_db():
+        yield PrimarySession()
+
+    async def get_trino_db():
+        yield TimedOutSession()
+
+    monkeypatch.setattr(permissions, "get_user_roles", get_user_roles)
+    monkeypatch.setitem(app.dependency_overrides, azure_scheme, local_auth_bypass)
+    monkeypatch.setitem(app.dependency_overrides, get_db, get_primary_db)
+    monkeypatch.setitem(app.dependency_overrides, get_async_db, get_trino_db)
+
+    response = TestClient(app).get("/api/upload/upload-1/rejected_rows/download")
+
+    assert response.status_code == status.HTTP_504_GATEWAY_TIMEOUT
+    assert response.json() == {"detail": "Trino query did not finish in time"}
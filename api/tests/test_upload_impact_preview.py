@@ -1,8 +1,10 @@
+import pandas as pd
 import pytest
 from data_ingestion.utils.upload_impact import (
     build_upload_impact_preview,
     get_school_id_file_column,
     normalize_school_id,
+    normalize_school_ids,
 )
 
 
@@ -50,3 +52,14 @@ def test_get_school_id_file_column_requires_school_id_mapping():
         get_school_id_file_column({"school_name": "official_school_name"})
 
     assert str(exc_info.value) == "Column mapping must include school_id_govt."
+
+
+# Columns are normalized at once, like normalize_school_id does one ID.
+def test_normalize_school_ids_matches_normalize_school_id():
+    values = pd.Series(["  BR-001  ", "", "   ", None, "nan", "BR-002", 3])
+
+    assert normalize_school_ids(values).to_pylist() == [
+        normalized
+        for value in values
+        if (normalized := normalize_school_id(value)) is not None
+    ]
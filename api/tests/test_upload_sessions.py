@@ -0,0 +1,114 @@
+import asyncio
+import io
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from data_ingestion.internal.resumable_uploads import save_resumable_upload
+from data_ingestion.internal.upload_sessions import (
+    check_upload_session_target,
+    count_upload_session_values,
+    create_upload_session,
+    delete_expired_upload_sessions,
+    get_upload_session,
+    open_upload_session_file,
+    read_upload_session_columns,
+)
+from data_ingestion.schemas.upload import ResumableUpload
+from fastapi import HTTPException, UploadFile
+
+CONTENT = b"school_id,level,name\n007,Prmary,A\n008,Secondary,B\n"
+
+
+def _create_session():
+    file = UploadFile(io.BytesIO(CONTENT), size=len(CONTENT), filename="schools.csv")
+    return create_upload_session(
+        file,
+        content_type="text/csv",
+        uploader_email="user@example.com",
+        country="Brazil",
+        dataset="geolocation",
+    )
+
+
+# The cached parse serves column reads and counts; the staged bytes are the file as sent.
+def test_upload_session_reuses_staged_file(storage):
+    async def run():
+        session = await _create_session()
+        loaded = await get_upload_session(session.token, "USER@example.com")
+        df = await read_upload_session_columns(loaded, ["level", "missing"])
+        counts = await count_upload_session_values(loaded, ["level", "missing"])
+        file = await open_upload_session_file(loaded)
+        return session, df, counts, await file.read()
+
+    session, df, counts, content = asyncio.run(run())
+
+    assert session.columns == ["school_id", "level", "name"]
+    assert session.rows == 2
+    assert list(df.columns) == ["level"]
+    assert df["level"].tolist() == ["Prmary", "Secondary"]
+    assert counts["level"].to_dict() == {"Prmary": 1, "Secondary": 1}
+    assert content == CONTENT
+
+
+# Sessions are private to their uploader.
+def test_upload_session_is_not_found_for_other_users(storage):
+    session = asyncio.run(_create_session())
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(get_upload_session(session.token, "other@example.com"))
+
+    assert exc_info.value.status_code == 404
+
+
+# A session only serves the country and dataset it was started for.
+def test_upload_session_is_refused_for_another_target(storage):
+    session = asyncio.run(_create_session())
+
+    check_upload_session_target(session, "Brazil", "geolocation")
+    for country, dataset in (("Chile", "geolocation"), ("Brazil", "coverage")):
+        with pytest.raises(HTTPException) as exc_info:
+            check_upload_session_target(session, country, dataset)
+        assert exc_info.value.status_code == 409
+
+
+# Only blobs older than the session lifetime are cleaned up.
+def test_delete_expired_upload_sessions(storage):
+    session = asyncio.run(_create_session())
+
+    assert asyncio.run(delete_expired_upload_sessions(storage)) == 0
+
+    for properties, _ in storage._blobs.values():
+        properties.last_modified = datetime.now(UTC) - timedelta(hours=25)
+    assert asyncio.run(delete_expired_upload_sessions(storage)) == 3
+    with pytest.raises(HTTPException):
+        asyncio.run(get_upload_session(session.token, "user@example.com"))
+
+
+# Blocks staged for an expired resumable upload are deleted with its record.
+def test_delete_expired_upload_sessions_drops_unfinished_upload_blocks(storage):
+    upload = ResumableUpload(
+        token="token",
+        upload_id="upload-1",
+        created=datetime.now(UTC),
+        expires_at=datetime.now(UTC),
+        uploader_id="user-1",
+        uploader_email="user@example.com",
+        country="Brazil",
+        country_code="BRA",
+        dataset="geolocation",
+        source=None,
+        original_filename="schools.csv",
+        upload_path="raw/uploads/upload-1.csv",
+        size=3,
+        chunk_size=4,
+    )
+
+    async def run():
+        await save_resumable_upload(upload)
+        await storage.stage_block(upload.upload_path, "00000000", b"abc")
+        for properties, _ in storage._blobs.values():
+            properties.last_modified = datetime.now(UTC) - timedelta(hours=25)
+        deleted = await delete_expired_upload_sessions(storage)
+        return deleted, await storage.staged_blocks(upload.upload_path)
+
+    assert asyncio.run(run()) == (1, {})
@@ -0,0 +1,77 @@
+import asyncio
+import hashlib
+import io
+
+import pytest
+from data_ingestion.internal.uploads import (
+    find_duplicate_upload,
+    hash_upload,
+    write_upload_blobs,
+)
+from sqlalchemy.dialects import postgresql
+
+from tests.conftest import FakeSession, make_file_upload
+
+
+# IDs and both storage paths are known before the row is inserted.
+def test_prepare_file_upload_assigns_id_and_paths():
+    file_upload = make_file_upload()
+
+    assert file_upload.id
+    assert file_upload.id in file_upload.upload_path
+    assert file_upload.metadata_json_path.endswith(".csv.metadata.json")
+
+
+# A failed sidecar write also removes the raw blob written alongside it.
+def test_write_upload_blobs_cleans_up_on_failure(storage, monkeypatch):
+    file_upload = make_file_upload()
+    put = storage.put
+
+    async def failing_sidecar_put(path, data, **kwargs):
+        if path.endswith(".metadata.json"):
+            await asyncio.sleep(0)
+            raise OSError("sidecar write failed")
+        await put(path, data, **kwargs)
+
+    monkeypatch.setattr(storage, "put", failing_sidecar_put)
+
+    with pytest.raises(OSError):
+        asyncio.run(write_upload_blobs(file_upload, b"school_id\n1\n", {}))
+
+    assert not asyncio.run(storage.exists(file_upload.upload_path))
+
+
+# The hash covers the whole file and leaves the stream rewound for the upload.
+def test_hash_upload_rewinds_stream():
+    stream = io.BytesIO(b"school_id\n1\n")
+    stream.read(3)
+
+    assert asyncio.run(hash_upload(stream)) == (
+        hashlib.sha256(b"school_id\n1\n").hexdigest()
+    )
+    assert stream.tell() == 0
+
+
+# A re-upload only matches an earlier upload mapped the same way.
+def test_find_duplicate_upload_matches_mapping():
+    other_mapping = make_file_upload()
+    other_mapping.column_to_schema_mapping = {"id": "school_id_govt"}
+    same_mapping = make_file_upload()
+    same_mapping.column_to_schema_mapping = {"school": "school_id_govt"}
+    db = FakeSession([other_mapping, same_mapping])
+
+    duplicate = asyncio.run(
+        find_duplicate_upload(
+            db,
+            country="BRA",
+            dataset="geolocation",
+            content_hash="0" * 64,
+            column_to_schema_mapping={"school": "school_id_govt"},
+            dq_mode="master",
+        )
+    )
+    sql = str(db.statements[0].compile(dialect=postgresql.dialect()))
+
+    assert duplicate is same_mapping
+    assert "file_uploads.content_hash = " in sql
+    assert "dq_runs.dq_mode = " in sql